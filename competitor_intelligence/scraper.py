@@ -8,6 +8,7 @@ import json
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse, urljoin
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -274,28 +275,14 @@ class CompetitorIntelligence:
             results = list(google_search(query, num_results=5))
             
             descriptions = []
-            for url in results[:3]:  # Check first 3 results
-                if REQUESTS_AVAILABLE and self.session:
-                    try:
-                        response = self.session.get(url, timeout=5)
-                        if response.status_code == 200:
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            
-                            # Extract meta description or first paragraph
-                            meta_desc = soup.find('meta', attrs={'name': 'description'})
-                            if meta_desc:
-                                desc = meta_desc.get('content', '')
-                                if desc and len(desc) > 50:
-                                    descriptions.append(desc)
-                            
-                            # Try to get title
-                            title = soup.find('title')
-                            if title:
-                                title_text = title.get_text(strip=True)
-                                if business_name.lower() in title_text.lower():
-                                    descriptions.append(title_text)
-                    except:
-                        continue  # Skip if can't scrape this URL
+            if REQUESTS_AVAILABLE and self.session:
+                # Fetch the first 3 results concurrently, keeping result order
+                urls = results[:3]
+                with ThreadPoolExecutor(max_workers=max(1, len(urls))) as executor:
+                    for page_descriptions in executor.map(
+                        lambda url: self._describe_search_result(url, business_name), urls
+                    ):
+                        descriptions.extend(page_descriptions)
             
             if descriptions:
                 return {
@@ -307,6 +294,31 @@ class CompetitorIntelligence:
         
         return None
     
+    def _describe_search_result(self, url: str, business_name: str) -> List[str]:
+        """Fetch a search result page and return its useful description texts."""
+        descriptions = []
+        try:
+            response = self.session.get(url, timeout=5)
+            if response.status_code == 200:
+                soup = BeautifulSoup(response.text, 'html.parser')
+                
+                # Extract meta description or first paragraph
+                meta_desc = soup.find('meta', attrs={'name': 'description'})
+                if meta_desc:
+                    desc = meta_desc.get('content', '')
+                    if desc and len(desc) > 50:
+                        descriptions.append(desc)
+                
+                # Try to get title
+                title = soup.find('title')
+                if title:
+                    title_text = title.get_text(strip=True)
+                    if business_name.lower() in title_text.lower():
+                        descriptions.append(title_text)
+        except Exception:
+            pass  # Keep whatever was found before the page failed
+        return descriptions
+    
     def enhance_competitor_data(self, competitor_name: str, existing_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Enhance existing competitor data with scraped intelligence.
@@ -0,0 +1,3 @@
+"""
+Pytest configuration; its presence puts the repository root on sys.path for the tests.
+"""
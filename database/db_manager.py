@@ -262,6 +262,61 @@ class SendDB:
             logger.error(f"Error updating send status: {e}")
 
 
+    @staticmethod
+    def create_sends_with_events(sends: List[Dict[str, Any]]) -> List[int]:
+        """
+        Record completed sends and their events in one transaction.
+        
+        Each send is stored as 'delivered' or 'failed' with a 'send' event,
+        plus a 'delivery' event when it succeeded, using one multi-row
+        INSERT per table instead of several statements per recipient.
+        
+        Args:
+            sends: Send dicts with campaign_id, ad_variant_id, recipient_id,
+                channel and success
+        
+        Returns:
+            IDs of the created send records, in input order
+        """
+        if not sends:
+            return []
+        
+        try:
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    rows = execute_values(cur, """
+                        INSERT INTO sends (campaign_id, ad_variant_id, recipient_id, channel, status, sent_at, delivered_at)
+                        VALUES %s
+                        RETURNING id
+                    """, [
+                        (
+                            send['campaign_id'],
+                            send['ad_variant_id'],
+                            send['recipient_id'],
+                            send['channel'],
+                            'delivered' if send['success'] else 'failed',
+                            send['success']
+                        )
+                        for send in sends
+                    ], template="(%s, %s, %s, %s, %s, CURRENT_TIMESTAMP, CASE WHEN %s THEN CURRENT_TIMESTAMP END)",
+                        page_size=500, fetch=True)
+                    send_ids = [row[0] for row in rows]
+                    
+                    events = []
+                    for send_id, send in zip(send_ids, sends):
+                        events.append((send_id, 'send', json.dumps({'channel': send['channel']})))
+                        if send['success']:
+                            events.append((send_id, 'delivery', '{}'))
+                    execute_values(cur, """
+                        INSERT INTO events (send_id, event_type, event_data)
+                        VALUES %s
+                    """, events, template="(%s, %s, %s::jsonb)", page_size=500)
+            return send_ids
+        except Exception as e:
+            logger.error(f"Error creating sends: {e}")
+            return []
+
+
 class EventDB:
     """Database operations for events."""
     
@@ -2,10 +2,17 @@
 Main Input Layer orchestrator class.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Mapping, Optional, Union
+from types import MappingProxyType
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..models.base import BaseHandler, _make_failed
 from ..models.input_types import InputData, ProcessedData, InputType, ProcessingStatus
 from ..handlers.competitor_handler import CompetitorHandler
 from ..handlers.hashtag_handler import HashtagHandler
@@ -13,6 +20,17 @@ from ..handlers.zipcode_handler import ZipCodeHandler
 from ..exceptions import InputLayerError, ValidationError, ProcessingError
 
 
+# Ordinal of each input type, used to index InputLayer's handler table
+_TYPE_INDEX = {input_type: index for index, input_type in enumerate(InputType)}
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 class InputLayer:
     """
     Main orchestrator class for the Input Layer module.
@@ -37,7 +55,7 @@ class InputLayer:
         self.global_config = self.config.get("global_settings", {})
         
         # Initialize handlers
-        self.handlers = {
+        self._handlers = {
             InputType.COMPETITOR_NAME: CompetitorHandler(
                 self.config.get("competitor_handler", {})
             ),
@@ -49,6 +67,12 @@ class InputLayer:
             )
         }
         
+        self._handlers_view = MappingProxyType(self._handlers)
+        
+        # Handler table indexed by input type ordinal (see _TYPE_INDEX),
+        # kept in step with _handlers by set_handler()
+        self._handlers_arr = [self._handlers.get(input_type) for input_type in InputType]
+        
         # Processing statistics
         self.stats = {
             "total_processed": 0,
@@ -62,6 +86,34 @@ class InputLayer:
             }
         }
     
+    @property
+    def handlers(self) -> Mapping[InputType, BaseHandler]:
+        """Read-only mapping of input type to handler; use set_handler() to change it."""
+        return self._handlers_view
+    
+    def _get_handler(self, input_type: InputType) -> BaseHandler:
+        """
+        Look up the handler for an input type.
+        
+        Args:
+            input_type: Input type to get the handler for
+            
+        Returns:
+            Handler instance
+            
+        Raises:
+            InputLayerError: If input type is not supported
+        """
+        try:
+            handler = self._handlers_arr[_TYPE_INDEX[input_type]]
+        except (KeyError, IndexError):
+            handler = None
+        
+        if handler is None:
+            raise InputLayerError(f"No handler available for input type: {input_type}")
+        
+        return handler
+    
     def process_single(self, data: Union[str, InputData], input_type: Union[str, InputType]) -> ProcessedData:
         """
         Process a single input data item.
@@ -86,9 +138,7 @@ class InputLayer:
             input_data = data
         
         # Get appropriate handler
-        handler = self.handlers.get(input_data.input_type)
-        if not handler:
-            raise InputLayerError(f"No handler available for input type: {input_data.input_type}")
+        handler = self._get_handler(input_data.input_type)
         
         try:
             # Process the data
@@ -139,15 +189,11 @@ class InputLayer:
                 
             except Exception as e:
                 # Create error result for failed items
-                error_result = ProcessedData(
-                    original_data=str(data),
-                    processed_data="",
-                    input_type=input_type if isinstance(input_type, InputType) else InputType(input_type) if input_type else InputType.COMPETITOR_NAME,
-                    status=ProcessingStatus.FAILED,
-                    validation_result=None,
-                    metadata={"error": str(e), "processing_timestamp": datetime.now().isoformat()}
-                )
-                results.append(error_result)
+                results.append(_make_failed(
+                    str(data),
+                    input_type if isinstance(input_type, InputType) else InputType(input_type) if input_type else InputType.COMPETITOR_NAME,
+                    str(e)
+                ))
         
         return results
     
@@ -155,29 +201,35 @@ class InputLayer:
         """
         Process a mixed batch of different input types.
         
+        Items are grouped by type so each handler processes its share in a
+        single batch_process() call.
+        
         Args:
             data_list: List of InputData objects with different types
             
         Returns:
-            List of ProcessedData objects
+            List of ProcessedData objects, in input order
         """
-        results = []
+        results: List[Optional[ProcessedData]] = [None] * len(data_list)
         
-        for data in data_list:
+        # Positions of the items of each type, in input order
+        positions_by_type: Dict[InputType, List[int]] = {}
+        for position, data in enumerate(data_list):
+            positions_by_type.setdefault(data.input_type, []).append(position)
+        
+        for input_type, positions in positions_by_type.items():
             try:
-                result = self.process_single(data, data.input_type)
-                results.append(result)
+                handler = self._get_handler(input_type)
+                type_results = handler.batch_process([data_list[position] for position in positions])
             except Exception as e:
-                # Create error result for failed items
-                error_result = ProcessedData(
-                    original_data=data.data,
-                    processed_data="",
-                    input_type=data.input_type,
-                    status=ProcessingStatus.FAILED,
-                    validation_result=None,
-                    metadata={"error": str(e), "processing_timestamp": datetime.now().isoformat()}
-                )
-                results.append(error_result)
+                # Create error results for the whole group
+                for position in positions:
+                    results[position] = _make_failed(data_list[position].data, input_type, str(e))
+                continue
+            
+            for position, result in zip(positions, type_results):
+                self._update_stats(result)
+                results[position] = result
         
         return results
     
@@ -206,9 +258,7 @@ class InputLayer:
             input_data = data
         
         # Get appropriate handler
-        handler = self.handlers.get(input_data.input_type)
-        if not handler:
-            raise InputLayerError(f"No handler available for input type: {input_data.input_type}")
+        handler = self._get_handler(input_data.input_type)
         
         # Perform validation
         validation_result = handler.validate(input_data)
@@ -229,7 +279,7 @@ class InputLayer:
         Returns:
             List of supported input type strings
         """
-        return [input_type.value for input_type in self.handlers.keys()]
+        return [input_type.value for input_type in self._handlers]
     
     def get_handler_config(self, input_type: Union[str, InputType]) -> Dict[str, Any]:
         """
@@ -247,9 +297,7 @@ class InputLayer:
         if isinstance(input_type, str):
             input_type = InputType(input_type)
         
-        handler = self.handlers.get(input_type)
-        if not handler:
-            raise InputLayerError(f"No handler available for input type: {input_type}")
+        handler = self._get_handler(input_type)
         
         return handler.config
     
@@ -267,20 +315,24 @@ class InputLayer:
         if isinstance(input_type, str):
             input_type = InputType(input_type)
         
-        handler = self.handlers.get(input_type)
-        if not handler:
-            raise InputLayerError(f"No handler available for input type: {input_type}")
+        handler = self._get_handler(input_type)
         
-        # Update handler config
-        handler.config.update(config)
+        # Update handler in place, rebuilding only what the new config affects
+        handler.reconfigure(config)
+    
+    def set_handler(self, input_type: Union[str, InputType], handler: BaseHandler) -> None:
+        """
+        Register the handler for an input type, replacing any existing one.
         
-        # Reinitialize handler with new config
-        if input_type == InputType.COMPETITOR_NAME:
-            self.handlers[input_type] = CompetitorHandler(handler.config)
-        elif input_type == InputType.HASHTAG:
-            self.handlers[input_type] = HashtagHandler(handler.config)
-        elif input_type == InputType.ZIP_CODE:
-            self.handlers[input_type] = ZipCodeHandler(handler.config)
+        Args:
+            input_type: Input type the handler processes
+            handler: Handler instance
+        """
+        if isinstance(input_type, str):
+            input_type = InputType(input_type)
+        
+        self._handlers[input_type] = handler
+        self._handlers_arr[_TYPE_INDEX[input_type]] = handler
     
     def prompt_user_and_process(self) -> Dict[str, List[ProcessedData]]:
         """
@@ -318,60 +370,24 @@ class InputLayer:
         tags = split_items(raw_tags)
         zips = split_items(raw_zips)
 
-        results_names: List[ProcessedData] = []
-        results_tags: List[ProcessedData] = []
-        results_zips: List[ProcessedData] = []
-
-        # Process competitor names
-        for name in names:
-            try:
-                res = self.process_single(name, InputType.COMPETITOR_NAME)
-                results_names.append(res)
-            except Exception as e:
-                results_names.append(ProcessedData(
-                    original_data=name,
-                    processed_data="",
-                    input_type=InputType.COMPETITOR_NAME,
-                    status=ProcessingStatus.FAILED,
-                    validation_result=None,
-                    metadata={"error": str(e), "processing_timestamp": datetime.now().isoformat()}
-                ))
-
-        # Process hashtags
-        for tag in tags:
-            try:
-                res = self.process_single(tag, InputType.HASHTAG)
-                results_tags.append(res)
-            except Exception as e:
-                results_tags.append(ProcessedData(
-                    original_data=tag,
-                    processed_data="",
-                    input_type=InputType.HASHTAG,
-                    status=ProcessingStatus.FAILED,
-                    validation_result=None,
-                    metadata={"error": str(e), "processing_timestamp": datetime.now().isoformat()}
-                ))
+        # Process everything in one mixed batch; results keep input order
+        all_items = (
+            [InputData(data=name, input_type=InputType.COMPETITOR_NAME) for name in names]
+            + [InputData(data=tag, input_type=InputType.HASHTAG) for tag in tags]
+            + [InputData(data=z, input_type=InputType.ZIP_CODE) for z in zips]
+        )
+        all_results = self.process_mixed_batch(all_items)
 
-        # Process ZIP codes
-        for z in zips:
-            try:
-                res = self.process_single(z, InputType.ZIP_CODE)
-                results_zips.append(res)
-            except Exception as e:
-                results_zips.append(ProcessedData(
-                    original_data=z,
-                    processed_data="",
-                    input_type=InputType.ZIP_CODE,
-                    status=ProcessingStatus.FAILED,
-                    validation_result=None,
-                    metadata={"error": str(e), "processing_timestamp": datetime.now().isoformat()}
-                ))
+        n_names, n_tags = len(names), len(tags)
+        results_names: List[ProcessedData] = all_results[:n_names]
+        results_tags: List[ProcessedData] = all_results[n_names:n_names + n_tags]
+        results_zips: List[ProcessedData] = all_results[n_names + n_tags:]
 
         # Pretty print results
         def summarize(items: List[ProcessedData]) -> List[str]:
             out: List[str] = []
             for r in items:
-                if r.status == ProcessingStatus.COMPLETED and r.validation_result is not None:
+                if r.status == ProcessingStatus.COMPLETED:
                     out.append(r.processed_data)
                 else:
                     err = r.metadata.get("error") if r.metadata else "unknown error"
@@ -434,7 +450,7 @@ class InputLayer:
             InputLayerError: If format is not supported
         """
         if format == "json":
-            return json.dumps([result.to_dict() for result in results], indent=2)
+            return _dumps([result.to_dict() for result in results])
         elif format == "csv":
             # Simple CSV export
             import csv
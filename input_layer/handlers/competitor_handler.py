@@ -4,7 +4,7 @@ Competitor name handler for cleaning and validation.
 
 import re
 import string
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from ..models.base import BaseHandler
@@ -12,9 +12,26 @@ from ..models.input_types import InputData, ProcessedData, ValidationResult, Pro
 from ..exceptions import ValidationError, ProcessingError
 
 
+# ASCII characters that str.strip() and re's \s treat as whitespace. bytes.strip()
+# and bytes.split() miss the file/group/record/unit separators (\x1c-\x1f).
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+_ASCII_SEPARATORS_TO_SPACE = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+
+
+def _collapse_whitespace(match: re.Match) -> str:
+    """Replacement for the cleanup pattern: whitespace runs become one space, invalid chars go."""
+    return " " if match.group(1) else ""
+
+
 class CompetitorHandler(BaseHandler):
     """Handler for competitor name processing."""
     
+    __slots__ = (
+        "min_length", "max_length", "allow_numbers", "allowed_special_chars",
+        "normalize_case", "remove_extra_spaces", "valid_char_pattern", "_valid_chars",
+        "_byte_delete", "_cleanup_pattern", "_invalid_char_pattern"
+    )
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize competitor handler with configuration.
@@ -29,15 +46,40 @@ class CompetitorHandler(BaseHandler):
                 - remove_extra_spaces: Remove extra whitespace (default: True)
         """
         super().__init__(config)
+        self._load_options()
+        
+        # Build character validation regex and cleaning tables
+        self._build_validation_pattern()
+        self._build_translate_table()
+    
+    def _load_options(self) -> None:
+        """Read handler options from the current configuration."""
         self.min_length = self.config.get("min_length", 2)
         self.max_length = self.config.get("max_length", 100)
         self.allow_numbers = self.config.get("allow_numbers", False)
         self.allowed_special_chars = self.config.get("allowed_special_chars", " &.-'")
         self.normalize_case = self.config.get("normalize_case", True)
         self.remove_extra_spaces = self.config.get("remove_extra_spaces", True)
+    
+    def reconfigure(self, new_config: Dict[str, Any]) -> None:
+        """
+        Apply configuration changes in place.
         
-        # Build character validation regex
-        self._build_validation_pattern()
+        The character validation pattern is only rebuilt when
+        allow_numbers or allowed_special_chars actually changed.
+        
+        Args:
+            new_config: Configuration options to merge into the current config
+        """
+        old_pattern_options = (self.allow_numbers, self.allowed_special_chars)
+        
+        self.config.update(new_config)
+        self.warnings_enabled = self.config.get("warnings_enabled", True)
+        self._load_options()
+        
+        if (self.allow_numbers, self.allowed_special_chars) != old_pattern_options:
+            self._build_validation_pattern()
+            self._build_translate_table()
     
     def _build_validation_pattern(self) -> None:
         """Build regex pattern for character validation."""
@@ -55,6 +97,17 @@ class CompetitorHandler(BaseHandler):
         pattern = "".join(pattern_parts)
         self.valid_char_pattern = re.compile(f"^[{pattern}\\s]+$")
     
+    def _build_translate_table(self) -> None:
+        """Build the character whitelist and byte deletion table used by clean()."""
+        self._valid_chars = set(string.ascii_letters + string.digits + self.allowed_special_chars + " ")
+        self._byte_delete = bytes(i for i in range(128) if chr(i) not in self._valid_chars)
+        
+        # Single-pass patterns for the general (non-ASCII) path: the first
+        # collapses whitespace runs and drops invalid characters together
+        valid = re.escape("".join(sorted(self._valid_chars)))
+        self._cleanup_pattern = re.compile(f"(\\s+)|[^{valid}]")
+        self._invalid_char_pattern = re.compile(f"[^{valid}]+")
+    
     def validate(self, data: InputData) -> ValidationResult:
         """
         Validate competitor name.
@@ -65,7 +118,7 @@ class CompetitorHandler(BaseHandler):
         Returns:
             ValidationResult with validation status and messages
         """
-        result = ValidationResult(is_valid=True)
+        result = ValidationResult(warnings_enabled=self.warnings_enabled)
         name = data.data.strip()
         
         # Length validation
@@ -105,16 +158,17 @@ class CompetitorHandler(BaseHandler):
         Returns:
             Cleaned competitor name
         """
-        # Remove leading/trailing whitespace
-        cleaned = data.strip()
-        
-        # Remove extra whitespace if configured
-        if self.remove_extra_spaces:
-            cleaned = re.sub(r'\s+', ' ', cleaned)
-        
-        # Remove invalid characters (keep only valid ones)
-        valid_chars = set(string.ascii_letters + string.digits + self.allowed_special_chars + " ")
-        cleaned = ''.join(c for c in cleaned if c in valid_chars)
+        try:
+            cleaned = self._clean_ascii(data.encode("ascii"))
+        except UnicodeEncodeError:
+            # Remove leading/trailing whitespace
+            cleaned = data.strip()
+            
+            # Remove invalid characters, collapsing extra whitespace if configured
+            if self.remove_extra_spaces:
+                cleaned = self._cleanup_pattern.sub(_collapse_whitespace, cleaned)
+            else:
+                cleaned = self._invalid_char_pattern.sub('', cleaned)
         
         # Normalize case if configured
         if self.normalize_case:
@@ -122,6 +176,26 @@ class CompetitorHandler(BaseHandler):
         
         return cleaned.strip()
     
+    def _clean_ascii(self, data: bytes) -> str:
+        """
+        Strip, collapse whitespace and drop invalid characters from ASCII input.
+        
+        Byte-level equivalent of the general path in clean(), which avoids
+        per-character Python work for the common pure-ASCII case.
+        
+        Args:
+            data: ASCII-encoded competitor name
+            
+        Returns:
+            Cleaned competitor name (before case normalization)
+        """
+        cleaned = data.strip(_ASCII_WHITESPACE)
+        
+        if self.remove_extra_spaces:
+            cleaned = b" ".join(cleaned.translate(_ASCII_SEPARATORS_TO_SPACE).split())
+        
+        return cleaned.translate(None, self._byte_delete).decode("ascii")
+    
     def _normalize_case(self, name: str) -> str:
         """
         Normalize case of competitor name.
@@ -161,6 +235,21 @@ class CompetitorHandler(BaseHandler):
         Args:
             data: InputData containing competitor name
             
+        Returns:
+            ProcessedData with results
+        """
+        return self._process_with_ts(data, datetime.now().isoformat())
+    
+    def _process_with_ts(self, data: InputData, processing_timestamp: str,
+                         cleaned_data: Optional[str] = None) -> ProcessedData:
+        """
+        Process competitor name, stamping the result with the given timestamp.
+        
+        Args:
+            data: InputData containing competitor name
+            processing_timestamp: ISO timestamp to record on the result
+            cleaned_data: Result of clean(data.data), if already computed
+            
         Returns:
             ProcessedData with results
         """
@@ -168,7 +257,8 @@ class CompetitorHandler(BaseHandler):
             raise ProcessingError(f"Invalid input type {data.input_type} for CompetitorHandler")
         
         # Clean the data first
-        cleaned_data = self.clean(data.data)
+        if cleaned_data is None:
+            cleaned_data = self.clean(data.data)
         
         # Create new InputData with cleaned data for validation
         cleaned_input = InputData(
@@ -199,5 +289,5 @@ class CompetitorHandler(BaseHandler):
                 "handler": "CompetitorHandler",
                 "config": self.config
             },
-            processing_timestamp=datetime.now().isoformat()
+            processing_timestamp=processing_timestamp
         )
@@ -4,7 +4,8 @@ Hashtag handler for cleaning and validation.
 
 import re
 import string
-from typing import Dict, Any, List, Set
+from functools import lru_cache
+from typing import Dict, Any, List, Set, Optional
 from datetime import datetime
 
 from ..models.base import BaseHandler
@@ -12,9 +13,53 @@ from ..models.input_types import InputData, ProcessedData, ValidationResult, Pro
 from ..exceptions import ValidationError, ProcessingError
 
 
+# Pattern to extract hashtags from text (independent of handler config).
+# The possessive quantifier (Python 3.11+) never gives characters back, so
+# the engine keeps no backtracking state while scanning long texts.
+_EXTRACT_PATTERN = re.compile(r"#[\w]++")
+
+# Separator between texts in a batch scan; it can never be part of a hashtag
+_BATCH_SEPARATOR = "\x00"
+_BATCH_EXTRACT_PATTERN = re.compile(r"#[\w]++|\x00")
+
+# Hashtags too generic to be useful; lowercasing never shortens a string, so
+# anything longer than the longest entry can skip the lookup entirely
+_GENERIC_HASHTAG_SET = frozenset(("hashtag", "tag", "tags"))
+_GENERIC_HASHTAG_MAX_LEN = max(map(len, _GENERIC_HASHTAG_SET))
+
+
+@lru_cache(maxsize=32)
+def _compile_hashtag_pattern(allow_numbers: bool, allow_underscores: bool) -> re.Pattern:
+    """
+    Compile the single-hashtag validation pattern for a configuration.
+    
+    Args:
+        allow_numbers: Whether digits are allowed
+        allow_underscores: Whether underscores are allowed
+        
+    Returns:
+        Compiled pattern matching a full hashtag including the leading #
+    """
+    # Base pattern for hashtag characters
+    char_pattern_parts = [r"a-zA-Z"]
+    if allow_numbers:
+        char_pattern_parts.append(r"0-9")
+    if allow_underscores:
+        char_pattern_parts.append(r"_")
+    
+    char_pattern = "".join(char_pattern_parts)
+    return re.compile(f"^#[{char_pattern}]+$")
+
+
 class HashtagHandler(BaseHandler):
     """Handler for hashtag processing."""
     
+    __slots__ = (
+        "min_length", "max_length", "allow_numbers", "allow_underscores",
+        "normalize_case", "remove_duplicates", "max_hashtags", "forbidden_words",
+        "hashtag_pattern", "extract_pattern", "_byte_delete"
+    )
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize hashtag handler with configuration.
@@ -38,27 +83,27 @@ class HashtagHandler(BaseHandler):
         self.normalize_case = self.config.get("normalize_case", True)
         self.remove_duplicates = self.config.get("remove_duplicates", True)
         self.max_hashtags = self.config.get("max_hashtags", 30)
-        self.forbidden_words = set(self.config.get("forbidden_words", []))
+        # Stored lowercased so screening is one case-insensitive set lookup per hashtag
+        self.forbidden_words = frozenset(word.lower() for word in self.config.get("forbidden_words", []))
         
-        # Build validation patterns
+        # Build validation patterns and cleaning table
         self._build_validation_patterns()
+        self._build_translate_table()
     
     def _build_validation_patterns(self) -> None:
-        """Build regex patterns for hashtag validation."""
-        # Base pattern for hashtag characters
-        char_pattern_parts = [r"a-zA-Z"]
-        if self.allow_numbers:
-            char_pattern_parts.append(r"0-9")
-        if self.allow_underscores:
-            char_pattern_parts.append(r"_")
-        
-        char_pattern = "".join(char_pattern_parts)
-        
-        # Pattern for individual hashtag
-        self.hashtag_pattern = re.compile(f"^#[{char_pattern}]+$")
+        """Bind the regex patterns for hashtag validation."""
+        # Pattern for individual hashtag (shared between handlers with the same config)
+        self.hashtag_pattern = _compile_hashtag_pattern(self.allow_numbers, self.allow_underscores)
         
         # Pattern to extract hashtags from text
-        self.extract_pattern = re.compile(r"#[\w]+")
+        self.extract_pattern = _EXTRACT_PATTERN
+    
+    def _build_translate_table(self) -> None:
+        """Build the byte deletion table used to clean ASCII hashtag content."""
+        self._byte_delete = bytes(
+            i for i in range(128)
+            if not (chr(i).isalnum() or (self.allow_underscores and chr(i) == "_"))
+        )
     
     def validate(self, data: InputData) -> ValidationResult:
         """
@@ -70,11 +115,20 @@ class HashtagHandler(BaseHandler):
         Returns:
             ValidationResult with validation status and messages
         """
-        result = ValidationResult(is_valid=True)
-        text = data.data.strip()
-        
         # Extract hashtags from text
-        hashtags = self._extract_hashtags(text)
+        return self._validate_hashtag_list(self._extract_hashtags(data.data.strip()))
+    
+    def _validate_hashtag_list(self, hashtags: List[str]) -> ValidationResult:
+        """
+        Validate a list of already-extracted hashtags.
+        
+        Args:
+            hashtags: Hashtags extracted from the input text
+            
+        Returns:
+            ValidationResult with validation status and messages
+        """
+        result = ValidationResult(warnings_enabled=self.warnings_enabled)
         
         if not hashtags:
             result.add_error("No valid hashtags found in input.")
@@ -117,21 +171,26 @@ class HashtagHandler(BaseHandler):
         if len(content) > self.max_length:
             result.add_error(f"Hashtag too long: {hashtag}")
         
-        # Check for forbidden words
-        content_lower = content.lower()
-        if content_lower in self.forbidden_words:
-            result.add_error(f"Forbidden word in hashtag: {hashtag}")
+        # Check for forbidden words (skip the lowercase copy when there are none)
+        content_lower = None
+        if self.forbidden_words:
+            content_lower = content.lower()
+            if content_lower in self.forbidden_words:
+                result.add_error(f"Forbidden word in hashtag: {hashtag}")
         
         # Check for common issues
         if content.isdigit():
-            result.add_warning(f"Hashtag contains only numbers: {hashtag}")
+            result.add_warning("Hashtag contains only numbers: %s", hashtag)
         
         if content.isupper() and len(content) > 3:
-            result.add_suggestion(f"Consider using mixed case for readability: {hashtag}")
+            result.add_suggestion("Consider using mixed case for readability: %s", hashtag)
         
         # Check for common misspellings or issues
-        if content_lower in ["hashtag", "tag", "tags"]:
-            result.add_warning(f"Generic hashtag detected: {hashtag}")
+        if len(content) <= _GENERIC_HASHTAG_MAX_LEN:
+            if content_lower is None:
+                content_lower = content.lower()
+            if content_lower in _GENERIC_HASHTAG_SET:
+                result.add_warning("Generic hashtag detected: %s", hashtag)
     
     def clean(self, data: str) -> str:
         """
@@ -143,9 +202,30 @@ class HashtagHandler(BaseHandler):
         Returns:
             Cleaned hashtag string
         """
-        # Extract hashtags from text
-        hashtags = self._extract_hashtags(data)
+        return self._clean_hashtags(self._extract_hashtags(data))
+    
+    def batch_clean(self, data_list: List[str]) -> List[str]:
+        """
+        Clean and normalize hashtag(s) for many inputs.
+        
+        Args:
+            data_list: Raw hashtag data strings
+            
+        Returns:
+            Cleaned hashtag strings, in input order
+        """
+        return [self._clean_hashtags(hashtags) for hashtags in self._batch_extract_hashtags(data_list)]
+    
+    def _clean_hashtags(self, hashtags: List[str]) -> str:
+        """
+        Clean, deduplicate and limit a list of extracted hashtags.
         
+        Args:
+            hashtags: Hashtags extracted from the input text
+            
+        Returns:
+            Cleaned hashtag string
+        """
         if not hashtags:
             return ""
         
@@ -158,14 +238,11 @@ class HashtagHandler(BaseHandler):
         
         # Remove duplicates if configured
         if self.remove_duplicates:
-            # Preserve order while removing duplicates
-            seen = set()
-            unique_hashtags = []
+            # Preserve order (and the first spelling seen) while removing duplicates
+            unique_hashtags = {}
             for hashtag in cleaned_hashtags:
-                if hashtag.lower() not in seen:
-                    seen.add(hashtag.lower())
-                    unique_hashtags.append(hashtag)
-            cleaned_hashtags = unique_hashtags
+                unique_hashtags.setdefault(hashtag.lower(), hashtag)
+            cleaned_hashtags = list(unique_hashtags.values())
         
         # Limit number of hashtags
         cleaned_hashtags = cleaned_hashtags[:self.max_hashtags]
@@ -187,18 +264,24 @@ class HashtagHandler(BaseHandler):
         
         # Remove invalid characters
         content = hashtag[1:]
-        cleaned_content = ""
-        
-        for char in content:
-            if char.isalnum() or (self.allow_underscores and char == "_"):
-                cleaned_content += char
+        if content.isascii():
+            cleaned_content = content.encode("ascii").translate(None, self._byte_delete).decode("ascii")
+        else:
+            cleaned_content = "".join(
+                char for char in content
+                if char.isalnum() or (self.allow_underscores and char == "_")
+            )
         
         # Normalize case
         if self.normalize_case and cleaned_content:
-            # Use title case for readability
-            cleaned_content = cleaned_content.title()
+            # Use title case for readability; ASCII text that is already
+            # title-cased would come back unchanged, so skip the copy
+            if not (cleaned_content.isascii() and cleaned_content.istitle()):
+                cleaned_content = cleaned_content.title()
         
-        return "#" + cleaned_content if cleaned_content else ""
+        if not cleaned_content:
+            return ""
+        return hashtag if cleaned_content == content else "#" + cleaned_content
     
     def _extract_hashtags(self, text: str) -> List[str]:
         """
@@ -213,6 +296,32 @@ class HashtagHandler(BaseHandler):
         hashtags = self.extract_pattern.findall(text)
         return hashtags
     
+    def _batch_extract_hashtags(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract hashtags from many texts with a single regex scan.
+        
+        The texts are joined with NUL separators, which the scan reports as
+        boundaries between texts.
+        
+        Args:
+            texts: Texts containing hashtags
+            
+        Returns:
+            List of hashtags found in each text, in input order
+        """
+        joined = _BATCH_SEPARATOR.join(texts)
+        if joined.count(_BATCH_SEPARATOR) != len(texts) - 1:
+            # Empty batch, or a text contains the separator itself
+            return [self._extract_hashtags(text) for text in texts]
+        
+        groups: List[List[str]] = [[]]
+        for match in _BATCH_EXTRACT_PATTERN.findall(joined):
+            if match == _BATCH_SEPARATOR:
+                groups.append([])
+            else:
+                groups[-1].append(match)
+        return groups
+    
     def process(self, data: InputData) -> ProcessedData:
         """
         Process hashtag(s) through validation and cleaning.
@@ -220,6 +329,21 @@ class HashtagHandler(BaseHandler):
         Args:
             data: InputData containing hashtag(s)
             
+        Returns:
+            ProcessedData with results
+        """
+        return self._process_with_ts(data, datetime.now().isoformat())
+    
+    def _process_with_ts(self, data: InputData, processing_timestamp: str,
+                         cleaned_data: Optional[str] = None) -> ProcessedData:
+        """
+        Process hashtag(s), stamping the result with the given timestamp.
+        
+        Args:
+            data: InputData containing hashtag(s)
+            processing_timestamp: ISO timestamp to record on the result
+            cleaned_data: Result of clean(data.data), if already computed
+            
         Returns:
             ProcessedData with results
         """
@@ -227,17 +351,21 @@ class HashtagHandler(BaseHandler):
             raise ProcessingError(f"Invalid input type {data.input_type} for HashtagHandler")
         
         # Clean the data first
-        cleaned_data = self.clean(data.data)
-        
-        # Create new InputData with cleaned data for validation
-        cleaned_input = InputData(
-            data=cleaned_data,
-            input_type=data.input_type,
-            metadata=data.metadata
-        )
+        if cleaned_data is None:
+            cleaned_data = self.clean(data.data)
+        
+        # Extract the cleaned hashtags once for both validation and metadata.
+        # Cleaned ASCII hashtags are all word characters joined by single
+        # spaces, so splitting gives exactly what the extract pattern would.
+        if not cleaned_data:
+            extracted_hashtags = []
+        elif cleaned_data.isascii():
+            extracted_hashtags = cleaned_data.split(" ")
+        else:
+            extracted_hashtags = self._extract_hashtags(cleaned_data)
         
         # Validate the cleaned data
-        validation_result = self.validate(cleaned_input)
+        validation_result = self._validate_hashtag_list(extracted_hashtags)
         
         # Determine status
         if validation_result.is_valid:
@@ -247,9 +375,6 @@ class HashtagHandler(BaseHandler):
         else:
             status = ProcessingStatus.COMPLETED  # Has warnings but is valid
         
-        # Extract hashtags for metadata
-        extracted_hashtags = self._extract_hashtags(cleaned_data)
-        
         return ProcessedData(
             original_data=data.data,
             processed_data=cleaned_data,
@@ -263,5 +388,5 @@ class HashtagHandler(BaseHandler):
                 "hashtag_count": len(extracted_hashtags),
                 "extracted_hashtags": extracted_hashtags
             },
-            processing_timestamp=datetime.now().isoformat()
+            processing_timestamp=processing_timestamp
         )
@@ -3,7 +3,7 @@ ZIP code handler for cleaning and validation.
 """
 
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from ..models.base import BaseHandler
@@ -11,9 +11,47 @@ from ..models.input_types import InputData, ProcessedData, ValidationResult, Pro
 from ..exceptions import ValidationError, ProcessingError
 
 
+# US ZIP code patterns
+_US_PATTERNS = {
+    "5": re.compile(r"^\d{5}$"),  # 12345
+    "5+4": re.compile(r"^\d{5}-\d{4}$"),  # 12345-6789
+    "9": re.compile(r"^\d{9}$"),  # 123456789
+    "basic": re.compile(r"^\d{5}(-\d{4})?$")  # Either 5 or 5+4
+}
+
+# Canadian postal code pattern (A1A 1A1)
+_CANADIAN_PATTERN = re.compile(r"^[A-Za-z]\d[A-Za-z] \d[A-Za-z]\d$")
+
+# General international pattern (basic validation)
+_INTERNATIONAL_PATTERN = re.compile(r"^[A-Za-z0-9\s-]{3,10}$")
+
+# US and Canadian formats fused into one pattern; the matching group names the format
+_FORMAT_PATTERN = re.compile(
+    r"^(?:(?P<z5>\d{5})|(?P<z54>\d{5}-\d{4})|(?P<z9>\d{9})"
+    r"|(?P<can>[A-Za-z]\d[A-Za-z] \d[A-Za-z]\d))$"
+)
+_FORMAT_GROUPS = {"z5": "5", "z54": "5+4", "z9": "9", "can": "canadian"}
+
+# Cleaning patterns
+_DIGIT_PATTERN = re.compile(r"\d")
+_ASCII_DIGIT_PATTERN = re.compile(r"[0-9]")
+_INVALID_CHARS_PATTERN = re.compile(r"[^A-Za-z0-9\s-]")
+_SPACES_PATTERN = re.compile(r"\s+")
+_DASHES_PATTERN = re.compile(r"-+")
+
+# Formats that can be rebuilt purely from the extracted digits
+_DIGIT_FORMATS = ("5", "5+4", "9")
+
+
 class ZipCodeHandler(BaseHandler):
     """Handler for ZIP code processing."""
     
+    __slots__ = (
+        "supported_formats", "normalize_format", "country", "validate_existence",
+        "allow_international", "strict_validation", "patterns", "canadian_pattern",
+        "international_pattern"
+    )
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize ZIP code handler with configuration.
@@ -39,20 +77,10 @@ class ZipCodeHandler(BaseHandler):
         self._build_validation_patterns()
     
     def _build_validation_patterns(self) -> None:
-        """Build regex patterns for ZIP code validation."""
-        # US ZIP code patterns
-        self.patterns = {
-            "5": re.compile(r"^\d{5}$"),  # 12345
-            "5+4": re.compile(r"^\d{5}-\d{4}$"),  # 12345-6789
-            "9": re.compile(r"^\d{9}$"),  # 123456789
-            "basic": re.compile(r"^\d{5}(-\d{4})?$")  # Either 5 or 5+4
-        }
-        
-        # Canadian postal code pattern (A1A 1A1)
-        self.canadian_pattern = re.compile(r"^[A-Za-z]\d[A-Za-z] \d[A-Za-z]\d$")
-        
-        # General international pattern (basic validation)
-        self.international_pattern = re.compile(r"^[A-Za-z0-9\s-]{3,10}$")
+        """Bind the module-level regex patterns for ZIP code validation."""
+        self.patterns = _US_PATTERNS
+        self.canadian_pattern = _CANADIAN_PATTERN
+        self.international_pattern = _INTERNATIONAL_PATTERN
     
     def validate(self, data: InputData) -> ValidationResult:
         """
@@ -64,39 +92,50 @@ class ZipCodeHandler(BaseHandler):
         Returns:
             ValidationResult with validation status and messages
         """
-        result = ValidationResult(is_valid=True)
-        zip_code = data.data.strip()
+        result, _, _ = self._validate_zip(data.data.strip())
+        return result
+    
+    def _validate_zip(self, zip_code: str) -> Tuple[ValidationResult, str, Optional[str]]:
+        """
+        Validate a stripped ZIP code, also returning what was derived from it.
+        
+        Args:
+            zip_code: ZIP code to validate, without surrounding whitespace
+            
+        Returns:
+            Tuple of (ValidationResult, detected format, 5-digit portion or None)
+        """
+        result = ValidationResult(warnings_enabled=self.warnings_enabled)
         
         if not zip_code:
             result.add_error("ZIP code cannot be empty.")
-            return result
+            return result, "invalid", None
         
-        # Determine format and validate
+        # Determine format, and extract the digits once for all later checks
         format_type = self._detect_format(zip_code)
+        digits = _DIGIT_PATTERN.findall(zip_code)
+        five_digit = ''.join(digits[:5]) if len(digits) >= 5 else None
         
         if format_type == "invalid":
             result.add_error(f"Invalid ZIP code format: {zip_code}")
-            return result
-        
-        # Validate based on detected format
-        if not self._validate_format(zip_code, format_type):
-            result.add_error(f"ZIP code format validation failed: {zip_code}")
+            return result, format_type, five_digit
         
+        # The detected format already proves the ZIP code matches it
         # Additional validations
-        self._validate_checksum(zip_code, result)
-        self._validate_geographic_ranges(zip_code, result)
+        self._validate_checksum(five_digit, result)
+        self._validate_geographic_ranges(five_digit, result)
         
         # Check if format is in supported formats
         if format_type not in self.supported_formats:
-            result.add_warning(f"ZIP code format '{format_type}' not in supported formats: {self.supported_formats}")
+            result.add_warning("ZIP code format '%s' not in supported formats: %s", format_type, self.supported_formats)
         
-        # Suggest normalization
-        if self.normalize_format != format_type:
-            normalized = self._normalize_format(zip_code, self.normalize_format)
+        # Suggest normalization (skipped when suggestions are not collected)
+        if self.warnings_enabled and self.normalize_format != format_type:
+            normalized = self._normalize_format(zip_code, self.normalize_format, digits)
             if normalized != zip_code:
-                result.add_suggestion(f"Consider normalizing to: {normalized}")
+                result.add_suggestion("Consider normalizing to: %s", normalized)
         
-        return result
+        return result, format_type, five_digit
     
     def _detect_format(self, zip_code: str) -> str:
         """
@@ -110,53 +149,36 @@ class ZipCodeHandler(BaseHandler):
         """
         zip_code = zip_code.strip()
         
-        # Check US formats
-        if self.patterns["5"].match(zip_code):
+        # Fast path for plain US formats without touching the regex engine
+        # (isdecimal matches exactly what \d does)
+        n = len(zip_code)
+        if n == 5 and zip_code.isdecimal():
             return "5"
-        elif self.patterns["5+4"].match(zip_code):
+        if n == 10 and zip_code[5] == "-" and zip_code[:5].isdecimal() and zip_code[6:].isdecimal():
             return "5+4"
-        elif self.patterns["9"].match(zip_code):
+        if n == 9 and zip_code.isdecimal():
             return "9"
-        elif self.canadian_pattern.match(zip_code):
-            return "canadian"
+        
+        # Check US and Canadian formats in a single match
+        match = _FORMAT_PATTERN.match(zip_code)
+        if match:
+            return _FORMAT_GROUPS[match.lastgroup]
         elif self.allow_international and self.international_pattern.match(zip_code):
             return "international"
         else:
             return "invalid"
     
-    def _validate_format(self, zip_code: str, format_type: str) -> bool:
-        """
-        Validate ZIP code against specific format.
-        
-        Args:
-            zip_code: ZIP code to validate
-            format_type: Expected format type
-            
-        Returns:
-            True if valid, False otherwise
-        """
-        if format_type in ["5", "5+4", "9"]:
-            return self.patterns[format_type].match(zip_code) is not None
-        elif format_type == "canadian":
-            return self.canadian_pattern.match(zip_code) is not None
-        elif format_type == "international":
-            return self.international_pattern.match(zip_code) is not None
-        
-        return False
-    
-    def _validate_checksum(self, zip_code: str, result: ValidationResult) -> None:
+    def _validate_checksum(self, five_digit: Optional[str], result: ValidationResult) -> None:
         """
         Validate ZIP code checksum (basic validation).
         
         Args:
-            zip_code: ZIP code to validate
+            five_digit: 5-digit portion of the ZIP code, or None if it has fewer digits
             result: ValidationResult to update
         """
         if not self.strict_validation:
             return
         
-        # Extract 5-digit portion for validation
-        five_digit = self._extract_five_digit(zip_code)
         if not five_digit:
             return
         
@@ -170,24 +192,23 @@ class ZipCodeHandler(BaseHandler):
         elif first_digit > 9:
             result.add_error("Invalid ZIP code: first digit must be 0-9.")
     
-    def _validate_geographic_ranges(self, zip_code: str, result: ValidationResult) -> None:
+    def _validate_geographic_ranges(self, five_digit: Optional[str], result: ValidationResult) -> None:
         """
         Validate ZIP code geographic ranges.
         
         Args:
-            zip_code: ZIP code to validate
+            five_digit: 5-digit portion of the ZIP code, or None if it has fewer digits
             result: ValidationResult to update
         """
-        five_digit = self._extract_five_digit(zip_code)
         if not five_digit:
             return
         
         zip_int = int(five_digit)
         
         # Known invalid ranges
-        if zip_int in range(0, 1000):  # 00000-00999
+        if zip_int < 1000:  # 00000-00999
             result.add_error("Invalid ZIP code range: 00000-00999")
-        elif zip_int in range(10000, 10010):  # 10000-10009 (reserved)
+        elif 10000 <= zip_int < 10010:  # 10000-10009 (reserved)
             result.add_warning("ZIP code range 10000-10009 is reserved.")
     
     def _extract_five_digit(self, zip_code: str) -> Optional[str]:
@@ -200,11 +221,8 @@ class ZipCodeHandler(BaseHandler):
         Returns:
             5-digit string or None
         """
-        # Remove spaces and dashes
-        cleaned = re.sub(r'[-\s]', '', zip_code)
-        
-        # Return first 5 digits
-        digits = re.findall(r'\d', cleaned)
+        # Return first 5 digits (spaces and dashes never match, so no pre-cleaning)
+        digits = _DIGIT_PATTERN.findall(zip_code)
         if len(digits) >= 5:
             return ''.join(digits[:5])
         
@@ -220,38 +238,57 @@ class ZipCodeHandler(BaseHandler):
         Returns:
             Cleaned ZIP code string
         """
+        # When normalizing to a digit format, the result depends only on the
+        # digits, so skip character cleaning entirely
+        if self.normalize_format in _DIGIT_FORMATS:
+            digits = _ASCII_DIGIT_PATTERN.findall(data)
+            if len(digits) >= 5:
+                return self._format_digits(digits, self.normalize_format)
+        
         # Remove extra whitespace
         cleaned = data.strip()
         
         # Remove invalid characters (keep only digits, letters, spaces, dashes)
-        cleaned = re.sub(r'[^A-Za-z0-9\s-]', '', cleaned)
+        cleaned = _INVALID_CHARS_PATTERN.sub('', cleaned)
         
         # Normalize spaces and dashes
-        cleaned = re.sub(r'\s+', ' ', cleaned)  # Multiple spaces to single
-        cleaned = re.sub(r'-+', '-', cleaned)   # Multiple dashes to single
-        
-        # Normalize format if specified
-        if self.normalize_format:
-            cleaned = self._normalize_format(cleaned, self.normalize_format)
+        cleaned = _SPACES_PATTERN.sub(' ', cleaned)  # Multiple spaces to single
+        cleaned = _DASHES_PATTERN.sub('-', cleaned)   # Multiple dashes to single
         
         return cleaned
     
-    def _normalize_format(self, zip_code: str, target_format: str) -> str:
+    def _normalize_format(self, zip_code: str, target_format: str,
+                          digits: Optional[List[str]] = None) -> str:
         """
         Normalize ZIP code to target format.
         
         Args:
             zip_code: ZIP code to normalize
             target_format: Target format ("5", "5+4", "9")
+            digits: Digits already extracted from zip_code, if available
             
         Returns:
             Normalized ZIP code
         """
         # Extract digits
-        digits = re.findall(r'\d', zip_code)
-        if len(digits) < 5:
+        if digits is None:
+            digits = _DIGIT_PATTERN.findall(zip_code)
+        if len(digits) < 5 or target_format not in _DIGIT_FORMATS:
             return zip_code  # Can't normalize
         
+        return self._format_digits(digits, target_format)
+    
+    def _format_digits(self, digits: List[str], target_format: str) -> str:
+        """
+        Build a ZIP code in the target format from its digits.
+        
+        Args:
+            digits: ZIP code digits (at least 5)
+            target_format: Target format ("5", "5+4", "9")
+            
+        Returns:
+            Formatted ZIP code
+        """
         five_digit = ''.join(digits[:5])
         
         if target_format == "5":
@@ -261,13 +298,11 @@ class ZipCodeHandler(BaseHandler):
                 return f"{five_digit}-{''.join(digits[5:9])}"
             else:
                 return five_digit
-        elif target_format == "9":
+        else:  # "9"
             if len(digits) >= 9:
                 return ''.join(digits[:9])
             else:
                 return five_digit
-        
-        return zip_code
     
     def process(self, data: InputData) -> ProcessedData:
         """
@@ -276,6 +311,21 @@ class ZipCodeHandler(BaseHandler):
         Args:
             data: InputData containing ZIP code
             
+        Returns:
+            ProcessedData with results
+        """
+        return self._process_with_ts(data, datetime.now().isoformat())
+    
+    def _process_with_ts(self, data: InputData, processing_timestamp: str,
+                         cleaned_data: Optional[str] = None) -> ProcessedData:
+        """
+        Process ZIP code, stamping the result with the given timestamp.
+        
+        Args:
+            data: InputData containing ZIP code
+            processing_timestamp: ISO timestamp to record on the result
+            cleaned_data: Result of clean(data.data), if already computed
+            
         Returns:
             ProcessedData with results
         """
@@ -283,17 +333,11 @@ class ZipCodeHandler(BaseHandler):
             raise ProcessingError(f"Invalid input type {data.input_type} for ZipCodeHandler")
         
         # Clean the data first
-        cleaned_data = self.clean(data.data)
-        
-        # Create new InputData with cleaned data for validation
-        cleaned_input = InputData(
-            data=cleaned_data,
-            input_type=data.input_type,
-            metadata=data.metadata
-        )
+        if cleaned_data is None:
+            cleaned_data = self.clean(data.data)
         
-        # Validate the cleaned data
-        validation_result = self.validate(cleaned_input)
+        # Validate the cleaned data, keeping the detected format and digits
+        validation_result, detected_format, five_digit = self._validate_zip(cleaned_data.strip())
         
         # Determine status
         if validation_result.is_valid:
@@ -303,9 +347,6 @@ class ZipCodeHandler(BaseHandler):
         else:
             status = ProcessingStatus.COMPLETED  # Has warnings but is valid
         
-        # Extract format information
-        detected_format = self._detect_format(cleaned_data)
-        
         return ProcessedData(
             original_data=data.data,
             processed_data=cleaned_data,
@@ -317,7 +358,7 @@ class ZipCodeHandler(BaseHandler):
                 "handler": "ZipCodeHandler",
                 "config": self.config,
                 "detected_format": detected_format,
-                "five_digit_code": self._extract_five_digit(cleaned_data)
+                "five_digit_code": five_digit
             },
-            processing_timestamp=datetime.now().isoformat()
+            processing_timestamp=processing_timestamp
         )
@@ -3,21 +3,74 @@ Base classes for Input Layer handlers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from .input_types import InputData, ProcessedData, ValidationResult
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+from .input_types import InputData, InputType, ProcessedData, ProcessingStatus, ValidationResult
+
+
+# Batches smaller than this are always processed inline: pool start-up and
+# pickling cost more than the work saved
+_PARALLEL_MIN_BATCH = 1024
+
+
+def _make_failed(data: str, input_type: InputType, error: str,
+                 processing_timestamp: Optional[str] = None) -> ProcessedData:
+    """
+    Build the ProcessedData returned for an item that could not be processed.
+    
+    Args:
+        data: Original input data
+        input_type: Type of the input
+        error: Error message
+        processing_timestamp: ISO timestamp to record. If None, the current time.
+        
+    Returns:
+        Failed ProcessedData object
+    """
+    processing_timestamp = processing_timestamp or datetime.now().isoformat()
+    return ProcessedData(
+        original_data=data,
+        processed_data="",
+        input_type=input_type,
+        status=ProcessingStatus.FAILED,
+        validation_result=ValidationResult(errors=[error]),
+        metadata={"error": error, "processing_timestamp": processing_timestamp},
+        processing_timestamp=processing_timestamp
+    )
 
 
 class BaseHandler(ABC):
     """Abstract base class for all input handlers."""
     
+    # Slotted to keep handler instances small and attribute access fast
+    __slots__ = ("config", "warnings_enabled")
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize the handler with optional configuration.
         
         Args:
-            config: Configuration dictionary for the handler
+            config: Configuration dictionary for the handler; the
+                warnings_enabled option (default: True) controls whether
+                validation warnings and suggestions are collected
         """
         self.config = config or {}
+        self.warnings_enabled = self.config.get("warnings_enabled", True)
+    
+    def reconfigure(self, new_config: Dict[str, Any]) -> None:
+        """
+        Apply configuration changes to the handler in place.
+        
+        Handlers can override this to rebuild only the state affected by
+        the changed options; the default simply re-runs initialization.
+        
+        Args:
+            new_config: Configuration options to merge into the current config
+        """
+        self.config.update(new_config)
+        self.__init__(self.config)
     
     @abstractmethod
     def validate(self, data: InputData) -> ValidationResult:
@@ -58,31 +111,112 @@ class BaseHandler(ABC):
         """
         pass
     
-    def batch_process(self, data_list: List[InputData]) -> List[ProcessedData]:
+    def batch_clean(self, data_list: List[str]) -> List[str]:
+        """
+        Clean multiple raw input strings.
+        
+        Handlers can override this with a bulk implementation; the default
+        cleans each item in turn.
+        
+        Args:
+            data_list: Raw input strings
+            
+        Returns:
+            Cleaned strings, in input order
+        """
+        return [self.clean(data) for data in data_list]
+    
+    def _process_with_ts(self, data: InputData, processing_timestamp: str,
+                         cleaned_data: Optional[str] = None) -> ProcessedData:
+        """
+        Process input data, stamping the result with the given timestamp.
+        
+        Used by batch_process so a whole batch shares one timestamp and one
+        batch_clean() call. Handlers should override this; the default falls
+        back to process().
+        
+        Args:
+            data: Input data to process
+            processing_timestamp: ISO timestamp to record on the result
+            cleaned_data: Result of clean(data.data), if already computed
+            
+        Returns:
+            ProcessedData object with results
+        """
+        return self.process(data)
+    
+    def batch_process(self, data_list: List[InputData], parallel: bool = False,
+                      workers: Optional[int] = None, chunksize: int = 256,
+                      use_threads: bool = False) -> List[ProcessedData]:
         """
         Process multiple input data items in batch.
         
+        All results in the batch share a single processing timestamp. With
+        parallel=True, large batches are split into chunks that are cleaned
+        and processed in a process pool (or a thread pool with use_threads).
+        
         Args:
             data_list: List of InputData objects
+            parallel: Whether to spread large batches over a worker pool
+            workers: Maximum number of workers (executor default if None)
+            chunksize: Number of items handed to a worker at a time
+            use_threads: Use threads instead of processes for the pool
             
         Returns:
-            List of ProcessedData objects
+            List of ProcessedData objects, in input order
         """
+        processing_timestamp = datetime.now().isoformat()
+        
+        if not parallel or len(data_list) < _PARALLEL_MIN_BATCH:
+            return self._process_chunk(data_list, processing_timestamp)
+        
+        chunksize = max(1, chunksize)
+        chunks = [data_list[i:i + chunksize] for i in range(0, len(data_list), chunksize)]
+        executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        
         results = []
-        for data in data_list:
-            try:
-                result = self.process(data)
-                results.append(result)
-            except Exception as e:
-                # Create a failed result for error handling
-                failed_result = ProcessedData(
-                    original_data=data.data,
-                    processed_data="",
-                    input_type=data.input_type,
-                    status="failed",
-                    validation_result=ValidationResult(is_valid=False),
-                    metadata={"error": str(e)}
-                )
-                results.append(failed_result)
+        with executor_class(max_workers=workers) as executor:
+            for chunk_results in executor.map(self._process_chunk, chunks, repeat(processing_timestamp)):
+                results.extend(chunk_results)
         
         return results
+    
+    def _process_chunk(self, data_list: List[InputData], processing_timestamp: str) -> List[ProcessedData]:
+        """
+        Clean and process a run of items sequentially.
+        
+        Args:
+            data_list: List of InputData objects
+            processing_timestamp: ISO timestamp to record on every result
+            
+        Returns:
+            List of ProcessedData objects, in input order
+        """
+        # Clean the whole chunk up front; on failure, fall back to per-item cleaning
+        try:
+            cleaned_list = self.batch_clean([data.data for data in data_list])
+        except Exception:
+            cleaned_list = [None] * len(data_list)
+        
+        return [
+            self._safe_process(data, processing_timestamp, cleaned_data)
+            for data, cleaned_data in zip(data_list, cleaned_list)
+        ]
+    
+    def _safe_process(self, data: InputData, processing_timestamp: str,
+                      cleaned_data: Optional[str] = None) -> ProcessedData:
+        """
+        Process one item, turning any exception into a failed result.
+        
+        Args:
+            data: Input data to process
+            processing_timestamp: ISO timestamp to record on the result
+            cleaned_data: Result of clean(data.data), if already computed
+            
+        Returns:
+            ProcessedData object with results
+        """
+        try:
+            return self._process_with_ts(data, processing_timestamp, cleaned_data)
+        except Exception as e:
+            return _make_failed(data.data, data.input_type, str(e), processing_timestamp)
@@ -7,15 +7,20 @@ from typing import List, Dict, Any, Optional, Union
 from enum import Enum
 
 
-class InputType(Enum):
-    """Types of input data supported."""
+class InputType(str, Enum):
+    """
+    Types of input data supported.
+    
+    Members are also str instances, so equality checks and hashing
+    (e.g. handler lookups) use the fast built-in str implementations.
+    """
     COMPETITOR_NAME = "competitor_name"
     HASHTAG = "hashtag"
     ZIP_CODE = "zip_code"
 
 
-class ProcessingStatus(Enum):
-    """Status of processing operations."""
+class ProcessingStatus(str, Enum):
+    """Status of processing operations (str-valued, like InputType)."""
     PENDING = "pending"
     PROCESSING = "processing"
     COMPLETED = "completed"
@@ -23,7 +28,7 @@ class ProcessingStatus(Enum):
     VALIDATION_ERROR = "validation_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class InputData:
     """Raw input data structure."""
     data: str
@@ -35,29 +40,40 @@ class InputData:
             self.input_type = InputType(self.input_type)
 
 
-@dataclass 
+@dataclass(slots=True)
 class ValidationResult:
-    """Result of validation operations."""
-    is_valid: bool
+    """Result of validation operations.
+    
+    Validity is derived from the error list, so a result is valid exactly
+    when no errors have been added. With warnings_enabled=False, warnings
+    and suggestions are discarded without being formatted.
+    """
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     suggestions: List[str] = field(default_factory=list)
+    warnings_enabled: bool = field(default=True, repr=False, compare=False)
+    
+    @property
+    def is_valid(self) -> bool:
+        """Whether validation passed (no errors were recorded)."""
+        return not self.errors
     
     def add_error(self, error: str) -> None:
         """Add a validation error."""
         self.errors.append(error)
-        self.is_valid = False
     
-    def add_warning(self, warning: str) -> None:
-        """Add a validation warning."""
-        self.warnings.append(warning)
+    def add_warning(self, warning: str, *args: Any) -> None:
+        """Add a validation warning, %-formatting it with args if given."""
+        if self.warnings_enabled:
+            self.warnings.append(warning % args if args else warning)
     
-    def add_suggestion(self, suggestion: str) -> None:
-        """Add a validation suggestion."""
-        self.suggestions.append(suggestion)
+    def add_suggestion(self, suggestion: str, *args: Any) -> None:
+        """Add a validation suggestion, %-formatting it with args if given."""
+        if self.warnings_enabled:
+            self.suggestions.append(suggestion % args if args else suggestion)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedData:
     """Processed and validated data structure."""
     original_data: str
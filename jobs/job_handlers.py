@@ -1,25 +1,43 @@
 """
 Background job handlers for AI generation and notification sending.
 """
-import sys
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+import os
+from typing import Dict, Any, Callable, List, Optional, Tuple
 import hashlib
+import html
 import json
 import time
+import zlib
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from string import Template
 
 logger = logging.getLogger(__name__)
 
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+# Optional Redis client for the shared ad cache
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Optional faster JSON for cache serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ai_generation_layer import AIGenerationLayer
-from input_layer import InputLayer, InputType
+from input_layer import InputLayer, InputType, InputData
 from processing_layer import ProcessingLayer
 from notification_layer import NotificationLayer
 from notification_layer.models.notification_types import NotificationType
+from jobs.send_writer import publish_sends, is_stream_enabled as is_send_stream_enabled
+from jobs.queue_manager import enqueue_jobs_bulk
 
 # Database imports (optional)
 try:
@@ -35,17 +53,569 @@ except ImportError as e:
     SendDB = None
     EventDB = None
     is_db_available = lambda: False
-    print(f"Database module not available: {e}")
+    logger.warning(f"Database module not available: {e}")
+
+# Competitor intelligence (optional); one scraper is shared by all jobs so
+# its HTTP session and connection pool are reused
+try:
+    from competitor_intelligence.scraper import CompetitorIntelligence
+    _intel_scraper = CompetitorIntelligence()
+except ImportError:
+    CompetitorIntelligence = None
+    _intel_scraper = None
+
+# Background threads for competitor scraping, which overlaps other job work
+_intel_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='competitor-intel')
+
+# Background threads for SMS dispatch, which overlaps email sending
+_sms_dispatch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='sms-dispatch')
+
+
+@lru_cache(maxsize=1)
+def _ai() -> AIGenerationLayer:
+    """Return the AI generation layer shared by all jobs in this process."""
+    return AIGenerationLayer()
+
+
+@lru_cache(maxsize=1)
+def _notify() -> NotificationLayer:
+    """Return the notification layer shared by all jobs in this process."""
+    return NotificationLayer()
+
+
+# Generated ads are cached in two tiers: a bounded per-process LRU with a TTL
+# in front of Redis, which all workers share when it is available
+_CACHE_TTL_SECONDS = 86400
+_LOCAL_CACHE_TTL_SECONDS = 3600
+_LOCAL_CACHE_MAX_ENTRIES = 1024
+
+# Redis entries are stored as zlib-compressed JSON. The preset dictionary
+# holds the keys and boilerplate every ad payload repeats, which is most of
+# what a small payload would otherwise spend its compressed bytes on
+_CACHE_COMPRESS_LEVEL = 1
+_CACHE_ZDICT = (
+    b'{"ads":[{"headline":"","ad_text":"","hashtags":["#business"],'
+    b'"cta":"Learn More Today!","quality_score":0.5},'
+    b'"Get Started Now!","Contact Us Today!","Experience the difference with '
+    b'Quality service you can trust.","Discover '
+)
+
+# Redis key prefix, versioned by the stored format. Bump the version whenever
+# the encoding or _CACHE_ZDICT changes, so old entries are no longer read
+_CACHE_FORMAT_VERSION = 1
+_CACHE_PREFIX = f"ads:z{_CACHE_FORMAT_VERSION}:"
+
+_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires_at, value)
+_cache_lock = threading.Lock()
+_cache_client = None
+_cache_client_initialized = False
+
+
+def _get_cache_client():
+    """Return a Redis client for the ad cache, or None if Redis is not available."""
+    global _cache_client, _cache_client_initialized
+    if _cache_client_initialized:
+        return _cache_client
+    _cache_client_initialized = True
+    
+    if redis is None:
+        return None
+    
+    try:
+        connection_url = os.getenv('REDIS_URL')
+        if connection_url:
+            client = redis.from_url(connection_url, socket_connect_timeout=0.25, socket_timeout=0.25)
+        else:
+            client = redis.Redis(
+                host=os.getenv('REDIS_HOST', 'localhost'),
+                port=int(os.getenv('REDIS_PORT', 6379)),
+                db=int(os.getenv('REDIS_DB', 0)),
+                password=os.getenv('REDIS_PASSWORD', None),
+                socket_connect_timeout=0.25,
+                socket_timeout=0.25
+            )
+        client.ping()
+        _cache_client = client
+    except Exception as e:
+        logger.warning(f"Redis cache not available, using in-memory cache: {e}")
+    
+    return _cache_client
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, separators=(',', ':')).encode()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _encode_cache_value(value: Dict[str, Any]) -> bytes:
+    """Serialize a cache value to compressed JSON for Redis."""
+    compressor = zlib.compressobj(_CACHE_COMPRESS_LEVEL, zdict=_CACHE_ZDICT)
+    return compressor.compress(_json_dumps(value)) + compressor.flush()
+
+
+def _decode_cache_value(raw: bytes) -> Dict[str, Any]:
+    """Deserialize a Redis cache value written by _encode_cache_value."""
+    decompressor = zlib.decompressobj(zdict=_CACHE_ZDICT)
+    return _json_loads(decompressor.decompress(raw) + decompressor.flush())
+
+
+def _local_cache_get(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Look up a result in the in-memory cache, dropping it if it has expired."""
+    with _cache_lock:
+        entry = _cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del _cache[cache_key]
+            return None
+        _cache.move_to_end(cache_key)
+        return value
 
 
-# Simple in-memory cache (in production, use Redis)
-_cache = {}
+def _local_cache_set(cache_key: str, value: Dict[str, Any]) -> None:
+    """Store a result in the in-memory cache, evicting least recently used entries."""
+    with _cache_lock:
+        _cache[cache_key] = (time.monotonic() + _LOCAL_CACHE_TTL_SECONDS, value)
+        _cache.move_to_end(cache_key)
+        while len(_cache) > _LOCAL_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _cache_get(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Look up a cached result in the in-memory cache, then in Redis."""
+    value = _local_cache_get(cache_key)
+    if value is not None:
+        return value
+    
+    client = _get_cache_client()
+    if client is None:
+        return None
+    
+    redis_key = _CACHE_PREFIX + cache_key
+    try:
+        raw = client.get(redis_key)
+    except Exception as e:
+        logger.warning(f"Redis cache read failed: {e}")
+        return None
+    if not raw:
+        return None
+    
+    # A corrupt or unreadable entry is a cache miss; drop it so it gets rewritten
+    try:
+        value = _decode_cache_value(raw)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable cache entry {redis_key}: {e}")
+        try:
+            client.delete(redis_key)
+        except Exception:
+            pass
+        return None
+    
+    _local_cache_set(cache_key, value)
+    return value
+
+
+def _cache_set(cache_key: str, value: Dict[str, Any], ttl: int = _CACHE_TTL_SECONDS) -> None:
+    """Store a result in the in-memory cache and in Redis (expiring after ttl seconds)."""
+    _local_cache_set(cache_key, value)
+    
+    client = _get_cache_client()
+    if client is not None:
+        try:
+            client.setex(_CACHE_PREFIX + cache_key, ttl, _encode_cache_value(value))
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
 
 
 def _cache_key(brand: str, competitor: str, zipcode: str, num_variations: int = 3) -> str:
     """Generate cache key from brand, competitor, zipcode, and number of variations."""
-    key_str = f"{brand}|{competitor}|{zipcode}|{num_variations}".lower().strip()
-    return hashlib.md5(key_str.encode()).hexdigest()
+    key_str = f"{brand}|{competitor}|{zipcode}|{num_variations}".casefold().strip()
+    # Non-cryptographic use; a 16-byte BLAKE2b digest is faster than MD5 and keeps keys short
+    return hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
+
+
+def _merge_hashtags(user_tags: List[str], ai_tags: List[str]) -> List[str]:
+    """
+    Merge AI-generated hashtags into the user's hashtags.
+    
+    User hashtags come first; AI hashtags are appended unless they duplicate
+    one already present (compared case-insensitively, ignoring whitespace).
+    
+    Args:
+        user_tags: User hashtags, normalized to start with '#'
+        ai_tags: Hashtags generated by the AI layer
+    
+    Returns:
+        Merged hashtag list, or the AI hashtags if the user gave none
+    """
+    if not user_tags:
+        return ai_tags
+    
+    seen = {tag.strip().casefold() for tag in user_tags}
+    merged = list(user_tags)
+    for ai_tag in ai_tags:
+        key = ai_tag.strip().casefold()
+        if key and key not in seen:
+            seen.add(key)
+            merged.append(ai_tag)
+    return merged
+
+
+# Message templates for send_notifications_job, parsed once at import.
+# Values substituted into the email template must be HTML-escaped.
+_SMS_TEMPLATE = "🎯 {headline}\n\n{ad_text}\n\n{cta}\n\nHashtags: {hashtags}"
+
+_EMAIL_TEMPLATE = Template("""
+                <html>
+                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+                    <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+                        <h2 style="color: #2c3e50;">🎯 New Ad Campaign</h2>
+                        
+                        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
+                            <h3 style="color: #e74c3c; margin-top: 0;">$headline</h3>
+                            <p style="font-size: 16px;">$ad_text</p>
+                            <p style="text-align: center; margin: 20px 0;">
+                                <strong style="background: #3498db; color: white; padding: 12px 24px; border-radius: 5px; display: inline-block;">
+                                    $cta
+                                </strong>
+                            </p>
+                            <p style="color: #7f8c8d; font-size: 14px;">
+                                Hashtags: $hashtags
+                            </p>
+                        </div>
+                    </div>
+                </body>
+                </html>
+                """)
+
+# Single generated ads are also cached, keyed by variation index and a digest of
+# everything that feeds the generation. Context keys that change on every run
+# (timestamps, bookkeeping) are left out of the digest.
+_AD_CACHE_PREFIX = "ad:"
+_AD_CACHE_TTL_SECONDS = 21600
+_AD_CACHE_VOLATILE_KEYS = frozenset(("processing_timestamp", "analysis_metadata"))
+
+
+def _ad_cache_key(variation_idx: int, marketing_context: Dict[str, Any],
+                  user_hashtag_list: List[str], hashtags: List[str], competitor_name: str) -> str:
+    """Build the cache key for one generated ad variation."""
+    stable_context = {
+        key: value for key, value in marketing_context.items()
+        if key not in _AD_CACHE_VOLATILE_KEYS
+    }
+    payload = json.dumps(
+        [stable_context, user_hashtag_list, hashtags, competitor_name],
+        sort_keys=True, default=str
+    )
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    return f"{_AD_CACHE_PREFIX}{variation_idx}:{digest}"
+
+
+# Maximum concurrent email sends per ad in send_notifications_job
+_EMAIL_MAX_WORKERS = 20
+
+# Send records are written to the database in batches of this size
+_SEND_FLUSH_SIZE = 100
+
+# Messages per send_batch_job, matching the notification layer's batch size
+_SEND_BATCH_SIZE = int(os.getenv('NOTIFICATION_BATCH_SIZE', '100'))
+
+# Optional targeting fields copied from the job data into the business context
+_TARGETING_OPTIONS = ('industry', 'audience_type', 'offer_type', 'goal')
+
+# Caps concurrent AI requests across all jobs in this process to respect provider QPS
+_AI_SEMAPHORE = threading.Semaphore(int(os.getenv('AI_CONCURRENCY', '5')))
+_AI_MAX_RETRIES = 3
+
+
+def _content_text(piece: Any) -> str:
+    """Return the text of a generated content piece (or the value itself as a string)."""
+    return piece.content if hasattr(piece, 'content') else str(piece)
+
+
+def _to_ad_dict(generated_content: Any, user_hashtag_list: List[str],
+                hashtags: List[str], competitor_name: str) -> Dict[str, Any]:
+    """
+    Convert generated content into an ad dictionary, filling in defaults.
+    
+    Args:
+        generated_content: GeneratedContent from the AI layer
+        user_hashtag_list: User hashtags, normalized to start with '#'
+        hashtags: Original hashtags, used when no hashtags could be merged
+        competitor_name: Competitor name, used in the fallback headline
+    
+    Returns:
+        Ad dictionary with headline, ad_text, hashtags, cta and quality_score
+    """
+    ai_generated_hashtags = [_content_text(h) for h in generated_content.hashtags]
+    final_hashtags = _merge_hashtags(user_hashtag_list, ai_generated_hashtags)
+    overall_quality = getattr(generated_content, 'overall_quality', None)
+    
+    return {
+        'headline': _content_text(generated_content.headline) or f"New {competitor_name} Solution",
+        'ad_text': _content_text(generated_content.ad_text) or "Discover our amazing services and experience the difference today!",
+        'hashtags': final_hashtags or hashtags or ['#business'],
+        'cta': _content_text(generated_content.cta) or 'Learn More Today!',
+        'quality_score': getattr(overall_quality, 'overall_score', None)
+    }
+
+
+def _generate_one_ad(ai: AIGenerationLayer, marketing_context: Dict[str, Any],
+                     user_hashtag_list: List[str], hashtags: List[str],
+                     competitor_name: str) -> Dict[str, Any]:
+    """
+    Generate a single ad variation, retrying on rate-limit errors.
+    
+    Args:
+        ai: AI generation layer to generate content with
+        marketing_context: Marketing context from the Processing Layer
+        user_hashtag_list: User hashtags, normalized to start with '#'
+        hashtags: Original hashtags, used when no hashtags could be merged
+        competitor_name: Competitor name, used in the fallback headline
+    
+    Returns:
+        Ad dictionary with headline, ad_text, hashtags, cta and quality_score
+    """
+    retry_count = 0
+    while True:
+        try:
+            with _AI_SEMAPHORE:
+                generated_content = ai.generate_content(marketing_context)
+            break
+        except Exception as e:
+            error_str = str(e)
+            # Check if it's a rate limit error (429)
+            if "429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower():
+                retry_count += 1
+                if retry_count < _AI_MAX_RETRIES:
+                    wait_time = 10 * retry_count  # Backoff: 10s, 20s
+                    logger.debug(f"Rate limit hit, waiting {wait_time}s before retry {retry_count}/{_AI_MAX_RETRIES}")
+                    time.sleep(wait_time)
+                    continue
+                logger.warning(f"Rate limit exceeded after {_AI_MAX_RETRIES} retries")
+            raise
+    
+    return _to_ad_dict(generated_content, user_hashtag_list, hashtags, competitor_name)
+
+
+def _gather_competitor_intel(competitor_name: str, website_url: Optional[str]) -> Dict[str, Any]:
+    """
+    Gather competitor intelligence, returning an empty dict if none was found.
+    
+    Args:
+        competitor_name: Competitor name
+        website_url: Competitor website URL, if known
+    
+    Returns:
+        Intelligence dictionary from CompetitorIntelligence, or {} on failure
+    """
+    if _intel_scraper is None:
+        logger.warning("Competitor intelligence module not available, skipping scraping")
+        return {}
+    
+    try:
+        intel = _intel_scraper.gather_intelligence(competitor_name, website_url)
+    except Exception as e:
+        logger.warning(f"Error gathering competitor intelligence: {e}, proceeding with provided data")
+        return {}
+    
+    if intel and intel.get('source') != 'none':
+        logger.info(f"Gathered competitor intelligence from {intel.get('source')} for {competitor_name}")
+        return intel
+    
+    logger.info(f"No competitor intelligence gathered for {competitor_name}, proceeding with provided data")
+    return {}
+
+
+def _generate_one_ad_cached(variation_idx: int, ai: AIGenerationLayer,
+                            marketing_context: Dict[str, Any], user_hashtag_list: List[str],
+                            hashtags: List[str], competitor_name: str) -> Dict[str, Any]:
+    """
+    Generate a single ad variation, reusing a cached ad for the same inputs.
+    
+    Args:
+        variation_idx: Index of the variation, so each variation is cached separately
+        ai: AI generation layer to generate content with
+        marketing_context: Marketing context from the Processing Layer
+        user_hashtag_list: User hashtags, normalized to start with '#'
+        hashtags: Original hashtags, used when no hashtags could be merged
+        competitor_name: Competitor name, used in the fallback headline
+    
+    Returns:
+        Ad dictionary with headline, ad_text, hashtags, cta and quality_score
+    """
+    cache_key = _ad_cache_key(variation_idx, marketing_context, user_hashtag_list, hashtags, competitor_name)
+    ad = _cache_get(cache_key)
+    if ad is None:
+        ad = _generate_one_ad(ai, marketing_context, user_hashtag_list, hashtags, competitor_name)
+        _cache_set(cache_key, ad, ttl=_AD_CACHE_TTL_SECONDS)
+    return ad
+
+
+# Copy for the default ads, indexed by variation
+_DEFAULT_HEADLINES = (
+    "{our_brand}: Better Than {competitor_name}",
+    "Discover {our_brand} Today",
+    "Experience {our_brand}",
+)
+_DEFAULT_AD_TEXTS = (
+    "Experience the difference with {our_brand}. Quality service you can trust. We deliver excellence every time.",
+    "Join thousands of satisfied customers who chose {our_brand}. Get the quality you deserve.",
+    "{our_brand} offers superior service and unmatched quality. See why customers prefer us.",
+)
+_DEFAULT_CTAS = ('Learn More Today!', 'Get Started Now!', 'Contact Us Today!')
+
+
+def _default_ad(variation_idx: int, our_brand: str, competitor_name: str,
+                hashtags: List[str]) -> Dict[str, Any]:
+    """
+    Build a fallback ad for when AI generation produced no ads at all.
+    
+    Args:
+        variation_idx: Index of the variation, selecting the default copy
+        our_brand: Brand name
+        competitor_name: Competitor name
+        hashtags: Hashtags to attach to the ad
+    
+    Returns:
+        Ad dictionary with headline, ad_text, hashtags, cta and quality_score
+    """
+    # Variations past the table reuse its last entry
+    i = min(variation_idx, len(_DEFAULT_HEADLINES) - 1)
+    return {
+        'headline': _DEFAULT_HEADLINES[i].format(our_brand=our_brand, competitor_name=competitor_name),
+        'ad_text': _DEFAULT_AD_TEXTS[i].format(our_brand=our_brand),
+        'hashtags': hashtags if hashtags else ['#business'],
+        'cta': _DEFAULT_CTAS[i],
+        'quality_score': 0.5
+    }
+
+
+def _filler_ad(our_brand: str, hashtags: List[str]) -> Dict[str, Any]:
+    """
+    Build a generic ad used to pad a partially generated set of variations.
+    
+    Args:
+        our_brand: Brand name
+        hashtags: Hashtags to attach to the ad
+    
+    Returns:
+        Ad dictionary with headline, ad_text, hashtags, cta and quality_score
+    """
+    return {
+        'headline': f"Discover {our_brand}",
+        'ad_text': f"Experience the difference with {our_brand}. Quality service you can trust.",
+        'hashtags': hashtags if hashtags else ['#business'],
+        'cta': 'Learn More Today!',
+        'quality_score': 0.5
+    }
+
+
+def _collect_ads(ai: AIGenerationLayer, marketing_context: Dict[str, Any], num_variations: int,
+                 user_hashtag_list: List[str], hashtags: List[str], competitor_name: str,
+                 our_brand: str) -> List[Dict[str, Any]]:
+    """
+    Generate ad variations, falling back to default ads for any that fail.
+    
+    Variations are generated concurrently; the AI calls are network-bound,
+    and _AI_SEMAPHORE keeps the overall request rate in check.
+    
+    Args:
+        ai: AI generation layer to generate content with
+        marketing_context: Marketing context from the Processing Layer
+        num_variations: Number of ad variations to return
+        user_hashtag_list: User hashtags, normalized to start with '#'
+        hashtags: Original hashtags
+        competitor_name: Competitor name
+        our_brand: Brand name
+    
+    Returns:
+        Exactly num_variations ad dictionaries, in variation order
+    """
+    ads_list = []
+    with ThreadPoolExecutor(max_workers=max(1, min(num_variations, 5))) as executor:
+        futures = [
+            executor.submit(
+                _generate_one_ad_cached, i, ai, marketing_context,
+                user_hashtag_list, hashtags, competitor_name
+            )
+            for i in range(num_variations)
+        ]
+        for i, future in enumerate(futures):
+            try:
+                ads_list.append(future.result())
+            except Exception:
+                logger.exception(f"Ad generation variation {i+1} failed")
+    
+    if not ads_list:
+        return [_default_ad(i, our_brand, competitor_name, hashtags) for i in range(num_variations)]
+    
+    while len(ads_list) < num_variations:
+        ads_list.append(_filler_ad(our_brand, hashtags))
+    return ads_list[:num_variations]
+
+
+@dataclass(frozen=True)
+class GenerateAdsRequest:
+    """Validated input for generate_ads_job."""
+    our_brand: str = ''
+    competitor_name: str = ''
+    zipcode: str = ''
+    hashtags: List[str] = field(default_factory=list)
+    num_variations: int = 3
+    ad_copy: str = ''
+    location: str = ''
+    website_url: Optional[str] = None
+    industry: Optional[str] = None
+    audience_type: Optional[str] = None
+    offer_type: Optional[str] = None
+    goal: Optional[str] = None
+    campaign_name: Optional[str] = None
+    scheduled_at: Optional[datetime] = None
+    timezone: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GenerateAdsRequest":
+        """
+        Build a request from job data, parsing fields up front.
+        
+        Args:
+            data: Job data dictionary (see generate_ads_job)
+        
+        Returns:
+            GenerateAdsRequest instance
+        
+        Raises:
+            ValueError: If num_variations or scheduled_at is malformed
+        """
+        scheduled_at = data.get('scheduled_at')
+        return cls(
+            our_brand=data.get('our_brand', ''),
+            competitor_name=data.get('competitor_name', ''),
+            zipcode=data.get('zipcode', ''),
+            hashtags=data.get('hashtags', []),
+            num_variations=int(data.get('num_variations', 3)),
+            ad_copy=data.get('ad_copy', ''),
+            location=data.get('location', ''),
+            website_url=data.get('website_url') or data.get('competitor_website'),
+            industry=data.get('industry'),
+            audience_type=data.get('audience_type'),
+            offer_type=data.get('offer_type'),
+            goal=data.get('goal'),
+            campaign_name=data.get('campaign_name'),
+            scheduled_at=datetime.fromisoformat(scheduled_at) if scheduled_at else None,
+            timezone=data.get('timezone')
+        )
 
 
 def generate_ads_job(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -65,21 +635,24 @@ def generate_ads_job(data: Dict[str, Any]) -> Dict[str, Any]:
             - offer_type: Offer type (optional)
             - goal: Campaign goal (optional)
             - num_variations: Number of ad variations to generate (default: 3)
+            - scheduled_at: ISO 8601 send time for the campaign (optional)
     
     Returns:
         Dictionary with generated ads and metadata
     """
     try:
-        our_brand = data.get('our_brand', '')
-        competitor_name = data.get('competitor_name', '')
-        zipcode = data.get('zipcode', '')
-        hashtags = data.get('hashtags', [])
-        num_variations = data.get('num_variations', 3)
+        # Parse the request first so malformed input fails before any AI work
+        request = GenerateAdsRequest.from_dict(data)
+        our_brand = request.our_brand
+        competitor_name = request.competitor_name
+        zipcode = request.zipcode
+        hashtags = request.hashtags
+        num_variations = request.num_variations
         
         # Check cache (only if we have the exact number of variations)
         cache_key = _cache_key(our_brand, competitor_name, zipcode, num_variations)
-        if cache_key in _cache:
-            cached_result = _cache[cache_key]
+        cached_result = _cache_get(cache_key)
+        if cached_result:
             cached_ads = cached_result.get('ads', [])
             # Only use cache if it has the right number of ads
             if len(cached_ads) == num_variations:
@@ -90,37 +663,39 @@ def generate_ads_job(data: Dict[str, Any]) -> Dict[str, Any]:
                     'cached': True
                 }
         
-        # Gather competitor intelligence before generating ads
-        competitor_intel = {}
-        try:
-            from competitor_intelligence.scraper import CompetitorIntelligence
-            intel_scraper = CompetitorIntelligence()
-            
-            # Get website URL if provided
-            website_url = data.get('website_url') or data.get('competitor_website')
-            
-            # Gather intelligence
-            intel = intel_scraper.gather_intelligence(competitor_name, website_url)
-            
-            if intel and intel.get('source') != 'none':
-                competitor_intel = intel
-                logger.info(f"Gathered competitor intelligence from {intel.get('source')} for {competitor_name}")
-            else:
-                logger.info(f"No competitor intelligence gathered for {competitor_name}, proceeding with provided data")
-        except ImportError:
-            logger.warning("Competitor intelligence module not available, skipping scraping")
-        except Exception as e:
-            logger.warning(f"Error gathering competitor intelligence: {e}, proceeding with provided data")
+        # Gather competitor intelligence in the background; it is only needed
+        # once the marketing context is built, so the scraping overlaps the
+        # input and processing layer work below
+        intel_future = _intel_executor.submit(_gather_competitor_intel, competitor_name, request.website_url)
         
         competitor_data = {
             "competitor_name": competitor_name,
-            "ad_copy": data.get('ad_copy', ''),
+            "ad_copy": request.ad_copy,
             "hashtags": hashtags,
-            "location": data.get('location', ''),
+            "location": request.location,
             "special_offers": [],
             "our_brand": our_brand
         }
         
+        # Process inputs through Input Layer in one batch
+        input_items = []
+        if competitor_name:
+            input_items.append(InputData(data=competitor_name, input_type=InputType.COMPETITOR_NAME))
+        if hashtags:
+            input_items.extend(InputData(data=tag, input_type=InputType.HASHTAG) for tag in hashtags if tag)
+        if zipcode:
+            input_items.append(InputData(data=zipcode, input_type=InputType.ZIP_CODE))
+        
+        input_layer = InputLayer()
+        processed_results = [result.to_dict() for result in input_layer.process_mixed_batch(input_items)]
+        
+        # Build marketing context using Processing Layer
+        processing_layer = ProcessingLayer()
+        marketing_context_obj = processing_layer.build_context(processed_results)
+        marketing_context = marketing_context_obj.to_dict()
+        
+        competitor_intel = intel_future.result()
+        
         # Enhance competitor data with scraped intelligence
         if competitor_intel:
             if competitor_intel.get('description'):
@@ -133,267 +708,44 @@ def generate_ads_job(data: Dict[str, Any]) -> Dict[str, Any]:
                 competitor_data['competitor_website'] = competitor_intel['website']
             competitor_data['intelligence_source'] = competitor_intel.get('source', 'none')
         
-        # Process inputs through Input Layer
-        input_layer = InputLayer()
-        processed_results = []
-        
-        if competitor_name:
-            comp_result = input_layer.process_single(competitor_name, InputType.COMPETITOR_NAME)
-            processed_results.append(comp_result.to_dict())
-        
-        if hashtags:
-            for tag in hashtags:
-                if tag:
-                    hashtag_result = input_layer.process_single(tag, InputType.HASHTAG)
-                    processed_results.append(hashtag_result.to_dict())
-        
-        if zipcode:
-            zip_result = input_layer.process_single(zipcode, InputType.ZIP_CODE)
-            processed_results.append(zip_result.to_dict())
-        
-        # Build marketing context using Processing Layer
-        processing_layer = ProcessingLayer()
-        marketing_context_obj = processing_layer.build_context(processed_results)
-        marketing_context = marketing_context_obj.to_dict()
+        # Add business-specific information, scraped competitor intelligence
+        # (if any) and the targeting options that were provided
+        intel_fields = {
+            "competitor_description": competitor_intel.get("description", ""),
+            "competitor_services": competitor_intel.get("services", []),
+            "competitor_features": competitor_intel.get("key_features", []),
+            "competitor_website": competitor_intel.get("website", ""),
+            "intelligence_source": competitor_intel.get("source", "none"),
+            "competitor_contact": competitor_intel.get("contact_info", {})
+        } if competitor_intel else {}
         
-        # Add business-specific information
         marketing_context["business"] = {
             "our_brand": our_brand,
             "competitor": competitor_name,
             "competitor_ad_copy": competitor_data.get("ad_copy", ""),
             "niche_hashtags": hashtags if hashtags else [],
             "location": competitor_data.get("location", ""),
-            "zipcode": zipcode
+            "zipcode": zipcode,
+            **intel_fields,
+            **{key: getattr(request, key) for key in _TARGETING_OPTIONS if getattr(request, key)}
         }
         
-        # Add scraped competitor intelligence if available
-        if competitor_intel and competitor_intel.get('source') != 'none':
-            marketing_context["business"]["competitor_description"] = competitor_intel.get("description", "")
-            marketing_context["business"]["competitor_services"] = competitor_intel.get("services", [])
-            marketing_context["business"]["competitor_features"] = competitor_intel.get("key_features", [])
-            marketing_context["business"]["competitor_website"] = competitor_intel.get("website", "")
-            marketing_context["business"]["intelligence_source"] = competitor_intel.get("source", "none")
-            marketing_context["business"]["competitor_contact"] = competitor_intel.get("contact_info", {})
-        
-        # Add targeting options if provided
-        if data.get('industry'):
-            marketing_context["business"]["industry"] = data['industry']
-        if data.get('audience_type'):
-            marketing_context["business"]["audience_type"] = data['audience_type']
-        if data.get('offer_type'):
-            marketing_context["business"]["offer_type"] = data['offer_type']
-        if data.get('goal'):
-            marketing_context["business"]["goal"] = data['goal']
-        
         # Ensure hashtags list format
         if not hashtags:
             hashtags = ["#business"]
         elif isinstance(hashtags, str):
             hashtags = [hashtags]
         
-        # Initialize AI layer
-        ai = AIGenerationLayer()
+        # Reuse the process-wide AI layer and its API client
+        ai = _ai()
         
-        # Generate multiple ads using batch generation
-        ads_list = []
+        user_hashtag_list = [tag if tag.startswith('#') else '#' + tag for tag in map(str.strip, hashtags)]
         
-        # Use optimized batch generation if available
-        try:
-            # Try to generate multiple variations in one call
-            generated_content = ai.generate_content(marketing_context)
-            
-            # Create base ad from generated content
-            user_hashtag_list = []
-            if hashtags and len(hashtags) > 0:
-                for tag in hashtags:
-                    tag = tag.strip()
-                    if not tag.startswith('#'):
-                        tag = '#' + tag.lstrip('#')
-                    user_hashtag_list.append(tag)
-            
-            ai_generated_hashtags = []
-            for h in generated_content.hashtags:
-                if hasattr(h, 'content'):
-                    ai_generated_hashtags.append(h.content)
-                elif isinstance(h, str):
-                    ai_generated_hashtags.append(h)
-                else:
-                    ai_generated_hashtags.append(str(h))
-            
-            final_hashtags = user_hashtag_list.copy()
-            for ai_tag in ai_generated_hashtags:
-                ai_tag_clean = ai_tag.strip().lower()
-                if ai_tag_clean not in [t.strip().lower() for t in user_hashtag_list]:
-                    final_hashtags.append(ai_tag)
-            
-            if not user_hashtag_list:
-                final_hashtags = ai_generated_hashtags
-            
-            # Extract content safely
-            headline_text = generated_content.headline.content if hasattr(generated_content.headline, 'content') else str(generated_content.headline)
-            ad_text_content = generated_content.ad_text.content if hasattr(generated_content.ad_text, 'content') else str(generated_content.ad_text)
-            cta_text = generated_content.cta.content if hasattr(generated_content.cta, 'content') else str(generated_content.cta)
-            
-            base_ad = {
-                'headline': headline_text or f"New {competitor_name} Solution",
-                'ad_text': ad_text_content or "Discover our amazing services and experience the difference today!",
-                'hashtags': final_hashtags if final_hashtags else hashtags if hashtags else ['#business'],
-                'cta': cta_text or 'Learn More Today!',
-                'quality_score': generated_content.overall_quality.overall_score if hasattr(generated_content, 'overall_quality') else None
-            }
-            
-            # Generate variations by calling AI multiple times
-            ads_list.append(base_ad)
-            
-            for i in range(num_variations - 1):
-                # Small delay between variations (pro keys have higher limits, but still good to pace requests)
-                wait_time = 2  # Wait 2 seconds between ad variations
-                if i > 0:
-                    print(f"Waiting {wait_time}s before generating variation {i+2}/{num_variations}...")
-                    time.sleep(wait_time)
-                
-                max_retries = 3
-                retry_count = 0
-                generated_content = None
-                
-                while retry_count < max_retries:
-                    try:
-                        generated_content = ai.generate_content(marketing_context)
-                        break  # Success, exit retry loop
-                    except Exception as e:
-                        error_str = str(e)
-                        # Check if it's a rate limit error (429)
-                        if "429" in error_str or "quota" in error_str.lower() or "rate" in error_str.lower():
-                            retry_count += 1
-                            if retry_count < max_retries:
-                                wait_time = 10 * retry_count  # Exponential backoff: 10s, 20s, 30s
-                                print(f"Rate limit hit, waiting {wait_time}s before retry {retry_count}/{max_retries}")
-                                time.sleep(wait_time)
-                                continue
-                            else:
-                                print(f"Rate limit exceeded after {max_retries} retries")
-                                raise
-                        else:
-                            # Not a rate limit error, don't retry
-                            raise
-                
-                try:
-                    if generated_content is None:
-                        raise Exception("Failed to generate content after retries")
-                    
-                    # Extract hashtags
-                    ai_generated_hashtags = []
-                    for h in generated_content.hashtags:
-                        if hasattr(h, 'content'):
-                            ai_generated_hashtags.append(h.content)
-                        elif isinstance(h, str):
-                            ai_generated_hashtags.append(h)
-                    
-                    final_hashtags = user_hashtag_list.copy()
-                    for ai_tag in ai_generated_hashtags:
-                        ai_tag_clean = ai_tag.strip().lower()
-                        if ai_tag_clean not in [t.strip().lower() for t in user_hashtag_list]:
-                            final_hashtags.append(ai_tag)
-                    
-                    if not user_hashtag_list:
-                        final_hashtags = ai_generated_hashtags
-                    
-                    # Extract content safely
-                    headline_text = generated_content.headline.content if hasattr(generated_content.headline, 'content') else str(generated_content.headline)
-                    ad_text_content = generated_content.ad_text.content if hasattr(generated_content.ad_text, 'content') else str(generated_content.ad_text)
-                    cta_text = generated_content.cta.content if hasattr(generated_content.cta, 'content') else str(generated_content.cta)
-                    
-                    ads_list.append({
-                        'headline': headline_text or f"New {competitor_name} Solution",
-                        'ad_text': ad_text_content or "Discover our amazing services and experience the difference today!",
-                        'hashtags': final_hashtags if final_hashtags else hashtags if hashtags else ['#business'],
-                        'cta': cta_text or 'Learn More Today!',
-                        'quality_score': generated_content.overall_quality.overall_score if hasattr(generated_content, 'overall_quality') else None
-                    })
-                except Exception as e:
-                    print(f"Ad generation variation {i+1} failed after retries: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Don't add fallback here - we'll create defaults at the end if needed
-                    continue
-                    
-        except Exception as e:
-            print(f"Batch generation failed, falling back: {e}")
-            import traceback
-            traceback.print_exc()
-            # Fallback to individual generation or create default ads
-            for i in range(num_variations):
-                try:
-                    generated_content = ai.generate_content(marketing_context)
-                    
-                    user_hashtag_list = []
-                    if hashtags and len(hashtags) > 0:
-                        for tag in hashtags:
-                            tag = tag.strip()
-                            if not tag.startswith('#'):
-                                tag = '#' + tag.lstrip('#')
-                            user_hashtag_list.append(tag)
-                    
-                    ai_generated_hashtags = []
-                    for h in generated_content.hashtags:
-                        if hasattr(h, 'content'):
-                            ai_generated_hashtags.append(h.content)
-                        elif isinstance(h, str):
-                            ai_generated_hashtags.append(h)
-                    
-                    final_hashtags = user_hashtag_list.copy()
-                    for ai_tag in ai_generated_hashtags:
-                        ai_tag_clean = ai_tag.strip().lower()
-                        if ai_tag_clean not in [t.strip().lower() for t in user_hashtag_list]:
-                            final_hashtags.append(ai_tag)
-                    
-                    if not user_hashtag_list:
-                        final_hashtags = ai_generated_hashtags
-                    
-                    # Extract content safely
-                    headline_text = generated_content.headline.content if hasattr(generated_content.headline, 'content') else str(generated_content.headline)
-                    ad_text_content = generated_content.ad_text.content if hasattr(generated_content.ad_text, 'content') else str(generated_content.ad_text)
-                    cta_text = generated_content.cta.content if hasattr(generated_content.cta, 'content') else str(generated_content.cta)
-                    
-                    ads_list.append({
-                        'headline': headline_text or f"New {competitor_name} Solution",
-                        'ad_text': ad_text_content or "Discover our amazing services and experience the difference today!",
-                        'hashtags': final_hashtags if final_hashtags else hashtags if hashtags else ['#business'],
-                        'cta': cta_text or 'Learn More Today!',
-                        'quality_score': generated_content.overall_quality.overall_score if hasattr(generated_content, 'overall_quality') else None
-                    })
-                except Exception as e:
-                    print(f"Ad generation attempt {i+1} failed: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
-        
-        # If no ads were generated, create default ads
-        if not ads_list:
-            for i in range(num_variations):
-                ads_list.append({
-                    'headline': f"{our_brand}: Better Than {competitor_name}" if i == 0 else f"Discover {our_brand} Today" if i == 1 else f"Experience {our_brand}",
-                    'ad_text': f"Experience the difference with {our_brand}. Quality service you can trust. We deliver excellence every time." if i == 0 else f"Join thousands of satisfied customers who chose {our_brand}. Get the quality you deserve." if i == 1 else f"{our_brand} offers superior service and unmatched quality. See why customers prefer us.",
-                    'hashtags': hashtags if hashtags else ['#business'],
-                    'cta': 'Learn More Today!' if i == 0 else 'Get Started Now!' if i == 1 else 'Contact Us Today!',
-                    'quality_score': 0.5
-                })
-        
-        # Ensure we have exactly num_variations ads
-        while len(ads_list) < num_variations:
-            ads_list.append({
-                'headline': f"Discover {our_brand}",
-                'ad_text': f"Experience the difference with {our_brand}. Quality service you can trust.",
-                'hashtags': hashtags if hashtags else ['#business'],
-                'cta': 'Learn More Today!',
-                'quality_score': 0.5
-            })
-        
-        # Limit to num_variations
-        ads_list = ads_list[:num_variations]
+        ads_list = _collect_ads(ai, marketing_context, num_variations, user_hashtag_list,
+                                hashtags, competitor_name, our_brand)
         
         # Cache the result
-        _cache[cache_key] = {'ads': ads_list}
+        _cache_set(cache_key, {'ads': ads_list})
         
         # Save to database if available
         campaign_id = None
@@ -401,16 +753,16 @@ def generate_ads_job(data: Dict[str, Any]) -> Dict[str, Any]:
             try:
                 # Create campaign record
                 campaign_data = {
-                    'name': data.get('campaign_name', f"{our_brand} vs {competitor_name}"),
+                    'name': request.campaign_name or f"{our_brand} vs {competitor_name}",
                     'brand_name': our_brand,
                     'competitor_name': competitor_name,
                     'zipcode': zipcode,
-                    'industry': data.get('industry'),
-                    'audience_type': data.get('audience_type'),
-                    'offer_type': data.get('offer_type'),
-                    'goal': data.get('goal'),
-                    'scheduled_at': datetime.fromisoformat(data['scheduled_at']) if data.get('scheduled_at') else None,
-                    'timezone': data.get('timezone'),
+                    'industry': request.industry,
+                    'audience_type': request.audience_type,
+                    'offer_type': request.offer_type,
+                    'goal': request.goal,
+                    'scheduled_at': request.scheduled_at,
+                    'timezone': request.timezone,
                     'status': 'draft'
                 }
                 campaign_id = CampaignDB.create_campaign(campaign_data)
@@ -419,7 +771,7 @@ def generate_ads_job(data: Dict[str, Any]) -> Dict[str, Any]:
                 if campaign_id:
                     AdVariantDB.create_ad_variants(campaign_id, ads_list)
             except Exception as e:
-                print(f"Warning: Failed to save to database: {e}")
+                logger.warning(f"Failed to save to database: {e}")
         
         return {
             'success': True,
@@ -430,12 +782,215 @@ def generate_ads_job(data: Dict[str, Any]) -> Dict[str, Any]:
         }
         
     except Exception as e:
+        logger.exception("Ad generation job failed")
         return {
             'success': False,
             'error': str(e)
         }
 
 
+def _send_records(campaign_id: int, ad_variant_id: int, channel: str, contact_field: str,
+                  users: List[Dict[str, Any]], send_results: List[Any],
+                  recipient_ids: Dict[tuple, int]) -> List[Dict[str, Any]]:
+    """
+    Build the send records for one ad, for SendDB.create_sends_with_events.
+    
+    Args:
+        campaign_id: Campaign ID
+        ad_variant_id: ID of the ad variant that was sent
+        channel: 'sms' or 'email'
+        contact_field: User field holding the contact ('phone' or 'email')
+        users: Users the ad was sent to, in the same order as send_results
+        send_results: NotificationResult objects (or failure dicts)
+        recipient_ids: Recipient IDs keyed by (channel, contact)
+    
+    Returns:
+        Send dicts for the users with a known recipient ID
+    """
+    sends = []
+    for user, result in zip(users, send_results):
+        send = _send_record(campaign_id, ad_variant_id, channel, user.get(contact_field, ''),
+                            result, recipient_ids)
+        if send:
+            sends.append(send)
+    return sends
+
+
+def _send_record(campaign_id: int, ad_variant_id: int, channel: str, contact: str,
+                 result: Any, recipient_ids: Dict[tuple, int]) -> Optional[Dict[str, Any]]:
+    """Build the send record for one recipient, or None if the recipient is not tracked."""
+    recipient_id = recipient_ids.get((channel, contact))
+    if not recipient_id:
+        return None
+    success = result.get('success', False) if isinstance(result, dict) else result.success
+    return {
+        'campaign_id': campaign_id,
+        'ad_variant_id': ad_variant_id,
+        'recipient_id': recipient_id,
+        'channel': channel,
+        'success': bool(success)
+    }
+
+
+def _flush_sends(sends: List[Dict[str, Any]]) -> None:
+    """Store send records, handing them to the send writer when its stream is enabled."""
+    # Whatever could not be published to the stream is written here
+    if is_send_stream_enabled():
+        sends = publish_sends(sends)
+    if sends:
+        try:
+            SendDB.create_sends_with_events(sends)
+        except Exception as e:
+            logger.warning(f"Failed to track sends in database: {e}")
+
+
+def _object_to_dict(result: Any) -> Dict[str, Any]:
+    """Convert a plain object's attributes, unwrapping enums and datetimes."""
+    result_dict = {}
+    for key, value in result.__dict__.items():
+        if hasattr(value, 'value'):
+            result_dict[key] = value.value
+        elif hasattr(value, 'isoformat'):
+            result_dict[key] = value.isoformat()
+        else:
+            result_dict[key] = value
+    return result_dict
+
+
+def _identity(result: Any) -> Any:
+    """Return a result that is already a dict unchanged."""
+    return result
+
+
+def _unknown_result_to_dict(result: Any) -> Dict[str, Any]:
+    """Report a result of an unexpected type as a failed send."""
+    return {
+        'success': False,
+        'error_message': str(result),
+        'status': 'failed'
+    }
+
+
+# Converter for each result class seen so far, chosen on its first instance
+_RESULT_CONVERTERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _result_converter(result: Any) -> Callable[[Any], Any]:
+    """Pick (and cache) the converter for the class of a result."""
+    result_type = type(result)
+    if isinstance(result, dict):
+        converter = _identity
+    elif hasattr(result, 'to_dict'):
+        converter = result_type.to_dict
+    elif hasattr(result, '__dict__'):
+        converter = _object_to_dict
+    else:
+        converter = _unknown_result_to_dict
+    _RESULT_CONVERTERS[result_type] = converter
+    return converter
+
+
+def _result_to_dict(result: Any) -> Dict[str, Any]:
+    """Convert a NotificationResult (or failure dict) to a JSON-friendly dict."""
+    if type(result) is dict:
+        return result
+    converter = _RESULT_CONVERTERS.get(type(result)) or _result_converter(result)
+    return converter(result)
+
+
+def _summarize_results(raw_results: List[Any], label: str) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+    """
+    Convert send results to dicts, counting successes and collecting errors in one pass.
+    
+    Args:
+        raw_results: NotificationResult objects (or failure dicts)
+        label: Channel label used in error messages ('SMS' or 'Email')
+    
+    Returns:
+        Tuple of (converted results, number of successful sends, error messages)
+    """
+    converters = _RESULT_CONVERTERS
+    converted = []
+    successful = 0
+    errors = []
+    for raw_result in raw_results:
+        result_type = type(raw_result)
+        if result_type is dict:
+            # Failure dicts pass through without a converter lookup
+            result = raw_result
+        else:
+            converter = converters.get(result_type) or _result_converter(raw_result)
+            result = converter(raw_result)
+        converted.append(result)
+        # Every converter returns a dict, so no type check is needed here
+        if result.get('success', False):
+            successful += 1
+        else:
+            errors.append(f"{label} error: {result.get('error_message', 'Unknown error')}")
+    return converted, successful, errors
+
+
+def _send_sms_ads(notification: NotificationLayer, ads: List[Dict[str, Any]],
+                  sms_users: List[Dict[str, Any]], ad_variant_ids: Dict[int, int],
+                  track_sends: bool, campaign_id: Optional[int],
+                  recipient_ids: Dict[tuple, int]) -> Tuple[List[Any], List[Dict[str, Any]]]:
+    """
+    Send every ad to the SMS users.
+    
+    Args:
+        notification: Notification layer to send with
+        ads: Ad dicts to send
+        sms_users: Users to send to
+        ad_variant_ids: Ad variant IDs keyed by ad index
+        track_sends: Whether to build send records for the database
+        campaign_id: Campaign ID, when tracking sends
+        recipient_ids: Recipient IDs keyed by (channel, contact)
+    
+    Returns:
+        Tuple of (SMS results, send records for the database)
+    """
+    results = []
+    sends = []
+    for ad_idx, ad in enumerate(ads):
+        sms_message = _SMS_TEMPLATE.format(
+            headline=ad['headline'],
+            ad_text=ad['ad_text'],
+            cta=ad['cta'],
+            hashtags=', '.join(ad['hashtags'])
+        )
+        
+        # Get ad variant ID if available
+        ad_variant_id = ad.get('id') or (ad_variant_ids.get(ad_idx) if ad_idx in ad_variant_ids else None)
+        
+        try:
+            ad_results = notification.send_to_user_list(
+                user_list=sms_users,
+                message_content=sms_message,
+                notification_type=NotificationType.SMS
+            )
+            
+            # Track sends in database (send_to_user_list skips users without a phone)
+            if track_sends and ad_variant_id:
+                sends.extend(_send_records(
+                    campaign_id, ad_variant_id, 'sms', 'phone',
+                    [user for user in sms_users if 'phone' in user],
+                    ad_results, recipient_ids
+                ))
+            
+            results.extend(ad_results)
+        except Exception as e:
+            logger.exception("Bulk SMS send failed")
+            error_msg = str(e)
+            for user in sms_users:
+                results.append({
+                    'success': False,
+                    'error_message': error_msg,
+                    'status': 'failed'
+                })
+    
+    return results, sends
+
+
 def send_notifications_job(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Background job to send notifications (email/SMS).
@@ -482,7 +1037,7 @@ def send_notifications_job(data: Dict[str, Any]) -> Dict[str, Any]:
                         # Also add ID to ad dict for reference
                         ads[idx]['id'] = variant['id']
             except Exception as e:
-                print(f"Warning: Failed to get ad variants from database: {e}")
+                logger.warning(f"Failed to get ad variants from database: {e}")
         
         if campaign_id and DB_AVAILABLE and is_db_available():
             try:
@@ -520,9 +1075,9 @@ def send_notifications_job(data: Dict[str, Any]) -> Dict[str, Any]:
                             recipient_ids[('email', user['email'])] = recipient_id_list[idx]
                             idx += 1
             except Exception as e:
-                print(f"Warning: Failed to save recipients to database: {e}")
+                logger.warning(f"Failed to save recipients to database: {e}")
         
-        notification = NotificationLayer()
+        notification = _notify()
         
         if notification is None:
             return {
@@ -536,163 +1091,96 @@ def send_notifications_job(data: Dict[str, Any]) -> Dict[str, Any]:
             'summary': {}
         }
         
-        # Send SMS
+        # Send records for the database, written in batches of _SEND_FLUSH_SIZE
+        track_sends = bool(campaign_id and DB_AVAILABLE and is_db_available())
+        pending_sends = []
+        
+        # SMS goes out on a background thread while email is sent here,
+        # so the two channels' network waits overlap
+        sms_future = None
         if sms_users and NotificationType.SMS in notification.providers:
-            for ad_idx, ad in enumerate(ads):
-                sms_message = f"🎯 {ad['headline']}\n\n{ad['ad_text']}\n\n{ad['cta']}\n\nHashtags: {', '.join(ad['hashtags'])}"
-                
-                # Get ad variant ID if available
-                ad_variant_id = ad.get('id') or (ad_variant_ids.get(ad_idx) if ad_idx in ad_variant_ids else None)
-                
-                try:
-                    sms_results = notification.send_to_user_list(
-                        user_list=sms_users,
-                        message_content=sms_message,
-                        notification_type=NotificationType.SMS
-                    )
-                    
-                    # Track sends in database
-                    if campaign_id and DB_AVAILABLE and is_db_available() and ad_variant_id:
-                        for i, user in enumerate(sms_users):
-                            if i < len(sms_results):
-                                result = sms_results[i]
-                                recipient_id = recipient_ids.get(('sms', user.get('phone', '')))
-                                if recipient_id:
-                                    send_id = SendDB.create_send(
-                                        campaign_id=campaign_id,
-                                        ad_variant_id=ad_variant_id,
-                                        recipient_id=recipient_id,
-                                        channel='sms',
-                                        status='sent' if result.get('success') else 'failed'
-                                    )
-                                    if send_id:
-                                        EventDB.create_event(send_id, 'send', {'channel': 'sms'})
-                                        if result.get('success'):
-                                            SendDB.update_send_status(send_id, 'delivered')
-                                            EventDB.create_event(send_id, 'delivery', {})
-                    
-                    results['sms_results'].extend(sms_results)
-                except Exception as e:
-                    error_msg = str(e)
-                    for user in sms_users:
-                        results['sms_results'].append({
-                            'success': False,
-                            'error_message': error_msg,
-                            'status': 'failed'
-                        })
+            sms_future = _sms_dispatch_executor.submit(
+                _send_sms_ads, notification, ads, sms_users, ad_variant_ids,
+                track_sends, campaign_id, recipient_ids
+            )
         
         # Send Email
         if email_users and NotificationType.EMAIL in notification.providers:
             for ad_idx, ad in enumerate(ads):
                 email_subject = f"🎯 New Ad Campaign: {ad['headline']}"
-                email_content = f"""
-                <html>
-                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                    <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                        <h2 style="color: #2c3e50;">🎯 New Ad Campaign</h2>
-                        
-                        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                            <h3 style="color: #e74c3c; margin-top: 0;">{ad['headline']}</h3>
-                            <p style="font-size: 16px;">{ad['ad_text']}</p>
-                            <p style="text-align: center; margin: 20px 0;">
-                                <strong style="background: #3498db; color: white; padding: 12px 24px; border-radius: 5px; display: inline-block;">
-                                    {ad['cta']}
-                                </strong>
-                            </p>
-                            <p style="color: #7f8c8d; font-size: 14px;">
-                                Hashtags: {', '.join(ad['hashtags'])}
-                            </p>
-                        </div>
-                    </div>
-                </body>
-                </html>
-                """
+                email_content = _EMAIL_TEMPLATE.substitute(
+                    headline=html.escape(ad['headline']),
+                    ad_text=html.escape(ad['ad_text']),
+                    cta=html.escape(ad['cta']),
+                    hashtags=html.escape(', '.join(ad['hashtags']))
+                )
                 
                 # Get ad variant ID if available
                 ad_variant_id = ad.get('id') or (ad_variant_ids.get(ad_idx) if ad_idx in ad_variant_ids else None)
                 
-                for user in email_users:
-                    try:
-                        email_result = notification.send_email(
-                            to_email=user['email'],
-                            subject=email_subject,
-                            content=f"New Ad Campaign: {ad['headline']}\n\n{ad['ad_text']}\n\n{ad['cta']}",
-                            html_content=email_content
-                        )
-                        
-                        # Track send in database
-                        if campaign_id and DB_AVAILABLE and is_db_available() and ad_variant_id:
-                            recipient_id = recipient_ids.get(('email', user.get('email', '')))
-                            if recipient_id:
-                                send_id = SendDB.create_send(
-                                    campaign_id=campaign_id,
-                                    ad_variant_id=ad_variant_id,
-                                    recipient_id=recipient_id,
-                                    channel='email',
-                                    status='sent' if email_result.get('success') else 'failed'
-                                )
-                                if send_id:
-                                    EventDB.create_event(send_id, 'send', {'channel': 'email'})
-                                    if email_result.get('success'):
-                                        SendDB.update_send_status(send_id, 'delivered')
-                                        EventDB.create_event(send_id, 'delivery', {})
-                        
-                        results['email_results'].append(email_result)
-                    except Exception as e:
-                        error_msg = str(e)
+                email_messages = [
+                    {
+                        "to_email": user.get('email', ''),
+                        "subject": email_subject,
+                        "content": f"New Ad Campaign: {ad['headline']}\n\n{ad['ad_text']}\n\n{ad['cta']}",
+                        "html_content": email_content
+                    }
+                    for user in email_users
+                ]
+                
+                # Send to all recipients concurrently, recording each send as it
+                # completes so database writes overlap the remaining sends
+                track_ad = track_sends and ad_variant_id
+                email_results = [None] * len(email_messages)
+                try:
+                    for index, result in notification.send_bulk_email_iter(
+                        email_messages,
+                        max_workers=min(_EMAIL_MAX_WORKERS, len(email_messages))
+                    ):
+                        email_results[index] = result
+                        if not track_ad:
+                            continue
+                        send = _send_record(campaign_id, ad_variant_id, 'email',
+                                            email_users[index].get('email', ''), result, recipient_ids)
+                        if send:
+                            pending_sends.append(send)
+                            if len(pending_sends) >= _SEND_FLUSH_SIZE:
+                                _flush_sends(pending_sends)
+                                pending_sends = []
+                except Exception as e:
+                    logger.exception("Bulk email send failed")
+                    error_msg = str(e)
+                    for user in email_users:
                         results['email_results'].append({
                             'success': False,
                             'error_message': error_msg,
                             'status': 'failed'
                         })
+                    continue
+                
+                results['email_results'].extend(email_results)
+        
+        if sms_future is not None:
+            sms_results, sms_sends = sms_future.result()
+            results['sms_results'] = sms_results
+            pending_sends.extend(sms_sends)
         
-        # Convert results to dictionaries
-        def result_to_dict(result):
-            if isinstance(result, dict):
-                return result
-            elif hasattr(result, 'to_dict'):
-                return result.to_dict()
-            elif hasattr(result, '__dict__'):
-                result_dict = {}
-                for key, value in result.__dict__.items():
-                    if hasattr(value, 'value'):
-                        result_dict[key] = value.value
-                    elif hasattr(value, 'isoformat'):
-                        result_dict[key] = value.isoformat()
-                    else:
-                        result_dict[key] = value
-                return result_dict
-            else:
-                return str(result)
-        
-        results['sms_results'] = [result_to_dict(r) for r in results['sms_results']]
-        results['email_results'] = [result_to_dict(r) for r in results['email_results']]
-        
-        # Calculate summary
-        total_sms_sent = sum(1 for r in results['sms_results'] 
-                            if isinstance(r, dict) and r.get('success', False))
-        
-        total_email_sent = sum(1 for r in results['email_results'] 
-                              if r and isinstance(r, dict) and r.get('success', False))
-        
-        error_messages = []
-        for result in results['sms_results']:
-            if isinstance(result, dict) and not result.get('success', False):
-                error_messages.append(f"SMS error: {result.get('error_message', 'Unknown error')}")
-        
-        for result in results['email_results']:
-            if result and isinstance(result, dict) and not result.get('success', False):
-                error_messages.append(f"Email error: {result.get('error_message', 'Unknown error')}")
+        if pending_sends:
+            _flush_sends(pending_sends)
         
+        sms_results, successful_sms, sms_errors = _summarize_results(results['sms_results'], 'SMS')
+        email_results, successful_email, email_errors = _summarize_results(results['email_results'], 'Email')
+        results['sms_results'] = sms_results
+        results['email_results'] = email_results
         results['summary'] = {
-            'total_sms': len(results['sms_results']),
-            'successful_sms': total_sms_sent,
-            'failed_sms': len(results['sms_results']) - total_sms_sent,
-            'total_email': len(results['email_results']),
-            'successful_email': total_email_sent,
-            'failed_email': len(results['email_results']) - total_email_sent,
-            'total_sent': total_sms_sent + total_email_sent,
-            'error_messages': error_messages if error_messages else []
+            'total_sms': len(sms_results),
+            'successful_sms': successful_sms,
+            'failed_sms': len(sms_results) - successful_sms,
+            'total_email': len(email_results),
+            'successful_email': successful_email,
+            'failed_email': len(email_results) - successful_email,
+            'total_sent': successful_sms + successful_email,
+            'error_messages': sms_errors + email_errors
         }
         
         return {
@@ -701,8 +1189,75 @@ def send_notifications_job(data: Dict[str, Any]) -> Dict[str, Any]:
         }
         
     except Exception as e:
+        logger.exception("Notification sending job failed")
         return {
             'success': False,
             'error': str(e)
         }
 
+
+
+def send_batch_job(messages: List[Dict[str, Any]], channel: str) -> Dict[str, Any]:
+    """
+    Background job to send one batch of prepared messages on a single channel.
+    
+    Args:
+        messages: Message dicts for send_bulk_sms or send_bulk_email
+        channel: 'sms' or 'email'
+    
+    Returns:
+        Dictionary with the converted results and success/failure counts
+    """
+    try:
+        notification = _notify()
+        if channel == 'sms':
+            raw_results = notification.send_bulk_sms(messages)
+        elif channel == 'email':
+            raw_results = notification.send_bulk_email(messages)
+        else:
+            return {
+                'success': False,
+                'error': f'Unsupported channel: {channel}'
+            }
+        
+        results, successful, errors = _summarize_results(raw_results, 'SMS' if channel == 'sms' else 'Email')
+        return {
+            'success': True,
+            'channel': channel,
+            'results': results,
+            'summary': {
+                'total': len(results),
+                'successful': successful,
+                'failed': len(results) - successful,
+                'error_messages': errors
+            }
+        }
+    
+    except Exception as e:
+        logger.exception("Batch %s send failed", channel)
+        return {
+            'success': False,
+            'error': str(e)
+        }
+
+
+def enqueue_send_batch(messages: List[Dict[str, Any]], channel: str,
+                       batch_size: int = _SEND_BATCH_SIZE) -> List[Any]:
+    """
+    Enqueue messages as send_batch_job jobs of batch_size messages each.
+    
+    One job per batch instead of one per message spreads RQ's per-job
+    Redis writes over the whole batch.
+    
+    Args:
+        messages: Message dicts for send_bulk_sms or send_bulk_email
+        channel: 'sms' or 'email'
+        batch_size: Messages per job
+    
+    Returns:
+        List of job IDs (or synchronous results), one per batch
+    """
+    return enqueue_jobs_bulk(send_batch_job, [
+        (messages[start:start + batch_size], channel)
+        for start in range(0, len(messages), batch_size)
+    ])
@@ -2,7 +2,12 @@
 Queue manager for background jobs using Redis Queue (RQ).
 """
 import os
-from typing import Optional, Dict, Any
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Sequence
 import logging
 
 # Optional imports for Redis/RQ
@@ -21,6 +26,36 @@ logger = logging.getLogger(__name__)
 redis_conn = None
 queue = None
 
+# Connection pool kept across init_queue() calls, with the settings it was
+# created for, so re-initializing with the same settings reuses connections
+_REDIS_MAX_CONNECTIONS = 50
+_connection_pool = None
+_connection_pool_key = None
+
+# RQ job timeout in seconds, passed as an int so RQ skips parsing a '5m' string
+_JOB_TIMEOUT = 300
+
+# Opt-in fallback for when Redis is up but no RQ worker is running. With
+# LOCAL_JOB_WORKERS > 0, jobs run on a local thread pool and are tracked by a
+# "local-" job ID, so requests return immediately and clients poll
+# get_job_status(). Job state lives only in this process, so this suits a
+# single long-lived web process; by default such jobs run synchronously
+_LOCAL_JOB_WORKERS = int(os.getenv('LOCAL_JOB_WORKERS', '0'))
+_LOCAL_JOB_PREFIX = 'local-'
+_LOCAL_JOB_LIMIT = 1000
+_local_executor = None
+_local_jobs: Dict[str, Dict[str, Any]] = {}
+_local_jobs_lock = threading.Lock()
+
+# has_active_workers() result is cached for this many seconds, as
+# (value, expires_at) on the time.monotonic() clock
+_WORKER_CHECK_TTL_SECONDS = 10.0
+_worker_check_cache = (False, 0.0)
+
+# Jobs per Redis pipeline in enqueue_jobs_bulk, keeping each pipeline's
+# buffered commands and replies to a reasonable size
+_BULK_ENQUEUE_CHUNK_SIZE = 10000
+
 
 def init_queue(redis_url: Optional[str] = None):
     """Initialize Redis connection and queue."""
@@ -33,27 +68,7 @@ def init_queue(redis_url: Optional[str] = None):
         return False
     
     try:
-        # Priority: parameter > REDIS_URL env > host/port env vars
-        connection_url = redis_url or os.getenv('REDIS_URL')
-        if connection_url:
-            # Handle both redis://redis:6379/0 and redis://localhost:6379/0 formats
-            redis_conn = redis.from_url(connection_url, decode_responses=True, socket_connect_timeout=5, socket_timeout=5)
-        else:
-            # Try to connect to Redis using host/port
-            redis_host = os.getenv('REDIS_HOST', 'localhost')
-            redis_port = int(os.getenv('REDIS_PORT', 6379))
-            redis_db = int(os.getenv('REDIS_DB', 0))
-            redis_password = os.getenv('REDIS_PASSWORD', None)
-            
-            redis_conn = redis.Redis(
-                host=redis_host,
-                port=redis_port,
-                db=redis_db,
-                password=redis_password,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5
-            )
+        redis_conn = redis.Redis(connection_pool=_get_connection_pool(redis_url))
         
         # Test connection
         redis_conn.ping()
@@ -71,24 +86,144 @@ def init_queue(redis_url: Optional[str] = None):
         return False
 
 
+def _get_connection_pool(redis_url: Optional[str] = None):
+    """Return the Redis connection pool, creating it if the settings changed."""
+    global _connection_pool, _connection_pool_key
+    
+    pool_options = {
+        'decode_responses': True,
+        'socket_connect_timeout': 5,
+        'socket_timeout': 5,
+        'socket_keepalive': True,
+        'max_connections': _REDIS_MAX_CONNECTIONS
+    }
+    
+    # Priority: parameter > REDIS_URL env > host/port env vars
+    connection_url = redis_url or os.getenv('REDIS_URL')
+    if connection_url:
+        pool_key = (connection_url,)
+    else:
+        pool_key = (
+            os.getenv('REDIS_HOST', 'localhost'),
+            int(os.getenv('REDIS_PORT', 6379)),
+            int(os.getenv('REDIS_DB', 0)),
+            os.getenv('REDIS_PASSWORD', None)
+        )
+    
+    if _connection_pool is not None and pool_key == _connection_pool_key:
+        return _connection_pool
+    
+    if connection_url:
+        # Handle both redis://redis:6379/0 and redis://localhost:6379/0 formats
+        pool = redis.ConnectionPool.from_url(connection_url, **pool_options)
+    else:
+        host, port, db, password = pool_key
+        pool = redis.ConnectionPool(host=host, port=port, db=db, password=password, **pool_options)
+    
+    if _connection_pool is not None:
+        _connection_pool.disconnect()
+    _connection_pool = pool
+    _connection_pool_key = pool_key
+    return pool
+
+
+def _submit_local_job(job_function, *args, **kwargs) -> str:
+    """Run a job on the local thread pool and return its local job ID."""
+    global _local_executor
+    
+    job_id = f"{_LOCAL_JOB_PREFIX}{uuid.uuid4().hex}"
+    with _local_jobs_lock:
+        if _local_executor is None:
+            _local_executor = ThreadPoolExecutor(max_workers=_LOCAL_JOB_WORKERS)
+        
+        # Forget the oldest finished jobs once the table is full
+        if len(_local_jobs) >= _LOCAL_JOB_LIMIT:
+            for old_id in [jid for jid, job in _local_jobs.items() if job['future'].done()]:
+                del _local_jobs[old_id]
+                if len(_local_jobs) < _LOCAL_JOB_LIMIT:
+                    break
+        
+        job = {'created_at': datetime.now(), 'started_at': None, 'ended_at': None}
+        job['future'] = _local_executor.submit(_run_local_job, job, job_function, *args, **kwargs)
+        _local_jobs[job_id] = job
+    return job_id
+
+
+def _run_local_job(job: Dict[str, Any], job_function, *args, **kwargs):
+    """Run a local job, recording its start and end times on its entry."""
+    job['started_at'] = datetime.now()
+    try:
+        return job_function(*args, **kwargs)
+    finally:
+        job['ended_at'] = datetime.now()
+
+
+def _get_local_job_status(job_id: str) -> Dict[str, Any]:
+    """Get status of a job running on the local thread pool, in RQ's format."""
+    job = _local_jobs.get(job_id)
+    if job is None:
+        return {'status': 'not_found', 'error': f'Job {job_id} not found'}
+    
+    future: Future = job['future']
+    if future.done():
+        job_status = 'failed' if future.exception() else 'finished'
+    elif future.running():
+        job_status = 'started'
+    else:
+        job_status = 'queued'
+    
+    status = {
+        'id': job_id,
+        'status': job_status,
+        'created_at': job['created_at'].isoformat(),
+        'started_at': job['started_at'].isoformat() if job['started_at'] else None,
+        'ended_at': job['ended_at'].isoformat() if job['ended_at'] else None,
+    }
+    
+    if job_status == 'finished':
+        status['result'] = future.result()
+    elif job_status == 'failed':
+        status['error'] = str(future.exception())
+    
+    return status
+
+
+def _run_without_worker(job_function, *args, error: Optional[str] = None, **kwargs):
+    """
+    Run a job that could not go to an RQ worker.
+    
+    Uses the local thread pool when LOCAL_JOB_WORKERS is set, and otherwise
+    runs the job synchronously.
+    
+    Returns:
+        Local job ID, or the synchronous result dict as from enqueue_job
+    """
+    if _LOCAL_JOB_WORKERS > 0:
+        return _submit_local_job(job_function, *args, **kwargs)
+    
+    result = job_function(*args, **kwargs)
+    status = {'status': 'completed', 'result': result, 'synchronous': True}
+    if error is not None:
+        status['error'] = error
+    return status
+
+
 def enqueue_job(job_function, *args, **kwargs):
-    """Enqueue a job and return job ID. Runs synchronously if no workers available."""
+    """Enqueue a job and return job ID. Runs in-process if no workers are available."""
     if queue and redis_conn:
         # Check if workers are actually available
         if not has_active_workers():
-            logger.warning("No active workers detected, running job synchronously")
-            result = job_function(*args, **kwargs)
-            return {'status': 'completed', 'result': result, 'synchronous': True}
+            logger.warning("No active workers detected, running job in-process")
+            return _run_without_worker(job_function, *args, **kwargs)
         
         try:
             # Use 5 minute timeout to ensure jobs complete quickly
-            job = queue.enqueue(job_function, *args, **kwargs, job_timeout='5m')
+            job = queue.enqueue(job_function, *args, job_timeout=_JOB_TIMEOUT, **kwargs)
             return job.id
         except Exception as e:
             logger.error(f"Failed to enqueue job: {e}")
-            # Fallback to synchronous
-            result = job_function(*args, **kwargs)
-            return {'status': 'completed', 'result': result, 'synchronous': True, 'error': str(e)}
+            _invalidate_worker_check()
+            return _run_without_worker(job_function, *args, error=str(e), **kwargs)
     else:
         # Fallback: run synchronously
         logger.warning("Queue not available, running job synchronously")
@@ -96,8 +231,53 @@ def enqueue_job(job_function, *args, **kwargs):
         return {'status': 'completed', 'result': result, 'synchronous': True}
 
 
+def enqueue_jobs_bulk(job_function, args_list: Sequence[Sequence[Any]]) -> List[Any]:
+    """
+    Enqueue one job per argument tuple, pipelining the Redis writes.
+    
+    Jobs are written with RQ's enqueue_many in pipelines of up to
+    _BULK_ENQUEUE_CHUNK_SIZE jobs, so N jobs cost one round-trip per chunk
+    instead of one per job. Falls back like enqueue_job when no workers or
+    no queue are available.
+    
+    Args:
+        job_function: Job function to run
+        args_list: Positional arguments for each job
+    
+    Returns:
+        List of job IDs (or synchronous results, as from enqueue_job), in order
+    """
+    if queue and redis_conn:
+        if not has_active_workers():
+            logger.warning("No active workers detected, running jobs in-process")
+            return [_run_without_worker(job_function, *args) for args in args_list]
+        
+        job_ids = []
+        for start in range(0, len(args_list), _BULK_ENQUEUE_CHUNK_SIZE):
+            chunk = args_list[start:start + _BULK_ENQUEUE_CHUNK_SIZE]
+            try:
+                job_datas = [
+                    Queue.prepare_data(job_function, args=tuple(args), timeout=_JOB_TIMEOUT)
+                    for args in chunk
+                ]
+                with redis_conn.pipeline(transaction=False) as pipe:
+                    jobs = queue.enqueue_many(job_datas, pipeline=pipe)
+                    pipe.execute()
+                job_ids.extend(job.id for job in jobs)
+            except Exception as e:
+                logger.error(f"Failed to enqueue job batch: {e}")
+                _invalidate_worker_check()
+                job_ids.extend(_run_without_worker(job_function, *args, error=str(e)) for args in chunk)
+        return job_ids
+    
+    return [enqueue_job(job_function, *args) for args in args_list]
+
+
 def get_job_status(job_id: str) -> Dict[str, Any]:
     """Get status of a job by ID."""
+    if job_id.startswith(_LOCAL_JOB_PREFIX):
+        return _get_local_job_status(job_id)
+    
     if not queue:
         return {'status': 'unknown', 'error': 'Queue not initialized'}
     
@@ -125,17 +305,30 @@ def get_job_status(job_id: str) -> Dict[str, Any]:
 
 
 def has_active_workers() -> bool:
-    """Check if there are active workers processing jobs."""
-    global redis_conn
+    """Check if there are active workers processing jobs (cached for a few seconds)."""
+    global _worker_check_cache
     if not redis_conn:
         return False
     
+    value, expires_at = _worker_check_cache
+    now = time.monotonic()
+    if now < expires_at:
+        return value
+    
     try:
-        # Check if any workers are registered in Redis
-        worker_keys = redis_conn.keys('rq:worker:*')
-        return len(worker_keys) > 0
+        # Check if any workers are registered in Redis; SCAN stops at the
+        # first match instead of listing every key like KEYS would
+        value = next(redis_conn.scan_iter(match='rq:worker:*', count=100), None) is not None
     except Exception:
-        return False
+        value = False
+    _worker_check_cache = (value, now + _WORKER_CHECK_TTL_SECONDS)
+    return value
+
+
+def _invalidate_worker_check() -> None:
+    """Force the next has_active_workers() call to query Redis."""
+    global _worker_check_cache
+    _worker_check_cache = (False, 0.0)
 
 
 def is_queue_available() -> bool:
@@ -0,0 +1,184 @@
+"""
+Redis stream buffer for send tracking records.
+
+When SEND_WRITES_STREAM is enabled, notification jobs publish their send
+records to a Redis stream instead of writing them to the database, and a
+single writer process (run_send_writer.py) drains the stream in batches.
+"""
+import os
+import time
+import logging
+from typing import Dict, Any, List, Tuple
+
+from jobs import queue_manager
+
+try:
+    from database.db_manager import SendDB
+except ImportError:
+    SendDB = None
+
+logger = logging.getLogger(__name__)
+
+SEND_STREAM = 'notif:writes'
+SEND_WRITER_GROUP = 'send-writer'
+# Entries the writer gave up on, kept with their original ID for replay
+SEND_DEAD_LETTER_STREAM = 'notif:writes:dead'
+
+# Approximate cap on the stream length, so an absent writer cannot grow it forever
+_STREAM_MAX_LEN = 100000
+# Records per pipeline round-trip when publishing
+_PUBLISH_CHUNK_SIZE = 100
+# Records per database batch, and how long the writer waits for them
+_WRITE_BATCH_SIZE = 500
+_WRITE_BLOCK_MS = 100
+_WRITE_RETRY_SECONDS = 1.0
+# Deliveries of a batch before its entries are written one at a time, with
+# the ones that still fail moved to the dead-letter stream
+_MAX_WRITE_ATTEMPTS = 5
+
+
+def is_stream_enabled() -> bool:
+    """Check if send records should be published to the Redis stream."""
+    return os.getenv('SEND_WRITES_STREAM', 'false').lower() in ('true', '1', 'yes')
+
+
+def _encode_send(send: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a send record into stream entry fields."""
+    return {
+        'campaign_id': send['campaign_id'],
+        'ad_variant_id': send['ad_variant_id'],
+        'recipient_id': send['recipient_id'],
+        'channel': send['channel'],
+        'success': 1 if send['success'] else 0
+    }
+
+
+def _decode_send(fields: Dict[str, str]) -> Dict[str, Any]:
+    """Rebuild a send record from stream entry fields."""
+    return {
+        'campaign_id': int(fields['campaign_id']),
+        'ad_variant_id': int(fields['ad_variant_id']),
+        'recipient_id': int(fields['recipient_id']),
+        'channel': fields['channel'],
+        'success': fields['success'] == '1'
+    }
+
+
+def publish_sends(sends: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Publish send records to the stream, pipelining the writes.
+    
+    Each chunk is sent as one MULTI/EXEC transaction and every XADD reply is
+    checked, so the records reported back are exactly the ones that did not
+    reach the stream.
+
+    Args:
+        sends: Send dicts with campaign_id, ad_variant_id, recipient_id,
+            channel and success
+
+    Returns:
+        Records that were not published; the caller should store them itself
+    """
+    conn = queue_manager.redis_conn
+    if conn is None:
+        return sends
+
+    unpublished = []
+    start = 0
+    try:
+        with conn.pipeline(transaction=True) as pipe:
+            for start in range(0, len(sends), _PUBLISH_CHUNK_SIZE):
+                chunk = sends[start:start + _PUBLISH_CHUNK_SIZE]
+                for send in chunk:
+                    pipe.xadd(SEND_STREAM, _encode_send(send), maxlen=_STREAM_MAX_LEN, approximate=True)
+                for send, result in zip(chunk, pipe.execute(raise_on_error=False)):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Failed to publish send to stream: {result}")
+                        unpublished.append(send)
+    except Exception as e:
+        # The transaction for this chunk was not applied
+        logger.warning(f"Failed to publish sends to stream: {e}")
+        unpublished.extend(sends[start:])
+    return unpublished
+
+
+def _delivery_count(conn, consumer_name: str, entry_ids: List[str]) -> int:
+    """Return the highest delivery count among pending entries, from XPENDING."""
+    pending = conn.xpending_range(
+        SEND_STREAM, SEND_WRITER_GROUP,
+        min=entry_ids[0], max=entry_ids[-1], count=len(entry_ids),
+        consumername=consumer_name
+    )
+    return max((entry['times_delivered'] for entry in pending), default=0)
+
+
+def _write_each_or_dead_letter(conn, entries: List[Tuple[str, Dict[str, str]]]) -> None:
+    """
+    Store entries one at a time, dead-lettering the ones that fail.
+    
+    Used once a batch has failed _MAX_WRITE_ATTEMPTS times, so a record the
+    database will never accept (e.g. for a deleted campaign) cannot hold up
+    the records behind it. Every entry is acknowledged afterwards.
+    
+    Args:
+        conn: Redis connection
+        entries: (entry_id, fields) pairs read from the send stream
+    """
+    for entry_id, fields in entries:
+        if SendDB.create_sends_with_events([_decode_send(fields)]):
+            continue
+        conn.xadd(
+            SEND_DEAD_LETTER_STREAM, {**fields, 'source_id': entry_id},
+            maxlen=_STREAM_MAX_LEN, approximate=True
+        )
+        logger.error(f"Moved send {entry_id} to {SEND_DEAD_LETTER_STREAM} after {_MAX_WRITE_ATTEMPTS} failed writes")
+    conn.xack(SEND_STREAM, SEND_WRITER_GROUP, *[entry_id for entry_id, _ in entries])
+
+
+def run_send_writer(consumer_name: str) -> None:
+    """
+    Drain the send stream into the database until interrupted.
+
+    Entries are read with a consumer group and acknowledged only once their
+    batch is stored; after a failed write the consumer re-reads its pending
+    entries before taking new ones. A batch that keeps failing is written
+    entry by entry once it has been delivered _MAX_WRITE_ATTEMPTS times, and
+    the entries that still fail go to the dead-letter stream.
+
+    Args:
+        consumer_name: Name of this writer within the consumer group
+    """
+    conn = queue_manager.redis_conn
+    if conn is None:
+        raise RuntimeError("Redis connection not initialized")
+    if SendDB is None:
+        raise RuntimeError("Database module not available")
+
+    try:
+        conn.xgroup_create(SEND_STREAM, SEND_WRITER_GROUP, id='0', mkstream=True)
+    except Exception as e:
+        if 'BUSYGROUP' not in str(e):
+            raise
+
+    # '0' reads this consumer's unacknowledged entries, '>' reads new ones
+    read_id = '0'
+    while True:
+        response = conn.xreadgroup(
+            SEND_WRITER_GROUP, consumer_name, {SEND_STREAM: read_id},
+            count=_WRITE_BATCH_SIZE, block=_WRITE_BLOCK_MS
+        )
+        entries = response[0][1] if response else []
+        if not entries:
+            read_id = '>'
+            continue
+
+        entry_ids = [entry_id for entry_id, _ in entries]
+        sends = [_decode_send(fields) for _, fields in entries]
+        if SendDB.create_sends_with_events(sends):
+            conn.xack(SEND_STREAM, SEND_WRITER_GROUP, *entry_ids)
+        elif _delivery_count(conn, consumer_name, entry_ids) >= _MAX_WRITE_ATTEMPTS:
+            _write_each_or_dead_letter(conn, entries)
+        else:
+            logger.error(f"Failed to store {len(sends)} sends, retrying")
+            read_id = '0'
+            time.sleep(_WRITE_RETRY_SECONDS)
@@ -3,7 +3,9 @@ Configuration utilities for the Notification Layer.
 """
 
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from pathlib import Path
 
 # Try to load .env file if python-dotenv is available
@@ -21,13 +23,21 @@ from .exceptions import ConfigurationError
 
 
 class NotificationConfig:
-    """Configuration manager for notification services."""
+    """Configuration manager for notification services.
+    
+    Each section is loaded once and kept as a read-only mapping, so the
+    accessors can return it without copying.
+    """
     
     def __init__(self):
         """Initialize configuration from environment variables."""
-        self.twilio_config = self._load_twilio_config()
-        self.sendgrid_config = self._load_sendgrid_config()
-        self.general_config = self._load_general_config()
+        self.twilio_config = MappingProxyType(self._load_twilio_config())
+        self.sendgrid_config = MappingProxyType(self._load_sendgrid_config())
+        self.general_config = MappingProxyType(self._load_general_config())
+        
+        # Provider configs: each provider section merged with the general settings
+        self.twilio_provider_config = MappingProxyType({**self.twilio_config, **self.general_config})
+        self.sendgrid_provider_config = MappingProxyType({**self.sendgrid_config, **self.general_config})
     
     def _load_twilio_config(self) -> Dict[str, Any]:
         """Load Twilio configuration from environment variables."""
@@ -35,6 +45,7 @@ class NotificationConfig:
             "account_sid": os.getenv("TWILIO_ACCOUNT_SID"),
             "auth_token": os.getenv("TWILIO_AUTH_TOKEN"),
             "phone_number": os.getenv("TWILIO_PHONE_NUMBER"),
+            "notify_service_sid": os.getenv("TWILIO_NOTIFY_SERVICE_SID"),
             "enabled": os.getenv("TWILIO_ENABLED", "true").lower() in ("true", "1", "yes")
         }
         
@@ -79,20 +90,29 @@ class NotificationConfig:
             "timeout": float(os.getenv("NOTIFICATION_TIMEOUT", "30.0")),
             "batch_size": int(os.getenv("NOTIFICATION_BATCH_SIZE", "100")),
             "rate_limit_per_minute": int(os.getenv("NOTIFICATION_RATE_LIMIT", "60")),
+            "max_concurrency": int(os.getenv("NOTIFICATION_MAX_CONCURRENCY", "32")),
             "log_level": os.getenv("NOTIFICATION_LOG_LEVEL", "INFO")
         }
     
-    def get_twilio_config(self) -> Dict[str, Any]:
-        """Get Twilio configuration."""
-        return self.twilio_config.copy()
+    def get_twilio_config(self) -> Mapping[str, Any]:
+        """Get Twilio configuration (read-only)."""
+        return self.twilio_config
+    
+    def get_sendgrid_config(self) -> Mapping[str, Any]:
+        """Get SendGrid configuration (read-only)."""
+        return self.sendgrid_config
     
-    def get_sendgrid_config(self) -> Dict[str, Any]:
-        """Get SendGrid configuration."""
-        return self.sendgrid_config.copy()
+    def get_general_config(self) -> Mapping[str, Any]:
+        """Get general configuration (read-only)."""
+        return self.general_config
     
-    def get_general_config(self) -> Dict[str, Any]:
-        """Get general configuration."""
-        return self.general_config.copy()
+    def get_twilio_provider_config(self) -> Mapping[str, Any]:
+        """Get Twilio configuration merged with the general settings (read-only)."""
+        return self.twilio_provider_config
+    
+    def get_sendgrid_provider_config(self) -> Mapping[str, Any]:
+        """Get SendGrid configuration merged with the general settings (read-only)."""
+        return self.sendgrid_provider_config
     
     def is_twilio_enabled(self) -> bool:
         """Check if Twilio is enabled."""
@@ -126,3 +146,9 @@ class NotificationConfig:
         # Validate rate limit
         if self.general_config["rate_limit_per_minute"] <= 0:
             raise ConfigurationError("Rate limit must be positive")
+
+
+@lru_cache(maxsize=1)
+def get_notification_config() -> NotificationConfig:
+    """Get the notification configuration, loaded from the environment once per process."""
+    return NotificationConfig()
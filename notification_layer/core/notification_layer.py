@@ -4,11 +4,21 @@ Main notification layer implementation.
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Union
+import itertools
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
 
-from ..config import NotificationConfig
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+
+from ..config import NotificationConfig, get_notification_config
 from ..providers.twilio_provider import TwilioSMSProvider
 from ..providers.sendgrid_provider import SendGridEmailProvider
 from ..models.message_models import SMSMessage, EmailMessage, NotificationResult
@@ -16,6 +26,100 @@ from ..models.notification_types import NotificationType, NotificationStatus
 from ..exceptions import NotificationError, ConfigurationError, ValidationError
 
 
+@lru_cache(maxsize=4)
+def _get_session(pool_size: int, retry_attempts: int):
+    """
+    Get the pooled HTTP session for the given settings, shared process-wide.
+    
+    Args:
+        pool_size: Connections to keep per host
+        retry_attempts: Retries for failed connections and idempotent requests
+    
+    Returns:
+        requests.Session, or None if requests is not installed
+    """
+    if requests is None:
+        return None
+    
+    # Retry only failed connections and idempotent requests, so a send
+    # is never posted twice
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retry_attempts, backoff_factor=0.2)
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=4)
+def _get_twilio_provider(config_items: tuple) -> TwilioSMSProvider:
+    """Get the Twilio provider for a configuration, shared process-wide."""
+    config = dict(config_items)
+    session = _get_session(config.get("max_concurrency", 32), config["retry_attempts"])
+    return TwilioSMSProvider(config, session=session)
+
+
+@lru_cache(maxsize=4)
+def _get_sendgrid_provider(config_items: tuple) -> SendGridEmailProvider:
+    """Get the SendGrid provider for a configuration, shared process-wide."""
+    config = dict(config_items)
+    session = _get_session(config.get("max_concurrency", 32), config["retry_attempts"])
+    return SendGridEmailProvider(config, session=session)
+
+
+def _default_concurrency(provider) -> int:
+    """Default number of sends in flight: about ten seconds' worth of the provider's rate limit."""
+    return provider.get_rate_limit() * 10 // 60
+
+
+class _AsyncRateLimiter:
+    """
+    Token bucket limiting sends to max_rate per time_period seconds.
+    
+    Up to max_rate sends may go out at once; after that tokens refill
+    steadily. Waiters sleep instead of holding a thread, and nothing is
+    bound to a particular event loop.
+    """
+    
+    def __init__(self, max_rate: int, time_period: float = 60.0):
+        self.max_rate = max(1, max_rate)
+        self._refill_per_second = self.max_rate / time_period
+        self._tokens = float(self.max_rate)
+        self._updated_at = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_rate,
+                self._tokens + (now - self._updated_at) * self._refill_per_second
+            )
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+    
+    async def __aenter__(self) -> "_AsyncRateLimiter":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def _in_message_order(indexed_results: Iterator[Tuple[int, NotificationResult]],
+                      count: int) -> List[NotificationResult]:
+    """Collect (message index, result) pairs into a list in message order."""
+    results: List[Optional[NotificationResult]] = [None] * count
+    for index, result in indexed_results:
+        results[index] = result
+    return results
+
+
 class NotificationLayer:
     """Main notification layer for sending SMS and email notifications."""
     
@@ -24,17 +128,27 @@ class NotificationLayer:
         Initialize the notification layer.
         
         Args:
-            config: Notification configuration. If None, loads from environment.
+            config: Notification configuration. If None, uses the configuration
+                loaded from the environment.
         """
-        self.config = config or NotificationConfig()
+        self.config = config or get_notification_config()
         self.logger = logging.getLogger(__name__)
         
         # Initialize providers
         self.providers = {}
         self._initialize_providers()
+        self._sms = self.providers.get(NotificationType.SMS)
+        self._email = self.providers.get(NotificationType.EMAIL)
+        
+        # Per-provider token buckets for async bulk sends, created on first use
+        self._rate_limiters: Dict[Any, _AsyncRateLimiter] = {}
         
-        # Initialize thread pool for async operations
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Thread pool shared by all concurrent sends; bulk sends bound their
+        # own concurrency below this
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.config.get_general_config().get("max_concurrency", 32),
+            thread_name_prefix="notification"
+        )
         
         # Validate configuration
         self.config.validate_config()
@@ -42,20 +156,24 @@ class NotificationLayer:
         self.logger.info("Notification layer initialized successfully")
     
     def _initialize_providers(self) -> None:
-        """Initialize available notification providers."""
+        """Initialize available notification providers.
+        
+        Providers (and their SDK clients and HTTP session) are shared by
+        every NotificationLayer in the process with the same configuration.
+        """
         try:
             # Initialize Twilio SMS provider
             if self.config.is_twilio_enabled():
-                twilio_config = self.config.get_twilio_config()
-                twilio_config.update(self.config.get_general_config())
-                self.providers[NotificationType.SMS] = TwilioSMSProvider(twilio_config)
+                self.providers[NotificationType.SMS] = _get_twilio_provider(
+                    tuple(sorted(self.config.get_twilio_provider_config().items()))
+                )
                 self.logger.info("Twilio SMS provider initialized")
             
             # Initialize SendGrid email provider
             if self.config.is_sendgrid_enabled():
-                sendgrid_config = self.config.get_sendgrid_config()
-                sendgrid_config.update(self.config.get_general_config())
-                self.providers[NotificationType.EMAIL] = SendGridEmailProvider(sendgrid_config)
+                self.providers[NotificationType.EMAIL] = _get_sendgrid_provider(
+                    tuple(sorted(self.config.get_sendgrid_provider_config().items()))
+                )
                 self.logger.info("SendGrid email provider initialized")
             
             if not self.providers:
@@ -76,7 +194,7 @@ class NotificationLayer:
         Returns:
             NotificationResult with delivery status
         """
-        if NotificationType.SMS not in self.providers:
+        if self._sms is None:
             raise NotificationError("SMS provider not available")
         
         # Create SMS message
@@ -87,10 +205,9 @@ class NotificationLayer:
         }
         
         try:
-            provider = self.providers[NotificationType.SMS]
-            return provider.send_notification(sms_data)
+            return self._sms.send_notification(sms_data)
         except Exception as e:
-            self.logger.error(f"Failed to send SMS: {e}")
+            self.logger.error("Failed to send SMS: %s", e)
             return NotificationResult(
                 success=False,
                 status=NotificationStatus.FAILED,
@@ -110,7 +227,7 @@ class NotificationLayer:
         Returns:
             NotificationResult with delivery status
         """
-        if NotificationType.EMAIL not in self.providers:
+        if self._email is None:
             raise NotificationError("Email provider not available")
         
         # Create email message
@@ -122,10 +239,9 @@ class NotificationLayer:
         }
         
         try:
-            provider = self.providers[NotificationType.EMAIL]
-            return provider.send_notification(email_data)
+            return self._email.send_notification(email_data)
         except Exception as e:
-            self.logger.error(f"Failed to send email: {e}")
+            self.logger.error("Failed to send email: %s", e)
             return NotificationResult(
                 success=False,
                 status=NotificationStatus.FAILED,
@@ -133,84 +249,194 @@ class NotificationLayer:
             )
     
     def send_bulk_sms(self, messages: List[Dict[str, Any]], 
-                     max_workers: int = 4) -> List[NotificationResult]:
+                     max_workers: Optional[int] = None) -> List[NotificationResult]:
         """
         Send multiple SMS messages concurrently.
         
         Args:
             messages: List of SMS message dictionaries
-            max_workers: Maximum number of concurrent workers
+            max_workers: Maximum number of sends in flight. If None, derived
+                from the provider's rate limit.
             
         Returns:
-            List of NotificationResult objects
+            List of NotificationResult objects, in message order
+        """
+        return _in_message_order(self.send_bulk_sms_iter(messages, max_workers), len(messages))
+    
+    def send_bulk_email(self, messages: List[Dict[str, Any]], 
+                       max_workers: Optional[int] = None) -> List[NotificationResult]:
+        """
+        Send multiple email messages concurrently.
+        
+        Args:
+            messages: List of email message dictionaries
+            max_workers: Maximum number of sends in flight. If None, derived
+                from the provider's rate limit.
+            
+        Returns:
+            List of NotificationResult objects, in message order
+        """
+        return _in_message_order(self.send_bulk_email_iter(messages, max_workers), len(messages))
+    
+    def send_bulk_sms_iter(self, messages: Iterable[Dict[str, Any]],
+                           max_workers: Optional[int] = None) -> Iterator[Tuple[int, NotificationResult]]:
+        """
+        Send multiple SMS messages concurrently, yielding results as they complete.
+        
+        Args:
+            messages: SMS message dictionaries
+            max_workers: Maximum number of sends in flight. If None, derived
+                from the provider's rate limit.
+            
+        Yields:
+            (message index, NotificationResult) tuples, in completion order
         """
-        if NotificationType.SMS not in self.providers:
+        if self._sms is None:
             raise NotificationError("SMS provider not available")
         
-        results = []
-        provider = self.providers[NotificationType.SMS]
+        return self._send_bulk_iter(self._sms, messages, max_workers, "SMS")
+    
+    def send_bulk_email_iter(self, messages: Iterable[Dict[str, Any]],
+                             max_workers: Optional[int] = None) -> Iterator[Tuple[int, NotificationResult]]:
+        """
+        Send multiple email messages concurrently, yielding results as they complete.
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all messages
-            future_to_message = {
-                executor.submit(provider.send_notification, message): message 
-                for message in messages
-            }
+        Args:
+            messages: Email message dictionaries
+            max_workers: Maximum number of sends in flight. If None, derived
+                from the provider's rate limit.
             
-            # Collect results as they complete
-            for future in as_completed(future_to_message):
+        Yields:
+            (message index, NotificationResult) tuples, in completion order
+        """
+        if self._email is None:
+            raise NotificationError("Email provider not available")
+        
+        return self._send_bulk_iter(self._email, messages, max_workers, "email")
+    
+    def _send_bulk_iter(self, provider, messages: Iterable[Dict[str, Any]],
+                        max_workers: Optional[int], label: str) -> Iterator[Tuple[int, NotificationResult]]:
+        """
+        Send messages on the shared thread pool, keeping at most max_workers in flight.
+        
+        Messages are consumed lazily and each result is yielded as soon as
+        its send finishes, so only the sends in flight are held in memory.
+        
+        Args:
+            provider: Provider to send with
+            messages: Message dictionaries
+            max_workers: Maximum number of sends in flight, or None
+            label: Channel name used in log messages
+            
+        Yields:
+            (message index, NotificationResult) tuples, in completion order
+        """
+        limit = max(1, _default_concurrency(provider) if max_workers is None else max_workers)
+        pending = {}
+        indexed_messages = enumerate(messages)
+        
+        while True:
+            for index, message in itertools.islice(indexed_messages, limit - len(pending)):
+                pending[self.executor.submit(provider.send_notification, message)] = index
+            if not pending:
+                return
+            
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
                 try:
-                    result = future.result()
-                    results.append(result)
+                    yield index, future.result()
                 except Exception as e:
-                    self.logger.error(f"Bulk SMS failed for message: {e}")
-                    results.append(NotificationResult(
+                    self.logger.error("Bulk %s failed for message: %s", label, e)
+                    yield index, NotificationResult(
                         success=False,
                         status=NotificationStatus.FAILED,
                         error_message=str(e)
-                    ))
+                    )
+    
+    async def send_bulk_sms_async(self, messages: List[Dict[str, Any]],
+                                  max_concurrency: Optional[int] = None) -> List[NotificationResult]:
+        """
+        Send multiple SMS messages concurrently from an event loop.
         
-        return results
+        Args:
+            messages: List of SMS message dictionaries
+            max_concurrency: Optional cap on sends in flight; sends are
+                always paced by the provider's rate limit.
+            
+        Returns:
+            List of NotificationResult objects, in message order
+        """
+        if self._sms is None:
+            raise NotificationError("SMS provider not available")
+        
+        return await self._send_bulk_async(self._sms, messages, max_concurrency, "SMS")
     
-    def send_bulk_email(self, messages: List[Dict[str, Any]], 
-                       max_workers: int = 4) -> List[NotificationResult]:
+    async def send_bulk_email_async(self, messages: List[Dict[str, Any]],
+                                    max_concurrency: Optional[int] = None) -> List[NotificationResult]:
         """
-        Send multiple email messages concurrently.
+        Send multiple email messages concurrently from an event loop.
         
         Args:
             messages: List of email message dictionaries
-            max_workers: Maximum number of concurrent workers
+            max_concurrency: Optional cap on sends in flight; sends are
+                always paced by the provider's rate limit.
             
         Returns:
-            List of NotificationResult objects
+            List of NotificationResult objects, in message order
         """
-        if NotificationType.EMAIL not in self.providers:
+        if self._email is None:
             raise NotificationError("Email provider not available")
         
-        results = []
-        provider = self.providers[NotificationType.EMAIL]
+        return await self._send_bulk_async(self._email, messages, max_concurrency, "email")
+    
+    async def _send_bulk_async(self, provider, messages: List[Dict[str, Any]],
+                               max_concurrency: Optional[int], label: str) -> List[NotificationResult]:
+        """
+        Send messages through a provider at the provider's rate limit.
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all messages
-            future_to_message = {
-                executor.submit(provider.send_notification, message): message 
-                for message in messages
-            }
+        Each send first takes a token from the provider's token bucket, so
+        throughput follows rate_limit_per_minute rather than a worker count.
+        Sends go through the provider's send_notification_async, which
+        runs the blocking SDK call on the layer's shared thread pool unless
+        the provider has a native async client.
+        
+        Args:
+            provider: Provider to send with
+            messages: List of message dictionaries
+            max_concurrency: Optional cap on sends in flight, on top of the
+                rate limit
+            label: Channel name used in log messages
             
-            # Collect results as they complete
-            for future in as_completed(future_to_message):
+        Returns:
+            List of NotificationResult objects, in message order
+        """
+        limiter = self._rate_limiters.get(provider)
+        if limiter is None:
+            limiter = _AsyncRateLimiter(provider.get_rate_limit())
+            self._rate_limiters[provider] = limiter
+        semaphore = asyncio.Semaphore(max(1, max_concurrency)) if max_concurrency is not None else None
+        
+        async def send(message: Dict[str, Any]) -> NotificationResult:
+            async with limiter:
                 try:
-                    result = future.result()
-                    results.append(result)
+                    return await provider.send_notification_async(message, self.executor)
                 except Exception as e:
-                    self.logger.error(f"Bulk email failed for message: {e}")
-                    results.append(NotificationResult(
+                    self.logger.error("Bulk %s failed for message: %s", label, e)
+                    return NotificationResult(
                         success=False,
                         status=NotificationStatus.FAILED,
                         error_message=str(e)
-                    ))
+                    )
         
-        return results
+        async def send_one(message: Dict[str, Any]) -> NotificationResult:
+            if semaphore is None:
+                return await send(message)
+            async with semaphore:
+                return await send(message)
+        
+        # gather() keeps message order so callers can match results up
+        return list(await asyncio.gather(*(send_one(message) for message in messages)))
     
     def send_to_user_list(self, user_list: List[Dict[str, Any]], 
                          message_content: str, 
@@ -231,35 +457,44 @@ class NotificationLayer:
         if notification_type not in self.providers:
             raise NotificationError(f"{notification_type.value} provider not available")
         
-        messages = []
-        
-        for user in user_list:
-            if notification_type == NotificationType.SMS:
-                if "phone" not in user:
-                    continue
-                messages.append({
-                    "to_phone": user["phone"],
-                    "message": message_content,
-                    **kwargs
-                })
-            elif notification_type == NotificationType.EMAIL:
-                if "email" not in user:
-                    continue
-                messages.append({
-                    "to_email": user["email"],
-                    "subject": kwargs.get("subject", "Notification"),
-                    "content": message_content,
-                    **kwargs
-                })
+        # Fields shared by every message are built once; each message only
+        # adds its recipient
+        if notification_type == NotificationType.SMS:
+            contact_field, recipient_key = "phone", "to_phone"
+            template = {"message": message_content, **kwargs}
+        elif notification_type == NotificationType.EMAIL:
+            contact_field, recipient_key = "email", "to_email"
+            template = {
+                "subject": kwargs.get("subject", "Notification"),
+                "content": message_content,
+                **kwargs
+            }
+        else:
+            contact_field, recipient_key, template = None, None, {}
+        
+        messages = [
+            {recipient_key: user[contact_field], **template}
+            for user in user_list
+            if contact_field in user
+        ]
         
         if not messages:
             self.logger.warning("No valid recipients found in user list")
             return []
         
-        # Send messages using appropriate bulk method
+        # Send messages using appropriate bulk method; a plain SMS to many
+        # users goes out as one broadcast when the provider supports it, and
+        # email as batched requests when the provider supports them
         if notification_type == NotificationType.SMS:
+            provider = self._sms
+            if not kwargs and hasattr(provider, 'supports_broadcast') and provider.supports_broadcast():
+                return provider.send_broadcast(
+                    [message["to_phone"] for message in messages], message_content
+                )
             return self.send_bulk_sms(messages)
         else:
+            if hasattr(self._email, 'send_batch'):
+                return self._email.send_batch(messages)
             return self.send_bulk_email(messages)
     
     def get_provider_status(self) -> Dict[str, Any]:
@@ -277,8 +512,8 @@ class NotificationLayer:
         for notification_type, provider in self.providers.items():
             provider_status = {
                 "enabled": provider.is_enabled(),
-                "name": provider.get_provider_name(),
-                "supported_type": provider.get_supported_type().value
+                "name": provider.PROVIDER_NAME,
+                "supported_type": provider.SUPPORTED_TYPE.value
             }
             
             # Add provider-specific status
@@ -293,6 +528,8 @@ class NotificationLayer:
     
     def close(self) -> None:
         """Close the notification layer and cleanup resources."""
+        # Providers and their HTTP session are shared process-wide, so only
+        # this layer's own thread pool is shut down
         if hasattr(self, 'executor'):
             self.executor.shutdown(wait=True)
         self.logger.info("Notification layer closed")
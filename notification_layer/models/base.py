@@ -9,7 +9,23 @@ from dataclasses import dataclass
 
 
 class BaseNotificationModel(ABC):
-    """Base class for notification models."""
+    """Base class for notification models.
+    
+    Subclasses are slotted dataclasses, so instances have no __dict__; the
+    public field names are collected once per class for to_dict().
+    """
+    
+    __slots__ = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Record the public field names declared by the class and its bases."""
+        super().__init_subclass__(**kwargs)
+        names = {}
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__annotations__', {}):
+                if not name.startswith('_'):
+                    names[name] = None
+        cls._field_names = tuple(names)
     
     def __init__(self, **kwargs):
         """Initialize the model with provided kwargs."""
@@ -20,12 +36,12 @@ class BaseNotificationModel(ABC):
     def to_dict(self) -> Dict[str, Any]:
         """Convert the model to a dictionary."""
         result = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith('_'):
-                if isinstance(value, datetime):
-                    result[key] = value.isoformat()
-                else:
-                    result[key] = value
+        for key in self._field_names:
+            value = getattr(self, key)
+            if isinstance(value, datetime):
+                result[key] = value.isoformat()
+            else:
+                result[key] = value
         return result
     
     @abstractmethod
@@ -39,7 +55,7 @@ class BaseNotificationModel(ABC):
         return f"{self.__class__.__name__}({attrs})"
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationMetadata:
     """Metadata for notifications."""
     created_at: datetime
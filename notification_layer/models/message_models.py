@@ -3,22 +3,89 @@ Message models for SMS and Email notifications.
 """
 
 import re
-from typing import Optional, Dict, Any, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, Iterator, List
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, fields
 
 from .base import BaseNotificationModel, NotificationMetadata
 from .notification_types import NotificationType, NotificationStatus, Priority
 from ..exceptions import ValidationError
+from ..utils.fast_validate import NUMBA_AVAILABLE, is_e164, is_email
 
+# Optional linear-time regex engine for the validation patterns
+try:
+    import re2
+except ImportError:
+    re2 = None
 
-@dataclass
+_regex = re2 or re
+
+# Validation patterns, compiled once at import
+_EMAIL_RE = _regex.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_RE = _regex.compile(r'^https?://.+')
+# The email pattern applied to each line of a newline-joined batch
+_EMAIL_LINES_RE = _regex.compile(r'(?m)^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Separators dropped from phone numbers before matching
+_PHONE_STRIP = str.maketrans('', '', ' -')
+
+# Creation time shared by the messages built inside bulk_timestamp()
+_bulk_now: ContextVar[Optional[datetime]] = ContextVar('_bulk_now', default=None)
+
+
+@contextmanager
+def bulk_timestamp(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Stamp every message created in this block with one creation time.
+    
+    Args:
+        now: Timestamp to use. If None, the current time.
+        
+    Yields:
+        The shared timestamp
+    """
+    now = now or datetime.now()
+    token = _bulk_now.set(now)
+    try:
+        yield now
+    finally:
+        _bulk_now.reset(token)
+
+
+def _valid_phone(phone: str) -> bool:
+    """Check a separator-free phone number: an optional '+', then 2-15 digits not starting with 0."""
+    if NUMBA_AVAILABLE:
+        return is_e164(phone.encode())
+    # The shape is simple enough to check directly, without a regex match
+    start = 1 if phone.startswith('+') else 0
+    return (
+        2 <= len(phone) - start <= 15
+        and phone[start] in '123456789'
+        and phone[start + 1:].isdecimal()
+    )
+
+
+def _valid_email(address: str) -> bool:
+    """Check an email address; the compiled scanner, when available, accepts the common case."""
+    if NUMBA_AVAILABLE and is_email(address.encode()):
+        return True
+    return _EMAIL_RE.match(address) is not None
+
+
+def _created_at() -> datetime:
+    """Creation time for a new message: the bulk timestamp if one is set."""
+    return _bulk_now.get() or datetime.now()
+
+
+@dataclass(slots=True)
 class SMSMessage(BaseNotificationModel):
     """Model for SMS messages."""
     to_phone: str
     message: str
     from_phone: Optional[str] = None
-    media_urls: Optional[List[str]] = field(default_factory=list)
+    media_urls: Optional[List[str]] = None
     status: NotificationStatus = NotificationStatus.PENDING
     priority: Priority = Priority.NORMAL
     metadata: Optional[NotificationMetadata] = None
@@ -28,7 +95,7 @@ class SMSMessage(BaseNotificationModel):
     def __post_init__(self):
         """Post-initialization processing."""
         if self.created_at is None:
-            self.created_at = datetime.now()
+            self.created_at = _created_at()
         if self.metadata is None:
             self.metadata = NotificationMetadata(created_at=self.created_at)
     
@@ -41,8 +108,7 @@ class SMSMessage(BaseNotificationModel):
             raise ValidationError("SMS message content is required")
         
         # Basic phone number validation (can be enhanced)
-        phone_pattern = r'^\+?[1-9]\d{1,14}$'
-        if not re.match(phone_pattern, self.to_phone.replace(' ', '').replace('-', '')):
+        if not _valid_phone(self.to_phone.translate(_PHONE_STRIP)):
             raise ValidationError("Invalid phone number format")
         
         if len(self.message) > 1600:  # SMS character limit
@@ -50,13 +116,12 @@ class SMSMessage(BaseNotificationModel):
         
         # Validate media URLs if provided
         if self.media_urls:
-            url_pattern = r'^https?://.+'
             for url in self.media_urls:
-                if not re.match(url_pattern, url):
+                if not _URL_RE.match(url):
                     raise ValidationError(f"Invalid media URL: {url}")
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailMessage(BaseNotificationModel):
     """Model for email messages."""
     to_email: str
@@ -65,9 +130,9 @@ class EmailMessage(BaseNotificationModel):
     from_email: Optional[str] = None
     from_name: Optional[str] = None
     html_content: Optional[str] = None
-    attachments: Optional[List[Dict[str, Any]]] = field(default_factory=list)
-    cc_emails: Optional[List[str]] = field(default_factory=list)
-    bcc_emails: Optional[List[str]] = field(default_factory=list)
+    attachments: Optional[List[Dict[str, Any]]] = None
+    cc_emails: Optional[List[str]] = None
+    bcc_emails: Optional[List[str]] = None
     reply_to: Optional[str] = None
     status: NotificationStatus = NotificationStatus.PENDING
     priority: Priority = Priority.NORMAL
@@ -78,12 +143,47 @@ class EmailMessage(BaseNotificationModel):
     def __post_init__(self):
         """Post-initialization processing."""
         if self.created_at is None:
-            self.created_at = datetime.now()
+            self.created_at = _created_at()
         if self.metadata is None:
             self.metadata = NotificationMetadata(created_at=self.created_at)
     
     def validate(self) -> None:
         """Validate email message data."""
+        self._validate(check_to_email=True)
+    
+    @staticmethod
+    def validate_batch(messages: List["EmailMessage"]) -> List[Optional[ValidationError]]:
+        """
+        Validate many email messages, checking all recipient addresses at once.
+        
+        The recipient addresses are matched in one pass over the
+        newline-joined batch; only if some fail is each one checked again.
+        
+        Args:
+            messages: Email messages to validate
+            
+        Returns:
+            The ValidationError for each message, or None where it is valid
+        """
+        addresses = '\n'.join(message.to_email or '' for message in messages)
+        # An address containing a newline would split into extra lines
+        addresses_valid = (
+            addresses.count('\n') == len(messages) - 1
+            and len(_EMAIL_LINES_RE.findall(addresses)) == len(messages)
+        )
+        
+        errors: List[Optional[ValidationError]] = []
+        for message in messages:
+            try:
+                message._validate(check_to_email=not addresses_valid)
+            except ValidationError as e:
+                errors.append(e)
+            else:
+                errors.append(None)
+        return errors
+    
+    def _validate(self, check_to_email: bool) -> None:
+        """Validate email message data, optionally skipping the recipient format check."""
         if not self.to_email:
             raise ValidationError("Recipient email is required")
         
@@ -94,25 +194,24 @@ class EmailMessage(BaseNotificationModel):
             raise ValidationError("Email content or HTML content is required")
         
         # Basic email validation
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, self.to_email):
+        if check_to_email and not _valid_email(self.to_email):
             raise ValidationError("Invalid email format")
         
         # Validate CC and BCC emails
-        for email in self.cc_emails or []:
-            if not re.match(email_pattern, email):
+        for email in self.cc_emails or ():
+            if not _valid_email(email):
                 raise ValidationError(f"Invalid CC email format: {email}")
         
-        for email in self.bcc_emails or []:
-            if not re.match(email_pattern, email):
+        for email in self.bcc_emails or ():
+            if not _valid_email(email):
                 raise ValidationError(f"Invalid BCC email format: {email}")
         
         # Validate reply-to email
-        if self.reply_to and not re.match(email_pattern, self.reply_to):
+        if self.reply_to and not _valid_email(self.reply_to):
             raise ValidationError(f"Invalid reply-to email format: {self.reply_to}")
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationResult:
     """Result of a notification attempt."""
     success: bool
@@ -120,17 +219,28 @@ class NotificationResult:
     status: NotificationStatus = NotificationStatus.PENDING
     error_message: Optional[str] = None
     provider_response: Optional[Dict[str, Any]] = None
-    delivery_time: Optional[datetime] = None
+    delivery_time_ns: Optional[int] = None  # time.time_ns() when the send was accepted
     retry_after: Optional[int] = None  # seconds to wait before retry
     
+    @property
+    def delivery_time(self) -> Optional[datetime]:
+        """Delivery time as a local datetime, built only when asked for."""
+        if self.delivery_time_ns is None:
+            return None
+        return datetime.fromtimestamp(self.delivery_time_ns / 1e9)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary."""
         return {
             "success": self.success,
             "message_id": self.message_id,
-            "status": self.status.value,
+            "status": self.status,
             "error_message": self.error_message,
             "provider_response": self.provider_response,
-            "delivery_time": self.delivery_time.isoformat() if self.delivery_time else None,
+            "delivery_time": self.delivery_time.isoformat() if self.delivery_time_ns is not None else None,
             "retry_after": self.retry_after
         }
+
+
+# Field names in declaration order, like the message models' _field_names
+NotificationResult._field_names = tuple(f.name for f in fields(NotificationResult))
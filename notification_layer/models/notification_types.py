@@ -2,8 +2,8 @@
 Notification type definitions and enums.
 """
 
-from enum import Enum
-from typing import Dict, Any
+from enum import Enum, IntEnum, StrEnum
+from typing import Dict, Any, Tuple
 
 
 class NotificationType(Enum):
@@ -12,8 +12,8 @@ class NotificationType(Enum):
     EMAIL = "email"
 
 
-class NotificationStatus(Enum):
-    """Status of notification delivery."""
+class NotificationStatus(StrEnum):
+    """Status of notification delivery; each member is its own string value."""
     PENDING = "pending"
     SENT = "sent"
     DELIVERED = "delivered"
@@ -22,12 +22,12 @@ class NotificationStatus(Enum):
     CANCELLED = "cancelled"
 
 
-class Priority(Enum):
-    """Priority levels for notifications."""
-    LOW = "low"
-    NORMAL = "normal"
-    HIGH = "high"
-    URGENT = "urgent"
+class Priority(IntEnum):
+    """Priority levels for notifications, ordered from lowest to highest."""
+    LOW = 1
+    NORMAL = 2
+    HIGH = 3
+    URGENT = 4
 
 
 class DeliveryChannel(Enum):
@@ -46,10 +46,6 @@ STATUS_MESSAGES: Dict[NotificationStatus, str] = {
     NotificationStatus.CANCELLED: "Notification was cancelled"
 }
 
-# Priority weights for queue processing
-PRIORITY_WEIGHTS: Dict[Priority, int] = {
-    Priority.LOW: 1,
-    Priority.NORMAL: 2,
-    Priority.HIGH: 3,
-    Priority.URGENT: 4
-}
+# Priority weights for queue processing, indexed by priority:
+# PRIORITY_WEIGHTS[priority] avoids hashing the enum member
+PRIORITY_WEIGHTS: Tuple[int, ...] = (0, 1, 2, 3, 4)
@@ -2,14 +2,23 @@
 Base provider class for notification services.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from concurrent.futures import Executor
+from typing import ClassVar, Dict, Any, List, Optional
 from ..models.message_models import NotificationResult
 from ..models.notification_types import NotificationType
 
 
 class BaseNotificationProvider(ABC):
-    """Base class for notification providers."""
+    """Base class for notification providers.
+    
+    Subclasses set PROVIDER_NAME and SUPPORTED_TYPE; dispatchers can read
+    these class attributes directly instead of calling the getters.
+    """
+    
+    PROVIDER_NAME: ClassVar[str]
+    SUPPORTED_TYPE: ClassVar[NotificationType]
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -39,15 +48,49 @@ class BaseNotificationProvider(ABC):
         """
         pass
     
-    @abstractmethod
+    async def send_notification_async(self, message_data: Dict[str, Any],
+                                      executor: Optional[Executor] = None) -> NotificationResult:
+        """
+        Send a notification without blocking the event loop.
+        
+        The SDK clients are blocking, so by default the send runs on an
+        executor; providers with a native async client can override this.
+        
+        Args:
+            message_data: Message data to send
+            executor: Executor to run the send on. If None, the event
+                loop's default executor.
+            
+        Returns:
+            NotificationResult with delivery status
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.send_notification, message_data)
+    
+    async def send_many(self, messages: List[Dict[str, Any]],
+                        executor: Optional[Executor] = None) -> List[NotificationResult]:
+        """
+        Send many notifications concurrently.
+        
+        Args:
+            messages: Message data for each notification
+            executor: Executor to run the sends on, as for
+                send_notification_async
+            
+        Returns:
+            List of NotificationResult objects, in message order
+        """
+        return list(await asyncio.gather(
+            *(self.send_notification_async(message, executor) for message in messages)
+        ))
+    
     def get_provider_name(self) -> str:
         """Get the name of the provider."""
-        pass
+        return self.PROVIDER_NAME
     
-    @abstractmethod
     def get_supported_type(self) -> NotificationType:
         """Get the notification type this provider supports."""
-        pass
+        return self.SUPPORTED_TYPE
     
     def is_enabled(self) -> bool:
         """Check if the provider is enabled."""
@@ -3,9 +3,11 @@ SendGrid email provider for sending email notifications.
 """
 
 import logging
+import re
 import ssl
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import time
+from collections import namedtuple
+from typing import Dict, Any, Optional, List, Union
 
 # Handle SSL certificate issues on Windows
 try:
@@ -32,25 +34,93 @@ except ImportError:
     SendGridException = Exception
 
 from .base_provider import BaseNotificationProvider
-from ..models.message_models import NotificationResult, EmailMessage
+from ..models.message_models import NotificationResult, EmailMessage, bulk_timestamp
 from ..models.notification_types import NotificationType, NotificationStatus
 from ..exceptions import EmailDeliveryError, AuthenticationError, RateLimitError
 
 
+# SendGrid accepts at most this many personalizations per mail send request
+_MAX_PERSONALIZATIONS = 1000
+
+# Error classifier: group 1 matches authentication failures, group 2 rate limiting
+_ERR_CLASSIFY = re.compile(r'(authentication|unauthorized)|(rate limit)', re.IGNORECASE)
+
+# Mail send endpoint, relative to the client's API host
+_MAIL_SEND_PATH = "/v3/mail/send"
+
+# The parts of an SDK response that the send paths read
+_SessionResponse = namedtuple("_SessionResponse", ["status_code", "headers", "body"])
+
+
+class MailTemplate:
+    """
+    SendGrid request body for emails that differ only in their recipient.
+    
+    The Mail and its helper objects are built and serialized once; each
+    send then only adds the recipients' personalizations.
+    """
+    
+    __slots__ = ("body", "_personalization")
+    
+    def __init__(self, mail: Mail):
+        """
+        Initialize the template from a Mail.
+        
+        Args:
+            mail: Mail to copy everything but the "to" recipients from
+        """
+        body = mail.get()
+        personalizations = body.pop("personalizations", None) or [{}]
+        # CC and BCC stay with every recipient's personalization
+        self._personalization = {
+            key: value for key, value in personalizations[0].items() if key != "to"
+        }
+        self.body = body
+    
+    def for_recipients(self, to_emails: List[str]) -> Dict[str, Any]:
+        """
+        Build the request body sending this email to each recipient.
+        
+        Args:
+            to_emails: Recipient email addresses
+            
+        Returns:
+            Mail send request body with one personalization per recipient
+        """
+        return {
+            **self.body,
+            "personalizations": [
+                {**self._personalization, "to": [{"email": to_email}]}
+                for to_email in to_emails
+            ]
+        }
+
+
 class SendGridEmailProvider(BaseNotificationProvider):
     """SendGrid email provider implementation."""
     
-    def __init__(self, config: Dict[str, Any]):
+    PROVIDER_NAME = "SendGrid Email"
+    SUPPORTED_TYPE = NotificationType.EMAIL
+    
+    def __init__(self, config: Dict[str, Any], session=None):
         """
         Initialize SendGrid email provider.
         
         Args:
             config: SendGrid configuration dictionary
+            session: Optional requests.Session to post mail through, so
+                sends reuse its pooled connections
         """
         super().__init__(config)
         self.sg = None
+        self.session = session
         self.logger = logging.getLogger(__name__)
         self._initialize_client()
+        
+        # Per-send values that only depend on the configuration, built once
+        self._default_sender = Email(self.config["from_email"], self.config["from_name"])
+        self._mail_send_url = self.sg.host + _MAIL_SEND_PATH
+        self._auth_headers = {"Authorization": f"Bearer {self.config['api_key']}"}
     
     def _validate_config(self) -> None:
         """Validate SendGrid configuration."""
@@ -96,27 +166,37 @@ class SendGridEmailProvider(BaseNotificationProvider):
             else:
                 raise EmailDeliveryError(f"Failed to initialize SendGrid client: {e}")
     
-    def send_notification(self, message_data: Dict[str, Any]) -> NotificationResult:
+    def send_notification(self, message_data: Union[EmailMessage, Dict[str, Any]],
+                          template: Optional[MailTemplate] = None) -> NotificationResult:
         """
         Send email notification via SendGrid.
         
         Args:
-            message_data: Email message data
+            message_data: Email message data, or an EmailMessage
+            template: Optional MailTemplate from create_mail_template; when
+                given, only the message's recipient is used and everything
+                else comes from the template
             
         Returns:
             NotificationResult with delivery status
         """
         try:
             # Validate message data
-            email_message = EmailMessage(**message_data)
+            if isinstance(message_data, EmailMessage):
+                email_message = message_data
+            else:
+                email_message = EmailMessage(**message_data)
             email_message.validate()
             
             # Create SendGrid mail object
-            mail = self._create_mail_object(email_message)
+            if template is not None:
+                mail = template.for_recipients([email_message.to_email])
+            else:
+                mail = self._create_mail_object(email_message)
             
             # Send the email
-            self.logger.info(f"Sending email to {email_message.to_email}")
-            response = self.sg.send(mail)
+            self.logger.info("Sending email to %s", email_message.to_email)
+            response = self._send_mail(mail)
             
             # Check response status
             if response.status_code in [200, 201, 202]:
@@ -127,7 +207,7 @@ class SendGridEmailProvider(BaseNotificationProvider):
                     success=True,
                     message_id=message_id,
                     status=NotificationStatus.SENT,
-                    delivery_time=datetime.now(),
+                    delivery_time_ns=time.time_ns(),
                     provider_response={
                         "status_code": response.status_code,
                         "message_id": message_id,
@@ -135,7 +215,7 @@ class SendGridEmailProvider(BaseNotificationProvider):
                     }
                 )
                 
-                self.logger.info(f"Email sent successfully. Message ID: {message_id}")
+                self.logger.info("Email sent successfully. Message ID: %s", message_id)
                 return result
             else:
                 error_message = f"SendGrid API returned status {response.status_code}"
@@ -154,12 +234,13 @@ class SendGridEmailProvider(BaseNotificationProvider):
         
         except SendGridException as e:
             error_message = str(e)
-            self.logger.error(f"SendGrid email delivery failed: {error_message}")
+            self.logger.error("SendGrid email delivery failed: %s", error_message)
             
             # Determine error type
-            if "authentication" in error_message.lower() or "unauthorized" in error_message.lower():
+            error_kind = _ERR_CLASSIFY.search(error_message)
+            if error_kind and error_kind.lastindex == 1:
                 raise AuthenticationError(f"SendGrid authentication failed: {error_message}")
-            elif "rate limit" in error_message.lower():
+            elif error_kind:
                 raise RateLimitError(f"SendGrid rate limit exceeded: {error_message}")
             else:
                 return NotificationResult(
@@ -171,20 +252,166 @@ class SendGridEmailProvider(BaseNotificationProvider):
         
         except Exception as e:
             error_message = str(e)
-            self.logger.error(f"Unexpected error sending email: {error_message}")
+            self.logger.error("Unexpected error sending email: %s", error_message)
             return NotificationResult(
                 success=False,
                 status=NotificationStatus.FAILED,
                 error_message=error_message
             )
     
+    def _send_mail(self, mail: Union[Mail, Dict[str, Any]]):
+        """
+        Post a mail to the SendGrid API.
+        
+        The SDK's own HTTP client opens a new connection per request, so
+        when a session is configured the mail is posted through it instead.
+        
+        Args:
+            mail: Mail to send, or its request body
+            
+        Returns:
+            Response with status_code, headers and body
+        """
+        if self.session is None:
+            return self.sg.send(mail)
+        
+        response = self.session.post(
+            self._mail_send_url,
+            json=mail if isinstance(mail, dict) else mail.get(),
+            headers=self._auth_headers,
+            timeout=self.get_timeout()
+        )
+        return _SessionResponse(response.status_code, response.headers, response.content)
+    
+    def send_batch(self, messages: List[Dict[str, Any]]) -> List[NotificationResult]:
+        """
+        Send many emails, one API request per group of identical emails.
+        
+        Messages that differ only in their recipient are sent as one mail
+        with a personalization per recipient, up to _MAX_PERSONALIZATIONS
+        per request; each recipient still gets their own email. Messages
+        with CC, BCC, reply-to or attachments are sent individually.
+        
+        Args:
+            messages: Email message dictionaries, as for send_notification
+            
+        Returns:
+            List of NotificationResult objects, one per message in order
+        """
+        results: List[Optional[NotificationResult]] = [None] * len(messages)
+        
+        # Validate each message up front and group the plain ones by content;
+        # invalid messages fail individually
+        email_messages = []
+        with bulk_timestamp():
+            for index, message_data in enumerate(messages):
+                try:
+                    email_messages.append((index, EmailMessage(**message_data)))
+                except Exception as e:
+                    results[index] = NotificationResult(
+                        success=False,
+                        status=NotificationStatus.FAILED,
+                        error_message=str(e)
+                    )
+        
+        errors = EmailMessage.validate_batch([email_message for _, email_message in email_messages])
+        groups: Dict[tuple, tuple] = {}
+        for (index, email_message), error in zip(email_messages, errors):
+            if error is not None:
+                results[index] = NotificationResult(
+                    success=False,
+                    status=NotificationStatus.FAILED,
+                    error_message=str(error)
+                )
+                continue
+            
+            if (email_message.cc_emails or email_message.bcc_emails
+                    or email_message.reply_to or email_message.attachments):
+                results[index] = self.send_notification(email_message)
+                continue
+            
+            key = (
+                email_message.from_email, email_message.from_name, email_message.subject,
+                email_message.content, email_message.html_content
+            )
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = (self.create_mail_template(email_message), [])
+            group[1].append((index, email_message.to_email))
+        
+        for template, recipients in groups.values():
+            for start in range(0, len(recipients), _MAX_PERSONALIZATIONS):
+                chunk = recipients[start:start + _MAX_PERSONALIZATIONS]
+                mail = template.for_recipients([to_email for _, to_email in chunk])
+                
+                try:
+                    self.logger.info("Sending email to %s recipients", len(chunk))
+                    response = self._send_mail(mail)
+                except Exception as e:
+                    error_message = str(e)
+                    self.logger.error("SendGrid batch email delivery failed: %s", error_message)
+                    for index, _ in chunk:
+                        results[index] = NotificationResult(
+                            success=False,
+                            status=NotificationStatus.FAILED,
+                            error_message=error_message,
+                            provider_response={"sendgrid_error": error_message}
+                        )
+                    continue
+                
+                if response.status_code in [200, 201, 202]:
+                    # SendGrid returns one message ID for the whole request
+                    message_id = response.headers.get('X-Message-Id', 'unknown')
+                    delivery_time_ns = time.time_ns()
+                    for index, _ in chunk:
+                        results[index] = NotificationResult(
+                            success=True,
+                            message_id=message_id,
+                            status=NotificationStatus.SENT,
+                            delivery_time_ns=delivery_time_ns,
+                            provider_response={
+                                "status_code": response.status_code,
+                                "message_id": message_id
+                            }
+                        )
+                    self.logger.info("Batch email sent successfully. Message ID: %s", message_id)
+                else:
+                    error_message = f"SendGrid API returned status {response.status_code}"
+                    if response.body:
+                        error_message += f": {response.body.decode()}"
+                    for index, _ in chunk:
+                        results[index] = NotificationResult(
+                            success=False,
+                            status=NotificationStatus.FAILED,
+                            error_message=error_message,
+                            provider_response={"status_code": response.status_code}
+                        )
+        
+        return results
+    
+    def create_mail_template(self, email_message: EmailMessage) -> MailTemplate:
+        """
+        Build a reusable template from a message, for sending it to many recipients.
+        
+        Args:
+            email_message: Message whose sender, content, CC/BCC, reply-to
+                and attachments the template keeps
+            
+        Returns:
+            MailTemplate for send_notification(template=...) or batch sends
+        """
+        return MailTemplate(self._create_mail_object(email_message))
+    
     def _create_mail_object(self, email_message: EmailMessage) -> Mail:
         """Create SendGrid Mail object from EmailMessage."""
         # Create from email
-        from_email = Email(
-            email_message.from_email or self.config["from_email"],
-            email_message.from_name or self.config["from_name"]
-        )
+        if email_message.from_email or email_message.from_name:
+            from_email = Email(
+                email_message.from_email or self.config["from_email"],
+                email_message.from_name or self.config["from_name"]
+            )
+        else:
+            from_email = self._default_sender
         
         # Create to email
         to_email = To(email_message.to_email)
@@ -238,14 +465,6 @@ class SendGridEmailProvider(BaseNotificationProvider):
             Disposition(disposition)
         )
     
-    def get_provider_name(self) -> str:
-        """Get the name of the provider."""
-        return "SendGrid Email"
-    
-    def get_supported_type(self) -> NotificationType:
-        """Get the notification type this provider supports."""
-        return NotificationType.EMAIL
-    
     def get_user_profile(self) -> Optional[Dict[str, Any]]:
         """
         Get user profile information.
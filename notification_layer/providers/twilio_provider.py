@@ -2,37 +2,57 @@
 Twilio SMS provider for sending SMS notifications.
 """
 
+import json
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+import re
+import time
+from typing import Dict, Any, List, Optional
 
 try:
     from twilio.rest import Client
     from twilio.base.exceptions import TwilioException
+    from twilio.http.http_client import TwilioHttpClient
 except ImportError:
     Client = None
     TwilioException = Exception
+    TwilioHttpClient = None
 
 from .base_provider import BaseNotificationProvider
-from ..models.message_models import NotificationResult, SMSMessage
+from ..models.message_models import NotificationResult, SMSMessage, bulk_timestamp
 from ..models.notification_types import NotificationType, NotificationStatus
 from ..exceptions import SMSDeliveryError, AuthenticationError, RateLimitError
 
 
+# Error classifier: group 1 matches authentication failures, group 2 rate limiting
+_ERR_CLASSIFY = re.compile(r'(Authentication)|((?i:rate limit))')
+
+# Twilio Notify accepts at most this many bindings per notification
+_NOTIFY_MAX_BINDINGS = 10000
+
+
 class TwilioSMSProvider(BaseNotificationProvider):
     """Twilio SMS provider implementation."""
     
-    def __init__(self, config: Dict[str, Any]):
+    PROVIDER_NAME = "Twilio SMS"
+    SUPPORTED_TYPE = NotificationType.SMS
+    
+    def __init__(self, config: Dict[str, Any], session=None):
         """
         Initialize Twilio SMS provider.
         
         Args:
             config: Twilio configuration dictionary
+            session: Optional requests.Session whose connection pool the
+                Twilio client should use
         """
         super().__init__(config)
         self.client = None
+        self.session = session
         self.logger = logging.getLogger(__name__)
         self._initialize_client()
+        
+        # Sender number, read once instead of from the config on every send
+        self._from_phone = self.config["phone_number"]
     
     def _validate_config(self) -> None:
         """Validate Twilio configuration."""
@@ -49,9 +69,15 @@ class TwilioSMSProvider(BaseNotificationProvider):
             )
         
         try:
+            http_client = None
+            if self.session is not None and TwilioHttpClient is not None:
+                http_client = TwilioHttpClient(timeout=self.get_timeout())
+                http_client.session = self.session
+            
             self.client = Client(
                 self.config["account_sid"],
-                self.config["auth_token"]
+                self.config["auth_token"],
+                http_client=http_client
             )
             # Test the client with a simple API call
             self.client.api.accounts(self.config["account_sid"]).fetch()
@@ -80,7 +106,7 @@ class TwilioSMSProvider(BaseNotificationProvider):
             # Prepare Twilio message parameters
             message_params = {
                 "body": sms_message.message,
-                "from_": self.config["phone_number"],
+                "from_": self._from_phone,
                 "to": sms_message.to_phone
             }
             
@@ -89,7 +115,7 @@ class TwilioSMSProvider(BaseNotificationProvider):
                 message_params["media_url"] = sms_message.media_urls
             
             # Send the message
-            self.logger.info(f"Sending SMS to {sms_message.to_phone}")
+            self.logger.info("Sending SMS to %s", sms_message.to_phone)
             message = self.client.messages.create(**message_params)
             
             # Create success result
@@ -97,7 +123,7 @@ class TwilioSMSProvider(BaseNotificationProvider):
                 success=True,
                 message_id=message.sid,
                 status=NotificationStatus.SENT,
-                delivery_time=datetime.now(),
+                delivery_time_ns=time.time_ns(),
                 provider_response={
                     "twilio_sid": message.sid,
                     "status": message.status,
@@ -106,17 +132,18 @@ class TwilioSMSProvider(BaseNotificationProvider):
                 }
             )
             
-            self.logger.info(f"SMS sent successfully. SID: {message.sid}")
+            self.logger.info("SMS sent successfully. SID: %s", message.sid)
             return result
             
         except TwilioException as e:
             error_message = str(e)
-            self.logger.error(f"Twilio SMS delivery failed: {error_message}")
+            self.logger.error("Twilio SMS delivery failed: %s", error_message)
             
             # Determine error type and status
-            if "Authentication" in error_message:
+            error_kind = _ERR_CLASSIFY.search(error_message)
+            if error_kind and error_kind.lastindex == 1:
                 raise AuthenticationError(f"Twilio authentication failed: {error_message}")
-            elif "rate limit" in error_message.lower():
+            elif error_kind:
                 raise RateLimitError(f"Twilio rate limit exceeded: {error_message}")
             else:
                 return NotificationResult(
@@ -128,13 +155,85 @@ class TwilioSMSProvider(BaseNotificationProvider):
         
         except Exception as e:
             error_message = str(e)
-            self.logger.error(f"Unexpected error sending SMS: {error_message}")
+            self.logger.error("Unexpected error sending SMS: %s", error_message)
             return NotificationResult(
                 success=False,
                 status=NotificationStatus.FAILED,
                 error_message=error_message
             )
     
+    def supports_broadcast(self) -> bool:
+        """Check if a Twilio Notify service is configured for broadcast SMS."""
+        return bool(self.config.get("notify_service_sid"))
+    
+    def send_broadcast(self, to_phones: List[str], message: str) -> List[NotificationResult]:
+        """
+        Send the same SMS to many recipients through Twilio Notify.
+        
+        Twilio fans the message out server-side, so this makes one API call
+        per _NOTIFY_MAX_BINDINGS recipients instead of one per recipient.
+        
+        Args:
+            to_phones: Recipient phone numbers
+            message: SMS message text
+            
+        Returns:
+            List of NotificationResult objects, one per phone number in order
+        """
+        results: List[Optional[NotificationResult]] = [None] * len(to_phones)
+        
+        # Validate each recipient up front; invalid numbers fail individually
+        recipients = []
+        with bulk_timestamp():
+            for index, phone in enumerate(to_phones):
+                try:
+                    SMSMessage(to_phone=phone, message=message).validate()
+                except Exception as e:
+                    results[index] = NotificationResult(
+                        success=False,
+                        status=NotificationStatus.FAILED,
+                        error_message=str(e)
+                    )
+                else:
+                    recipients.append((index, phone))
+        
+        service = self.client.notify.v1.services(self.config["notify_service_sid"])
+        
+        for start in range(0, len(recipients), _NOTIFY_MAX_BINDINGS):
+            chunk = recipients[start:start + _NOTIFY_MAX_BINDINGS]
+            bindings = [
+                json.dumps({"binding_type": "sms", "address": phone})
+                for _, phone in chunk
+            ]
+            
+            try:
+                self.logger.info("Broadcasting SMS to %s recipients", len(bindings))
+                notification = service.notifications.create(to_binding=bindings, body=message)
+            except TwilioException as e:
+                error_message = str(e)
+                self.logger.error("Twilio SMS broadcast failed: %s", error_message)
+                for index, _ in chunk:
+                    results[index] = NotificationResult(
+                        success=False,
+                        status=NotificationStatus.FAILED,
+                        error_message=error_message,
+                        provider_response={"twilio_error": error_message}
+                    )
+                continue
+            
+            delivery_time_ns = time.time_ns()
+            for index, _ in chunk:
+                results[index] = NotificationResult(
+                    success=True,
+                    message_id=notification.sid,
+                    status=NotificationStatus.SENT,
+                    delivery_time_ns=delivery_time_ns,
+                    provider_response={"twilio_notify_sid": notification.sid}
+                )
+            self.logger.info("SMS broadcast sent successfully. SID: %s", notification.sid)
+        
+        return results
+    
     def get_message_status(self, message_id: str) -> NotificationStatus:
         """
         Get the status of a sent message.
@@ -164,14 +263,6 @@ class TwilioSMSProvider(BaseNotificationProvider):
             self.logger.error(f"Failed to get message status: {e}")
             return NotificationStatus.FAILED
     
-    def get_provider_name(self) -> str:
-        """Get the name of the provider."""
-        return "Twilio SMS"
-    
-    def get_supported_type(self) -> NotificationType:
-        """Get the notification type this provider supports."""
-        return NotificationType.SMS
-    
     def get_balance(self) -> Optional[float]:
         """
         Get account balance.
@@ -5,6 +5,8 @@ Utility functions for the Notification Layer.
 from .user_input import (
     collect_phone_numbers,
     collect_email_addresses,
+    collect_phone_numbers_batch,
+    collect_email_addresses_batch,
     collect_user_contacts,
     display_user_summary,
     validate_phone_number,
@@ -15,6 +17,8 @@ from .user_input import (
 __all__ = [
     "collect_phone_numbers",
     "collect_email_addresses",
+    "collect_phone_numbers_batch",
+    "collect_email_addresses_batch",
     "collect_user_contacts",
     "display_user_summary",
     "validate_phone_number",
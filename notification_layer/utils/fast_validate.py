@@ -0,0 +1,93 @@
+"""
+Compiled scanners for bulk phone number and email validation.
+
+The E.164 and email shapes used by the message models are plain character
+classes with length bounds, so they can be checked with a single forward
+scan over the ASCII bytes. With numba installed the scanners are compiled
+to machine code; without it, callers should use the regular expressions.
+"""
+
+# Optional JIT compiler for the scanners
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _is_digit(byte: int) -> bool:
+    return 48 <= byte <= 57  # 0-9
+
+
+def _is_letter(byte: int) -> bool:
+    return 65 <= byte <= 90 or 97 <= byte <= 122  # A-Z, a-z
+
+
+def is_e164(buf: bytes) -> bool:
+    """
+    Check the phone shape ``\\+?[1-9]\\d{1,14}``.
+
+    Args:
+        buf: ASCII-encoded phone number, separators already removed
+
+    Returns:
+        True if the whole buffer matches
+    """
+    start = 1 if len(buf) > 0 and buf[0] == 43 else 0  # optional '+'
+    digits = len(buf) - start
+    if digits < 2 or digits > 15:
+        return False
+    if not 49 <= buf[start] <= 57:  # 1-9
+        return False
+    for i in range(start + 1, len(buf)):
+        if not _is_digit(buf[i]):
+            return False
+    return True
+
+
+def is_email(buf: bytes) -> bool:
+    """
+    Check the email shape ``[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}``.
+
+    Args:
+        buf: ASCII-encoded email address
+
+    Returns:
+        True if the whole buffer matches
+    """
+    n = len(buf)
+    at = -1
+    for i in range(n):
+        byte = buf[i]
+        if byte == 64:  # '@'
+            if at >= 0:
+                return False
+            at = i
+        elif not (_is_digit(byte) or _is_letter(byte) or byte == 46 or byte == 45):  # '.', '-'
+            # '_', '%' and '+' are only allowed before the '@'
+            if at >= 0 or not (byte == 95 or byte == 37 or byte == 43):
+                return False
+    if at < 1:
+        return False
+
+    # The domain ends with a '.' and at least two letters, with at least
+    # one character before that '.'
+    dot = -1
+    for i in range(n - 1, at, -1):
+        if buf[i] == 46:
+            dot = i
+            break
+    if dot <= at + 1 or n - dot - 1 < 2:
+        return False
+    for i in range(dot + 1, n):
+        if not _is_letter(buf[i]):
+            return False
+    return True
+
+
+if NUMBA_AVAILABLE:
+    _is_digit = njit(cache=True)(_is_digit)
+    _is_letter = njit(cache=True)(_is_letter)
+    is_e164 = njit(cache=True)(is_e164)
+    is_email = njit(cache=True)(is_email)
@@ -3,7 +3,29 @@ Utility functions for interactive user input collection.
 """
 
 import re
-from typing import List, Dict, Optional
+import sys
+from typing import List, Dict, Optional, Iterator, TextIO, Tuple
+
+# Optional linear-time regex engine for the validation patterns
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+_regex = re2 or re
+
+# Validation patterns, compiled once at import
+_E164_RE = _regex.compile(r'^\+?[1-9]\d{1,14}$')
+_US_PHONE_RE = _regex.compile(r'^(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})$')
+_EMAIL_RE = _regex.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Separators dropped from phone numbers before matching
+_PHONE_STRIP = str.maketrans('', '', ' -()')
+
+# Lengths the US pattern can match: 10 bare digits up to '+1 (123) 456-7890',
+# plus the trailing newline that '$' accepts in re
+_US_PHONE_MIN_LEN = 10
+_US_PHONE_MAX_LEN = 18
 
 
 def validate_phone_number(phone: str) -> bool:
@@ -17,17 +39,14 @@ def validate_phone_number(phone: str) -> bool:
         True if valid, False otherwise
     """
     # Remove spaces and dashes
-    cleaned = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+    cleaned = phone.translate(_PHONE_STRIP)
     
     # Check E.164 format: + followed by 1-15 digits
-    e164_pattern = r'^\+?[1-9]\d{1,14}$'
-    
-    if re.match(e164_pattern, cleaned):
+    if _E164_RE.match(cleaned):
         return True
     
     # Also accept US format: (123) 456-7890 or 123-456-7890
-    us_pattern = r'^(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})$'
-    if re.match(us_pattern, phone):
+    if _US_PHONE_MIN_LEN <= len(phone) <= _US_PHONE_MAX_LEN and _US_PHONE_RE.match(phone):
         return True
     
     return False
@@ -44,7 +63,7 @@ def normalize_phone_number(phone: str) -> str:
         Normalized phone number
     """
     # Remove spaces, dashes, parentheses
-    cleaned = phone.replace(' ', '').replace('-', '').replace('(', '').replace(')', '')
+    cleaned = phone.translate(_PHONE_STRIP)
     
     # If starts with 1 but no +, add +
     if cleaned.startswith('1') and not cleaned.startswith('+'):
@@ -71,17 +90,111 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(email_pattern, email))
+    # Reject the structurally wrong addresses before running the pattern:
+    # exactly one '@', a non-empty local part, and a domain ending in a
+    # dot followed by at least two characters
+    if email.count('@') != 1:
+        return False
+    local, _, domain = email.partition('@')
+    if not local:
+        return False
+    dot = domain.rfind('.')
+    if dot < 0 or len(domain) - dot - 1 < 2:
+        return False
+    
+    return bool(_EMAIL_RE.match(email))
+
+
+def _read_contact_pairs(stream: TextIO) -> Iterator[Tuple[str, str]]:
+    """
+    Read (name, contact) line pairs from a non-interactive stream.
+    
+    Stops at the first empty contact line or at end of input, leaving any
+    remaining lines in the stream for later reads.
+    
+    Args:
+        stream: Text stream to read from
+        
+    Yields:
+        Stripped (name, contact) pairs
+    """
+    while True:
+        name = stream.readline().strip()
+        contact = stream.readline().strip()
+        if not contact:
+            return
+        yield name, contact
+
+
+def collect_phone_numbers_batch(stream: TextIO = None) -> List[Dict[str, str]]:
+    """
+    Collect phone numbers from piped or scripted input without prompting.
+    
+    The input holds a name line (may be blank) followed by a phone number
+    line for each user, ending with an empty phone number line or end of
+    input. Invalid phone numbers are skipped.
+    
+    Args:
+        stream: Text stream to read from. If None, standard input.
+        
+    Returns:
+        List of user dictionaries with phone numbers
+    """
+    users = []
+    for name, phone in _read_contact_pairs(stream or sys.stdin):
+        if not validate_phone_number(phone):
+            print(f"❌ Skipping invalid phone number: {phone}")
+            continue
+        users.append({
+            "phone": normalize_phone_number(phone),
+            "name": name or f"User {len(users) + 1}"
+        })
+    
+    print(f"✓ Collected {len(users)} phone number(s)")
+    return users
+
+
+def collect_email_addresses_batch(stream: TextIO = None) -> List[Dict[str, str]]:
+    """
+    Collect email addresses from piped or scripted input without prompting.
+    
+    The input holds a name line (may be blank) followed by an email address
+    line for each user, ending with an empty email line or end of input.
+    Invalid email addresses are skipped.
+    
+    Args:
+        stream: Text stream to read from. If None, standard input.
+        
+    Returns:
+        List of user dictionaries with email addresses
+    """
+    users = []
+    for name, email in _read_contact_pairs(stream or sys.stdin):
+        if not validate_email(email):
+            print(f"❌ Skipping invalid email: {email}")
+            continue
+        users.append({
+            "email": email.lower(),
+            "name": name or f"User {len(users) + 1}"
+        })
+    
+    print(f"✓ Collected {len(users)} email address(es)")
+    return users
 
 
 def collect_phone_numbers() -> List[Dict[str, str]]:
     """
     Interactively collect phone numbers from user.
     
+    When standard input is not a terminal, reads it with
+    collect_phone_numbers_batch() instead of prompting.
+    
     Returns:
         List of user dictionaries with phone numbers
     """
+    if not sys.stdin.isatty():
+        return collect_phone_numbers_batch()
+    
     users = []
     print("\n📱 PHONE NUMBER INPUT")
     print("=" * 50)
@@ -126,9 +239,15 @@ def collect_email_addresses() -> List[Dict[str, str]]:
     """
     Interactively collect email addresses from user.
     
+    When standard input is not a terminal, reads it with
+    collect_email_addresses_batch() instead of prompting.
+    
     Returns:
         List of user dictionaries with email addresses
     """
+    if not sys.stdin.isatty():
+        return collect_email_addresses_batch()
+    
     users = []
     print("\n📧 EMAIL ADDRESS INPUT")
     print("=" * 50)
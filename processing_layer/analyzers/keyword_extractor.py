@@ -11,6 +11,14 @@ from ..models.base import BaseAnalyzer
 from ..models.context_types import KeywordPatterns, KeywordCategory
 from ..exceptions import KeywordExtractionError
 
+# Optional linear-time regex engine for the patterns that behave the same in it
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+_regex = re2 or re
+
 
 class KeywordExtractor(BaseAnalyzer):
     """Extractor for keyword patterns from competitor data."""
@@ -98,7 +106,7 @@ class KeywordExtractor(BaseAnalyzer):
         self.word_pattern = re.compile(r'\b[a-zA-Z0-9&.-]+\b')
         
         # Pattern for hashtags
-        self.hashtag_pattern = re.compile(r'#([a-zA-Z0-9_]+)')
+        self.hashtag_pattern = _regex.compile(r'#([a-zA-Z0-9_]+)')
         
         # Pattern for business suffixes
         self.business_suffix_pattern = re.compile(r'\b(corp|inc|llc|ltd|co|company|group|systems|solutions|services|technologies|enterprise|holdings|ventures|partners|associates)\b', re.IGNORECASE)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Send writer script that stores buffered send tracking records.
+Run this alongside the RQ workers when SEND_WRITES_STREAM is enabled, so the
+send records that notification jobs publish to Redis are written to the
+database in batches.
+
+Usage:
+    python run_send_writer.py
+
+Make sure Redis and the database are available before starting the writer.
+"""
+
+import os
+import sys
+import socket
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent))
+
+# Try to load .env file if python-dotenv is available
+try:
+    from dotenv import load_dotenv
+    env_path = Path(__file__).parent / '.env'
+    if env_path.exists():
+        load_dotenv(env_path)
+        print(f"Loaded environment variables from: {env_path}")
+except ImportError:
+    pass
+
+from jobs.queue_manager import init_queue
+from jobs.send_writer import run_send_writer, SEND_STREAM
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("AdsCompetitor Send Writer")
+    print("=" * 60)
+    
+    if not init_queue():
+        print("\nERROR: Redis connection failed. Please ensure Redis is running.")
+        sys.exit(1)
+    
+    consumer_name = f"{socket.gethostname()}-{os.getpid()}"
+    print(f"\nWriting sends from stream: {SEND_STREAM}")
+    print("Press Ctrl+C to stop the writer")
+    print("=" * 60)
+    
+    try:
+        run_send_writer(consumer_name)
+    except KeyboardInterrupt:
+        print("\nSend writer stopped")
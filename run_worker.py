@@ -11,6 +11,7 @@ Make sure Redis is running before starting the worker.
 
 import os
 import sys
+import logging
 from pathlib import Path
 
 # Add parent directory to path
@@ -29,7 +30,20 @@ except ImportError:
 from rq import Worker
 from jobs.queue_manager import redis_conn, init_queue
 
+def configure_logging() -> None:
+    """Configure job logging from LOG_LEVEL, falling back to INFO for unknown levels."""
+    level_name = os.getenv('LOG_LEVEL', 'INFO').upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        print(f"Unknown LOG_LEVEL '{level_name}', using INFO")
+        level = logging.INFO
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    logging.getLogger('jobs').setLevel(level)
+
+
 if __name__ == '__main__':
+    configure_logging()
+    
     print("=" * 60)
     print("AdsCompetitor Background Job Worker")
     print("=" * 60)
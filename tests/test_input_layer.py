@@ -0,0 +1,43 @@
+"""
+Tests for InputLayer batch processing.
+"""
+
+from input_layer import InputLayer, InputData, InputType, ProcessingStatus
+
+
+def test_process_mixed_batch_reports_non_string_items_as_failed():
+    items = [
+        InputData(data=10001, input_type=InputType.ZIP_CODE),
+        InputData(data=None, input_type=InputType.COMPETITOR_NAME),
+        InputData(data="94102", input_type=InputType.ZIP_CODE),
+    ]
+    
+    results = InputLayer().process_mixed_batch(items)
+    
+    assert [result.status for result in results] == [
+        ProcessingStatus.FAILED,
+        ProcessingStatus.FAILED,
+        ProcessingStatus.COMPLETED,
+    ]
+    for result in results[:2]:
+        result_dict = result.to_dict()
+        assert result_dict["status"] == "failed"
+        assert "error" in result_dict["metadata"]
+        assert "processing_timestamp" in result_dict["metadata"]
+
+
+def test_batch_process_failures_share_the_batch_timestamp():
+    handler = InputLayer().handlers[InputType.ZIP_CODE]
+    items = [
+        InputData(data="94102", input_type=InputType.ZIP_CODE),
+        InputData(data=10001, input_type=InputType.ZIP_CODE),
+        InputData(data=None, input_type=InputType.ZIP_CODE),
+    ]
+    
+    completed, *failed = handler.batch_process(items)
+    
+    assert completed.status == ProcessingStatus.COMPLETED
+    for result in failed:
+        assert result.status == ProcessingStatus.FAILED
+        assert result.processing_timestamp == completed.processing_timestamp
+        assert result.metadata["processing_timestamp"] == completed.processing_timestamp